@@ -9,6 +9,9 @@ Merkezi config ve Service Account ile güvenli bakiye analizi
 - Tüm hassas bilgiler PRGsheet'te saklanır
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, dataframe_to_sheet_values, get_connection_pool
+
 import pyodbc
 import logging
 from pathlib import Path
@@ -16,9 +19,6 @@ import sys
 import pandas as pd
 from contextlib import contextmanager
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -54,8 +54,8 @@ class BakiyeConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -113,14 +113,14 @@ class DatabaseManager:
         """Context manager ile güvenli bağlantı yönetimi"""
         connection = None
         try:
-            connection = pyodbc.connect(self.connection_string)
+            connection = get_connection_pool(self.connection_string).acquire()
             yield connection
         except pyodbc.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
         finally:
             if connection:
-                connection.close()
+                get_connection_pool(self.connection_string).release(connection)
 
     def execute_query(self, query: str) -> pd.DataFrame:
         """SQL sorgusu çalıştırma"""
@@ -150,20 +150,6 @@ class GoogleSheetsManager:
         self.config_manager = config_manager
         self.gc = config_manager.gc  # Service Account ile yetkilendirilmiş client
 
-    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """DataFrame'i Google Sheets için temizle"""
-        df_copy = df.copy()
-
-        for col in df_copy.columns:
-            if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
-                df_copy[col] = df_copy[col].astype(str)
-            elif df_copy[col].dtype == 'object':
-                df_copy[col] = df_copy[col].apply(
-                    lambda x: str(x) if hasattr(x, 'strftime') else x
-                )
-
-        return df_copy.fillna('').replace([pd.NA, float('inf'), float('-inf')], '')
-
     def save_to_worksheet(self, df: pd.DataFrame, worksheet_name: str) -> None:
         """Bakiye sayfasına veri yaz"""
         try:
@@ -175,7 +161,6 @@ class GoogleSheetsManager:
             # Worksheet'i bul veya oluştur
             try:
                 worksheet = spreadsheet.worksheet(worksheet_name)
-                worksheet.clear()
             except:
                 worksheet = spreadsheet.add_worksheet(
                     title=worksheet_name,
@@ -184,12 +169,14 @@ class GoogleSheetsManager:
                 )
 
             if not df.empty:
-                # Clean data
-                df_clean = self._clean_dataframe(df)
-                values = [df_clean.columns.values.tolist()] + df_clean.values.tolist()
+                # Ortak serializer: tarihler metne, NaN/inf boş hücreye
+                values = dataframe_to_sheet_values(df)
 
                 # RAW: binlik ayraç eklenmez, veri olduğu gibi yazılır
-                worksheet.update(values, value_input_option='RAW')
+                self.config_manager.write_worksheet_values(worksheet, values, value_input_option='RAW')
+            else:
+                # Veri yoksa eski içerik kalmasın
+                self.config_manager.clear_worksheet(worksheet)
 
         except Exception as e:
             logger.error(f"Bakiye worksheet güncelleme hatası: {e}")
@@ -33,6 +33,9 @@ Kullanım:
     sorgu.save_to_sheets(orders)
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager
+
 import requests
 from datetime import datetime, timedelta
 import os
@@ -40,7 +43,6 @@ import sys
 import pandas as pd
 import logging
 from pathlib import Path
-from central_config import CentralConfigManager
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -81,57 +83,29 @@ class DogtasSiparisSorgu:
         3. Ayar sayfasından API konfigürasyon yükleme
         4. Mevcut Bekleyen sayfası verilerini ilk_df olarak yükleme
         """
-        self.config_manager = CentralConfigManager()  # Service Account manager
+        self.config_manager = CentralConfigManager.shared()  # Paylaşılan Service Account manager
         self.token = None  # API access token
         self._load_config()  # API konfigürasyonları
         self.ilk_df = self._load_existing_data()  # Mevcut Bekleyen sayfası verileri
     
     def _load_config(self):
         """
-        Google Sheets Ayar sayfasından API konfigürasyonlarını yükler - Service Account ile
+        Ayar registry'sinden API konfigürasyonlarını yükler - Service Account ile
         Güvenlik: Hardcoded credential'ları önler
+        Ayar sayfası tekrar indirilmez; değerler settings cache'inden bir kez parse edilir
         """
         try:
-            # Service Account ile PRGsheet açma
-            sheet = self.config_manager.gc.open("PRGsheet").worksheet('Ayar')
-            all_values = sheet.get_all_values()
-
-            # Sütun adlarını kullanarak esnek okuma - sütun sırası değişse bile çalışır
-            if not all_values:
-                raise ValueError("Ayar sayfası boş")
-
-            headers = all_values[0]
-
-            # Gerekli sütunların indekslerini bul
-            try:
-                key_index = headers.index('Key')
-                value_index = headers.index('Value')
-            except ValueError:
-                logger.error("Ayar sayfasında 'Key' veya 'Value' sütunu bulunamadı")
-                raise
-
-            # Config dictionary oluştur - sütun adlarıyla
-            config = {}
-            for row in all_values[1:]:  # Header'dan sonraki satırlar
-                if len(row) > max(key_index, value_index):
-                    key = row[key_index].strip() if row[key_index] else ''
-                    value = row[value_index].strip() if row[value_index] else ''
-                    if key:  # Boş key'leri atla
-                        config[key] = value
+            registry = self.config_manager.registry
 
             # API endpoint konfigürasyonları
-            self.base_url = config.get('base_url', '')
-            self.endpoint = config.get('bekleyenler', '')
-            self.customer_no = config.get('CustomerNo', '')
+            self.base_url = registry.get('base_url')
+            self.endpoint = registry.get('bekleyenler')
+            self.customer_no = registry.get('CustomerNo')
 
             # API authentication verilerini güvenli şekilde yükle
-            self.auth_data = {
-                "userName": config.get('userName', ''),
-                "password": config.get('password', ''),
-                "clientId": config.get('clientId', ''),
-                "clientSecret": config.get('clientSecret', ''),
-                "applicationCode": config.get('applicationCode', '')
-            }
+            self.auth_data = registry.get_many(
+                'userName', 'password', 'clientId', 'clientSecret', 'applicationCode'
+            )
 
         except Exception as e:
             logger.error(f"Config yükleme hatası: {e}")
@@ -167,7 +141,7 @@ class DogtasSiparisSorgu:
     
     def _get_dynamic_start_date(self):
         """
-        Ayar sayfasından başlangıç tarihini oku - Service Account ile
+        Ayar registry'sinden başlangıç tarihini oku
 
         Sistem Mantığı:
         - Ayar sayfasındaki RegistrationDateStart değerini kullan
@@ -177,36 +151,10 @@ class DogtasSiparisSorgu:
             datetime: Başlangıç tarihi
         """
         try:
-            # Service Account ile Ayar sayfasını aç
-            sheet = self.config_manager.gc.open("PRGsheet").worksheet('Ayar')
-            all_values = sheet.get_all_values()
-
-            # Sütun adlarını kullanarak esnek okuma
-            if not all_values:
-                raise ValueError("Ayar sayfası boş")
-
-            headers = all_values[0]
-
-            # Gerekli sütunların indekslerini bul
-            try:
-                key_index = headers.index('Key')
-                value_index = headers.index('Value')
-            except ValueError:
-                logger.error("Ayar sayfasında 'Key' veya 'Value' sütunu bulunamadı")
-                return datetime.now() - timedelta(days=180)
-
-            # Config dictionary oluştur
-            config = {}
-            for row in all_values[1:]:
-                if len(row) > max(key_index, value_index):
-                    key = row[key_index].strip() if row[key_index] else ''
-                    value = row[value_index].strip() if row[value_index] else ''
-                    if key:
-                        config[key] = value
-
             # Kayıtlı RegistrationDateStart değerini kullan
-            if 'RegistrationDateStart' in config and config['RegistrationDateStart']:
-                return datetime.strptime(config['RegistrationDateStart'], "%d.%m.%Y")
+            start_date = self.config_manager.registry.get('RegistrationDateStart')
+            if start_date:
+                return start_date
             else:
                 # Varsayılan olarak 180 gün geriye
                 return datetime.now() - timedelta(days=180)
@@ -243,12 +191,9 @@ class DogtasSiparisSorgu:
             pandas.DataFrame: Mevcut veriler
         """
         try:
-            # Service Account ile PRGsheet aç
-            sheet = self.config_manager.gc.open("PRGsheet")
-
-            # Bekleyen sayfasını oku
+            # Bekleyen sayfasını oku (handle cache üzerinden)
             try:
-                worksheet = sheet.worksheet('Bekleyen')
+                worksheet = self.config_manager.get_worksheet('Bekleyen')
                 all_values = worksheet.get_all_values()
 
                 if len(all_values) > 1:  # Header + veri varsa
@@ -542,7 +487,7 @@ class DogtasSiparisSorgu:
         """
         try:
             # Service Account ile Ayar sayfasını aç
-            sheet = self.config_manager.gc.open("PRGsheet").worksheet('Ayar')
+            sheet = self.config_manager.get_worksheet('Ayar')
             all_values = sheet.get_all_values()
 
             # Mevcut RegistrationDateStart satırını ara (Key sütununda)
@@ -551,10 +496,13 @@ class DogtasSiparisSorgu:
                     # Güvenli güncelleme - Value sütunu (C)
                     cell_range = f'C{i+1}'
                     sheet.update(values=[[date_str]], range_name=cell_range)
-                    return
+                    break
+            else:
+                # Yoksa yeni kayıt oluştur - Format: App Name | Key | Value | Description
+                sheet.append_row(['Global', 'RegistrationDateStart', date_str, 'Baslangic tarihi'])
 
-            # Yoksa yeni kayıt oluştur - Format: App Name | Key | Value | Description
-            sheet.append_row(['Global', 'RegistrationDateStart', date_str, 'Baslangic tarihi'])
+            # Ayar değişti: sonraki çalışma güncel değeri okusun
+            self.config_manager.refresh_config()
 
         except Exception as e:
             logger.error(f"Başlangıç tarihi güncelleme hatası: {e}")
@@ -569,7 +517,7 @@ class DogtasSiparisSorgu:
         3. Dinamik boyut optimizasyonu (satır/sütun resize)
         4. Intelligent upload stratejisi:
            - <1000 kayıt: Tek seferde upload
-           - >1000 kayıt: Batch upload sistemi
+           - >1000 kayıt: Parçalı, paralel upload sistemi
         5. Memory efficient işlem
         6. Error handling ile robust kaydetme
 
@@ -588,15 +536,13 @@ class DogtasSiparisSorgu:
             # DataFrame oluştur
             df = pd.DataFrame(processed_orders)
 
-            # Service Account ile PRGsheet aç
-            sheet = self.config_manager.gc.open("PRGsheet")
-
-            # Worksheet hazırlama
+            # Worksheet hazırlama (handle cache üzerinden)
             try:
-                worksheet = sheet.worksheet('Bekleyen')
+                worksheet = self.config_manager.get_worksheet('Bekleyen')
                 worksheet.clear()  # Temiz başlangıç
             except Exception:
                 # Worksheet yoksa oluştur
+                sheet = self.config_manager.open_by_key(self.config_manager.MASTER_SPREADSHEET_ID)
                 worksheet = sheet.add_worksheet(
                     'Bekleyen',
                     rows=len(df)+100,
@@ -615,7 +561,7 @@ class DogtasSiparisSorgu:
             values = [df.columns.tolist()] + df.values.tolist()
 
             if len(values) > 1000:
-                # Büyük veri için batch upload
+                # Büyük veri için parçalı, paralel upload
                 self._batch_upload(worksheet, df)
             else:
                 # Küçük veri için tek seferde upload
@@ -626,59 +572,24 @@ class DogtasSiparisSorgu:
     
     def _batch_upload(self, worksheet, df):
         """
-        Büyük veriler için optimize edilmiş batch upload sistemi
-        
+        Büyük veriler için parçalı, paralel upload (CentralConfigManager.upload_values)
+
         Performans Özellikleri:
-        - 1000'lik parçalara bölme
-        - Dinamik Excel sütun hesaplama (A, B, ..., AA, AB)
-        - Memory efficient işlem
-        
+        - Parçalar satır sayısına değil hücre sayısı ve payload boyutuna göre
+        - Çakışmayan aralıklar sınırlı thread havuzundan, ortak kota ile
+        - Checkpoint: yarım kalan upload aynı veriyle kalan parçalardan devam eder
+
         Args:
             worksheet: Google Sheets worksheet object
             df: pandas DataFrame
         """
         try:
-            # Header upload
-            worksheet.update(values=[df.columns.tolist()], range_name='A1')
-            
-            # Batch configuration
-            batch_size = 1000
-            data_values = df.values.tolist()
-            
-            # Batch processing
-            for i in range(0, len(data_values), batch_size):
-                batch = data_values[i:i + batch_size]
-                start_row = i + 2  # Header skip
-                end_row = start_row + len(batch) - 1
-                
-                # Excel column calculation
-                end_col = self._get_column_letter(len(df.columns))
-                range_name = f'A{start_row}:{end_col}{end_row}'
-                
-                # Upload batch
-                worksheet.update(values=batch, range_name=range_name)
+            values = [df.columns.tolist()] + df.values.tolist()
+            self.config_manager.upload_values(worksheet, values)
 
         except Exception as e:
             logger.error(f"Batch upload hatası: {e}")
-    
-    def _get_column_letter(self, col_num):
-        """
-        Excel sütun numarasını harfe çeviren utility fonksiyon
-        
-        Örnek: 1->A, 26->Z, 27->AA, 28->AB
-        
-        Args:
-            col_num (int): Sütun numarası
-            
-        Returns:
-            str: Excel sütun harfi
-        """
-        result = ""
-        while col_num > 0:
-            col_num -= 1
-            result = chr(col_num % 26 + ord('A')) + result
-            col_num //= 26
-        return result
+
 
 if __name__ == "__main__":
     """
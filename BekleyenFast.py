@@ -26,6 +26,9 @@ Performans Avantajları:
 - Otomatik duplicate kontrolü
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, dataframe_to_sheet_values
+
 import requests
 from datetime import datetime, timedelta
 import os
@@ -33,7 +36,6 @@ import sys
 import pandas as pd
 import logging
 from pathlib import Path
-from central_config import CentralConfigManager
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -73,56 +75,29 @@ class DogtasFastSiparisSorgu:
         """
         Sınıf başlatıcı - Service Account kullanarak Google Sheets bağlantısı ve konfigürasyon yükleme
         """
-        self.config_manager = CentralConfigManager()  # Service Account manager
+        self.config_manager = CentralConfigManager.shared()  # Paylaşılan Service Account manager
         self.token = None  # API access token
         self._load_config()  # API konfigürasyonları
     
     def _load_config(self):
         """
-        Google Sheets Ayar sayfasından API konfigürasyonlarını yükler - Service Account ile
+        Ayar registry'sinden API konfigürasyonlarını yükler - Service Account ile
         Güvenlik: Hardcoded credential'ları önler
+        Ayar sayfası tekrar indirilmez; değerler settings cache'inden bir kez parse edilir
         """
         try:
-            # Service Account ile PRGsheet açma
-            sheet = self.config_manager.gc.open("PRGsheet").worksheet('Ayar')
-            all_values = sheet.get_all_values()
-
-            # Sütun adlarını kullanarak esnek okuma - sütun sırası değişse bile çalışır
-            if not all_values:
-                raise ValueError("Ayar sayfası boş")
-
-            headers = all_values[0]
-
-            # Gerekli sütunların indekslerini bul
-            try:
-                key_index = headers.index('Key')
-                value_index = headers.index('Value')
-            except ValueError:
-                logger.error("Ayar sayfasında 'Key' veya 'Value' sütunu bulunamadı")
-                raise
-
-            # Config dictionary oluştur - sütun adlarıyla
-            config = {}
-            for row in all_values[1:]:  # Header'dan sonraki satırlar
-                if len(row) > max(key_index, value_index):
-                    key = row[key_index].strip() if row[key_index] else ''
-                    value = row[value_index].strip() if row[value_index] else ''
-                    if key:  # Boş key'leri atla
-                        config[key] = value
+            registry = self.config_manager.registry
 
             # API endpoint konfigürasyonları
-            self.base_url = config.get('base_url', '')
-            self.endpoint = config.get('bekleyenler', '')
-            self.customer_no = config.get('CustomerNo', '')
+            self.base_url = registry.get('base_url')
+            self.endpoint = registry.get('bekleyenler')
+            self.customer_no = registry.get('CustomerNo')
 
             # API authentication verilerini güvenli şekilde yükle
-            self.auth_data = {
-                "userName": config.get('userName', ''),
-                "password": config.get('password', ''),
-                "clientId": config.get('clientId', ''),
-                "clientSecret": config.get('clientSecret', ''),
-                "applicationCode": config.get('applicationCode', '')
-            }
+            self.auth_data = registry.get_many(
+                'userName', 'password', 'clientId', 'clientSecret', 'applicationCode'
+            )
+
         except Exception as e:
             logger.error(f"Config yükleme hatası: {e}")
             # Varsayılan boş değerler - hata durumunda sistem çalışmaya devam eder
@@ -376,41 +351,34 @@ class DogtasFastSiparisSorgu:
     
     def _get_existing_data(self):
         """
-        Google Sheets'teki mevcut Bekleyen sayfasından tüm veriyi çeker - Service Account ile
+        Bekleyen sayfasından sadece başlık satırını ve BagKoduBekleyen sütununu çeker - Service Account ile
 
         Amaç:
-        - Mevcut BagKoduBekleyen değerlerini al
-        - Yeni verilerle karşılaştırma için hazırla
+        - Mevcut BagKoduBekleyen değerlerini al (tüm sayfa indirilmez)
+        - Yeni satırları sayfanın sütun sırasına göre hizalamak için başlıkları al
         - Duplicate kontrolü sağla
 
         Returns:
-            set: Mevcut BagKoduBekleyen değerleri seti
+            tuple: (başlık listesi, mevcut BagKoduBekleyen değerleri seti)
         """
         try:
-            # Service Account ile PRGsheet aç
-            sheet = self.config_manager.gc.open("PRGsheet")
-            worksheet = sheet.worksheet('Bekleyen')
+            # Başlık satırı süreç içinde cache'li; maliyet toplam satır sayısıyla büyümez
+            headers = self.config_manager.get_worksheet_headers('PRGsheet', 'Bekleyen')
 
-            # Tüm veriyi çek
-            all_values = worksheet.get_all_values()
+            # BagKoduBekleyen sütunu varsa, sadece o sütunu oku
+            if 'BagKoduBekleyen' in headers:
+                data = self.config_manager.get_columns_data(
+                    'PRGsheet', {'Bekleyen': ['BagKoduBekleyen']}, schemas={'Bekleyen': {'BagKoduBekleyen': 'text'}}
+                ).get('Bekleyen')
+                if data is not None:
+                    return headers, {code for code in data['BagKoduBekleyen'] if code}
 
-            if not all_values:
-                return set()
-
-            # DataFrame oluştur
-            df = pd.DataFrame(all_values[1:], columns=all_values[0])  # İlk satır header
-
-            # BagKoduBekleyen sütunu varsa, unique değerleri al
-            if 'BagKoduBekleyen' in df.columns:
-                existing_codes = set(df['BagKoduBekleyen'].dropna().astype(str))
-                return existing_codes
-
-            return set()
+            return headers, set()
 
         except Exception as e:
             logger.error(f"Mevcut veri okuma hatası: {e}")
             # Hata durumunda boş set döndür (yeni veriler eklenecek)
-            return set()
+            return [], set()
     
     def _filter_new_records(self, processed_orders, existing_codes):
         """
@@ -447,9 +415,9 @@ class DogtasFastSiparisSorgu:
 
         İşlem Pipeline:
         1. Veri işleme (_process_data)
-        2. Mevcut verileri çekme (_get_existing_data)
+        2. Başlık ve BagKoduBekleyen sütununu çekme (_get_existing_data)
         3. Yeni kayıtları filtreleme (_filter_new_records)
-        4. Sadece yeni kayıtları ekleme (append_rows)
+        4. Sadece yeni kayıtları ekleme (append_rows / values.append)
         5. Başarı kontrolü
 
         Avantajlar:
@@ -469,8 +437,8 @@ class DogtasFastSiparisSorgu:
         if not processed_orders:
             return
 
-        # 2. Mevcut verileri çek
-        existing_codes = self._get_existing_data()
+        # 2. Mevcut başlıkları ve BagKoduBekleyen kodlarını çek
+        headers, existing_codes = self._get_existing_data()
 
         # 3. Yalnızca yeni kayıtları filtrele
         new_records = self._filter_new_records(processed_orders, existing_codes)
@@ -481,14 +449,12 @@ class DogtasFastSiparisSorgu:
         try:
             # 4. DataFrame oluştur
             df = pd.DataFrame(new_records)
-            # Service Account ile PRGsheet aç
-            sheet = self.config_manager.gc.open("PRGsheet")
-
-            # Worksheet hazırlama
+            # Worksheet hazırlama (handle cache üzerinden)
             try:
-                worksheet = sheet.worksheet('Bekleyen')
+                worksheet = self.config_manager.get_worksheet('Bekleyen')
             except:
                 # Worksheet yoksa oluştur
+                sheet = self.config_manager.open_by_key(self.config_manager.MASTER_SPREADSHEET_ID)
                 worksheet = sheet.add_worksheet(
                     'Bekleyen',
                     rows=len(df)+1000,
@@ -500,71 +466,38 @@ class DogtasFastSiparisSorgu:
 
             # 5. Yalnızca yeni kayıtları ekle (append)
             if len(existing_codes) == 0:
-                # İlk kayıtlar - header ile birlikte
-                values = [df.columns.tolist()] + df.values.tolist()
-                worksheet.update(values=values, range_name='A1')
+                # İlk kayıtlar - header ile birlikte (parçalı, paralel upload)
+                self._batch_upload(worksheet, df)
             else:
-                # Mevcut verilerin üstüne ekle
-                worksheet.append_rows(df.values.tolist())
+                # Sayfanın sütun sırasına hizala ve sadece yeni satırları ekle (values.append)
+                if headers:
+                    df = df.reindex(columns=headers)
+                values = dataframe_to_sheet_values(df, include_header=False)
+                worksheet.append_rows(values, value_input_option='RAW', table_range='A1')
 
         except Exception as e:
             logger.error(f"Sheets kaydetme hatası: {e}")
     
     def _batch_upload(self, worksheet, df):
         """
-        Büyük veriler için optimize edilmiş batch upload sistemi
-        
+        Büyük veriler için parçalı, paralel upload (CentralConfigManager.upload_values)
+
         Performans Özellikleri:
-        - 1000'lik parçalara bölme
-        - Dinamik Excel sütun hesaplama (A, B, ..., AA, AB)
-        - Memory efficient işlem
-        
+        - Parçalar satır sayısına değil hücre sayısı ve payload boyutuna göre
+        - Çakışmayan aralıklar sınırlı thread havuzundan, ortak kota ile
+        - Checkpoint: yarım kalan upload aynı veriyle kalan parçalardan devam eder
+
         Args:
             worksheet: Google Sheets worksheet object
             df: pandas DataFrame
         """
         try:
-            # Header upload
-            worksheet.update(values=[df.columns.tolist()], range_name='A1')
-            
-            # Batch configuration
-            batch_size = 1000
-            data_values = df.values.tolist()
-            
-            # Batch processing
-            for i in range(0, len(data_values), batch_size):
-                batch = data_values[i:i + batch_size]
-                start_row = i + 2  # Header skip
-                end_row = start_row + len(batch) - 1
-                
-                # Excel column calculation
-                end_col = self._get_column_letter(len(df.columns))
-                range_name = f'A{start_row}:{end_col}{end_row}'
-                
-                # Upload batch
-                worksheet.update(values=batch, range_name=range_name)
+            values = [df.columns.tolist()] + df.values.tolist()
+            self.config_manager.upload_values(worksheet, values)
 
         except Exception as e:
             logger.error(f"Batch upload hatası: {e}")
-    
-    def _get_column_letter(self, col_num):
-        """
-        Excel sütun numarasını harfe çeviren utility fonksiyon
-        
-        Örnek: 1->A, 26->Z, 27->AA, 28->AB
-        
-        Args:
-            col_num (int): Sütun numarası
-            
-        Returns:
-            str: Excel sütun harfi
-        """
-        result = ""
-        while col_num > 0:
-            col_num -= 1
-            result = chr(col_num % 26 + ord('A')) + result
-            col_num //= 26
-        return result
+
 
 if __name__ == "__main__":
     """
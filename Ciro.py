@@ -18,15 +18,15 @@ Merkezi config ve Service Account ile güvenli ciro hesaplama
 - Sessiz çalışma (sadece log dosyasına yazar)
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager
+
 import pandas as pd
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Tuple
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -67,8 +67,8 @@ class CiroConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheets'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -138,6 +138,16 @@ AY_CEVIRI = {
 # GOOGLE SHEETS MANAGER - Service Account
 # ============================================================================
 
+# Siparis sayfasının ciro hesabında kullanılan sütun tipleri
+# (bkz. central_config.apply_sheet_schema)
+SIPARIS_SEMASI = {
+    'Birim Fiyat': 'decimal',
+    'Vergi': 'decimal',
+    'Miktar': 'decimal',
+    'Mağaza': 'decimal',
+    'Tarih': 'date',
+}
+
 class GoogleSheetsManager:
     """
     Service Account kullanan Google Sheets yöneticisi
@@ -159,13 +169,12 @@ class GoogleSheetsManager:
             Sipariş verileri DataFrame
         """
         try:
-            # PRGsheet'ten Siparis verilerini çek
-            data = self.config_manager.get_worksheet_data('PRGsheet', 'Siparis')
+            # PRGsheet'ten Siparis verilerini tipli çek (UNFORMATTED_VALUE + şema)
+            df = self.config_manager.get_worksheets_data(
+                'PRGsheet', ['Siparis'], schemas={'Siparis': SIPARIS_SEMASI}
+            ).get('Siparis')
 
-            if data:
-                headers = data[0]
-                rows = data[1:]
-                df = pd.DataFrame(rows, columns=headers)
+            if df is not None and not df.empty:
                 logger.info(f"{len(df)} satır Siparis verisi yüklendi")
                 return df
 
@@ -268,20 +277,11 @@ class CiroAnalyzer:
                 raise ValueError("Sipariş verisi bulunamadı")
 
             # 2. Veri işleme
-            # Virgüllü ondalık değerleri düzgün çevir
-            df['Birim Fiyat'] = df['Birim Fiyat'].astype(str).str.replace(',', '.', regex=False)
-            df['Birim Fiyat'] = pd.to_numeric(df['Birim Fiyat'], errors='coerce')
-
-            df['Vergi'] = df['Vergi'].astype(str).str.replace(',', '.', regex=False)
-            df['Vergi'] = pd.to_numeric(df['Vergi'], errors='coerce')
-
-            df['Miktar'] = pd.to_numeric(df['Miktar'], errors='coerce')
-            df['Mağaza'] = pd.to_numeric(df['Mağaza'], errors='coerce')
+            # Sayısal ve tarih sütunları okumada SIPARIS_SEMASI ile tiplendi
+            df = df.copy()
             df['Tutar'] = df['Birim Fiyat'] * df['Miktar'] + df['Vergi']
 
             tarih_sutunu = "Tarih"
-            df = df.copy()
-            df[tarih_sutunu] = pd.to_datetime(df[tarih_sutunu], errors='coerce')
 
             # 3. Merkez ve şube verilerini ayır
             merkez_df = df[df["Mağaza"] == self.config.merkez_sube_kodu].copy()
@@ -17,15 +17,15 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager
+
 import pandas as pd
 import glob
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -66,8 +66,8 @@ class FiyatMikroConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -16,13 +16,16 @@ Kullanim:
 """
 
 import sys
+
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager
+
 import requests
 import logging
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from central_config import CentralConfigManager
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -80,37 +83,17 @@ class PrimApiClient:
         self._load_config()
 
     def _load_config(self):
-        """Ayar sayfasindan API konfigurasyonlarini yukler."""
+        """Ayar registry'sinden API konfigurasyonlarini yukler (sayfa tekrar indirilmez)."""
         try:
-            sheet = self.config_manager.gc.open("PRGsheet").worksheet('Ayar')
-            all_values = sheet.get_all_values()
+            registry = self.config_manager.registry
 
-            if not all_values:
-                raise ValueError("Ayar sayfasi bos")
+            self.base_url = registry.get('base_url')
+            self.endpoint = registry.get('bekleyenler')
+            self.customer_no = registry.get('CustomerNo')
 
-            headers = all_values[0]
-            key_index = headers.index('Key')
-            value_index = headers.index('Value')
-
-            config = {}
-            for row in all_values[1:]:
-                if len(row) > max(key_index, value_index):
-                    key = row[key_index].strip() if row[key_index] else ''
-                    value = row[value_index].strip() if row[value_index] else ''
-                    if key:
-                        config[key] = value
-
-            self.base_url = config.get('base_url', '')
-            self.endpoint = config.get('bekleyenler', '')
-            self.customer_no = config.get('CustomerNo', '')
-
-            self.auth_data = {
-                "userName": config.get('userName', ''),
-                "password": config.get('password', ''),
-                "clientId": config.get('clientId', ''),
-                "clientSecret": config.get('clientSecret', ''),
-                "applicationCode": config.get('applicationCode', '')
-            }
+            self.auth_data = registry.get_many(
+                'userName', 'password', 'clientId', 'clientSecret', 'applicationCode'
+            )
 
         except Exception as e:
             logger.error(f"Config yukleme hatasi: {e}")
@@ -968,7 +951,7 @@ class PrimHesaplamaApp(QWidget):
         self.setStyleSheet(STYLESHEET)
 
         # Backend
-        self.config_manager = CentralConfigManager()
+        self.config_manager = CentralConfigManager.shared()
         self.storage = StorageManager(self.config_manager)
         self.api_client = PrimApiClient(self.config_manager)
         self.worker = None
@@ -1659,9 +1642,12 @@ class PrimHesaplamaApp(QWidget):
 
 def main():
     app = QApplication(sys.argv)
-    window = PrimHesaplamaApp()
-    window.show()
-    sys.exit(app.exec_())
+    # GUI thread'inin Sheets istekleri batch işlerin önünde kuyruğa girer
+    with CentralConfigManager.scheduler.priority('interactive'):
+        window = PrimHesaplamaApp()
+        window.show()
+        exit_code = app.exec_()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,9 @@ Merkezi config ve Service Account ile güvenli irsaliye analizi
 - Tüm hassas bilgiler PRGsheet'te saklanır
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, dataframe_to_sheet_values, get_connection_pool
+
 import pandas as pd
 import pyodbc
 import logging
@@ -19,9 +22,6 @@ import sys
 from contextlib import contextmanager
 from typing import Optional
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -54,8 +54,8 @@ class IrsaliyeConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -111,14 +111,14 @@ class DatabaseManager:
         """Context manager for database connections"""
         connection = None
         try:
-            connection = pyodbc.connect(self.connection_string)
+            connection = get_connection_pool(self.connection_string).acquire()
             yield connection
 
         except pyodbc.Error as e:
             raise Exception(f"Database connection error: {e}")
         finally:
             if connection:
-                connection.close()
+                get_connection_pool(self.connection_string).release(connection)
 
     def execute_query(self, query: str) -> pd.DataFrame:
         """Execute SQL query and return DataFrame"""
@@ -156,7 +156,6 @@ class GoogleSheetsManager:
 
             try:
                 worksheet = spreadsheet.worksheet(worksheet_name)
-                worksheet.clear()
             except:
                 worksheet = spreadsheet.add_worksheet(
                     title=worksheet_name,
@@ -165,11 +164,14 @@ class GoogleSheetsManager:
                 )
 
             if not df.empty:
-                df_clean = self._clean_dataframe(df)
-                values = [df_clean.columns.values.tolist()] + df_clean.values.tolist()
+                # Ortak serializer: tüm hücreler metin, NaN/NaT/None boş
+                values = dataframe_to_sheet_values(df, as_text=True)
 
                 # RAW: binlik ayraç eklenmez, veri olduğu gibi yazılır
-                worksheet.update(values, value_input_option='RAW')
+                self.config_manager.write_worksheet_values(worksheet, values, value_input_option='RAW')
+            else:
+                # Veri yoksa eski içerik kalmasın
+                self.config_manager.clear_worksheet(worksheet)
 
         except Exception as e:
             raise Exception(f"Error updating {worksheet_name} worksheet: {e}")
@@ -188,30 +190,6 @@ class GoogleSheetsManager:
         except Exception as e:
             raise Exception(f"Error deleting {worksheet_name} worksheet: {e}")
 
-    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean DataFrame for Google Sheets"""
-        df_clean = df.copy()
-        df_clean = df_clean.fillna('')
-
-        for col in df_clean.columns:
-            if df_clean[col].dtype == 'datetime64[ns]':
-                df_clean[col] = df_clean[col].astype(str).replace('NaT', '')
-            elif df_clean[col].dtype in ['float64', 'float32']:
-                df_clean[col] = df_clean[col].replace([float('inf'), float('-inf')], '')
-                df_clean[col] = df_clean[col].astype(str).replace('nan', '').replace('NaN', '')
-            elif df_clean[col].dtype in ['int64', 'int32']:
-                df_clean[col] = df_clean[col].astype(str)
-            else:
-                df_clean[col] = df_clean[col].astype(str).replace('nan', '').replace('NaN', '').replace('None', '')
-
-        # Final cleanup
-        for col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(
-                lambda x: '' if str(x) in ['nan', 'NaN', 'None', 'NaT'] else str(x)
-            )
-
-        return df_clean
-
 # ============================================================================
 # IRSALIYE PROCESSOR
 # ============================================================================
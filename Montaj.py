@@ -9,14 +9,14 @@ Merkezi config ve Service Account ile güvenli montaj analizi
 - Tüm hassas bilgiler PRGsheet'te saklanır
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, dataframe_to_sheet_values
+
 import pandas as pd
 import logging
 from pathlib import Path
 import sys
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -52,8 +52,8 @@ class MontajConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -95,30 +95,6 @@ class GoogleSheetsManager:
         self.config_manager = config_manager
         self.gc = config_manager.gc  # Service Account ile yetkilendirilmiş client
 
-    def clean_dataframe_for_json(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean DataFrame for JSON serialization"""
-        df_clean = df.copy()
-        df_clean = df_clean.fillna('')
-
-        for col in df_clean.columns:
-            if df_clean[col].dtype == 'datetime64[ns]':
-                df_clean[col] = df_clean[col].astype(str).replace('NaT', '')
-            elif df_clean[col].dtype in ['float64', 'float32']:
-                df_clean[col] = df_clean[col].replace([float('inf'), float('-inf')], '')
-                df_clean[col] = df_clean[col].astype(str).replace('nan', '').replace('NaN', '')
-            elif df_clean[col].dtype in ['int64', 'int32']:
-                df_clean[col] = df_clean[col].astype(str)
-            else:
-                df_clean[col] = df_clean[col].astype(str).replace('nan', '').replace('NaN', '').replace('None', '')
-
-        # Final cleanup
-        for col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(
-                lambda x: '' if str(x) in ['nan', 'NaN', 'None', 'NaT'] else str(x)
-            )
-
-        return df_clean
-
     def read_montaj_from_sheets(self) -> pd.DataFrame:
         """PRGsheets'ten mevcut Montaj sayfasını okur"""
         try:
@@ -171,15 +147,17 @@ class GoogleSheetsManager:
 
             try:
                 worksheet = spreadsheet.worksheet("Montaj")
-                worksheet.clear()
             except:
                 worksheet = spreadsheet.add_worksheet(title="Montaj", rows=1000, cols=20)
 
             if not df.empty:
-                # Clean data for JSON serialization
-                df_clean = self.clean_dataframe_for_json(df)
-                values = [df_clean.columns.values.tolist()] + df_clean.values.tolist()
-                worksheet.update(values, value_input_option='USER_ENTERED')
+                # Ortak serializer: tüm hücreler metin, NaN/NaT/None boş
+                values = dataframe_to_sheet_values(df, as_text=True)
+                # Sadece değişen satırları yaz (clear() + tam yazım yerine)
+                self.config_manager.write_worksheet_values(worksheet, values, value_input_option='USER_ENTERED')
+            else:
+                # Veri yoksa eski içerik kalmasın
+                self.config_manager.clear_worksheet(worksheet)
 
         except Exception as e:
             logger.error(f"Montaj sayfasına kayıt hatası: {e}")
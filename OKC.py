@@ -10,6 +10,9 @@ Merkezi config ve Service Account ile güvenli OKC fatura analizi
 - Tarih bazlı veri filtreleme
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, dataframe_to_sheet_values
+
 import pandas as pd
 from tkinter import Tk, filedialog
 from tkinter.messagebox import showinfo, showerror
@@ -20,9 +23,6 @@ from typing import Optional
 from pathlib import Path
 import sys
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -55,8 +55,8 @@ class GoogleSheetsManager:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
             self.gc = self.config_manager.gc  # Service Account ile yetkilendirilmiş client
 
         except Exception as e:
@@ -65,33 +65,10 @@ class GoogleSheetsManager:
 
     def clean_data_for_sheets(self, df: pd.DataFrame):
         """Clean DataFrame for Google Sheets - convert everything to basic types"""
-        df_clean = df.copy()
-
-        for col in df_clean.columns:
-            # Convert datetime columns to strings
-            if str(df_clean[col].dtype).startswith('datetime'):
-                df_clean[col] = df_clean[col].dt.strftime('%Y-%m-%d')
-            # Fill NaN values
-            elif df_clean[col].dtype == 'object':
-                df_clean[col] = df_clean[col].fillna('')
-            # Convert numeric NaN to empty string
-            else:
-                df_clean[col] = df_clean[col].fillna('')
-
-        # Convert to basic Python types
-        clean_data = []
-        headers = [str(col) for col in df_clean.columns]
-
-        for _, row in df_clean.iterrows():
-            clean_row = []
-            for val in row:
-                if pd.isna(val) or val is None:
-                    clean_row.append('')
-                else:
-                    clean_row.append(str(val))
-            clean_data.append(clean_row)
-
-        return headers, clean_data
+        # Ortak vektörel serializer: tarihler YYYY-MM-DD, tüm hücreler metin
+        values = dataframe_to_sheet_values(df, as_text=True, date_format='%Y-%m-%d')
+        headers = [str(col) for col in values[0]]
+        return headers, values[1:]
 
     def get_okc_data(self):
         """OKC sayfasındaki mevcut verileri al"""
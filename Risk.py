@@ -9,15 +9,16 @@ Merkezi config ve Service Account ile güvenli risk analizi
 - Tüm hassas bilgiler PRGsheet'te saklanır
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, get_connection_pool
+
 import pyodbc
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
 import pandas as pd
 from contextlib import contextmanager
-
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
+from concurrent.futures import ThreadPoolExecutor
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -63,8 +64,8 @@ class RiskAnalysisConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheets'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -124,16 +125,16 @@ class DatabaseManager:
         """Context manager ile güvenli bağlantı yönetimi"""
         connection = None
         try:
-            connection = pyodbc.connect(self.connection_string)
-            logger.info("Database connection established")
+            connection = get_connection_pool(self.connection_string).acquire()
+            logger.info("Database connection acquired from pool")
             yield connection
         except pyodbc.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
         finally:
             if connection:
-                connection.close()
-                logger.info("Database connection closed")
+                get_connection_pool(self.connection_string).release(connection)
+                logger.info("Database connection returned to pool")
 
     def execute_query(
         self,
@@ -187,8 +188,8 @@ class GoogleSheetsManager:
 
         """
         try:
-            # PRGsheet'ten NoRisk verilerini çek
-            data = self.config_manager.get_worksheet_data('PRGsheet', 'NoRisk')
+            # PRGsheet'ten NoRisk verilerini çek (değişmemişse lokal snapshot'tan)
+            data = self.config_manager.get_worksheet_data('PRGsheet', 'NoRisk', use_snapshot=True)
 
             # İlk kolondan kodları al (header'ı atla)
             codes = [row[0] for row in data[1:] if row and row[0]]
@@ -216,7 +217,6 @@ class GoogleSheetsManager:
             # Risk worksheet'i bul veya oluştur
             try:
                 risk_worksheet = risk_spreadsheet.worksheet('Risk')
-                risk_worksheet.clear()
             except:
                 risk_worksheet = risk_spreadsheet.add_worksheet(
                     title='Risk',
@@ -226,10 +226,14 @@ class GoogleSheetsManager:
 
             if not data.empty:
                 values = [data.columns.values.tolist()] + data.values.tolist()
-                risk_worksheet.update(values, value_input_option='USER_ENTERED')
+                # Sadece değişen satırları yaz (clear() + tam yazım yerine)
+                self.config_manager.write_worksheet_values(
+                    risk_worksheet, values, value_input_option='USER_ENTERED'
+                )
                 logger.info(f"{len(data)} satır Risk sayfasına yazıldı")
             else:
                 logger.warning("Risk verisi bulunamadı")
+                self.config_manager.clear_worksheet(risk_worksheet)
 
         except Exception as e:
             logger.error(f"Risk worksheet güncelleme hatası: {e}")
@@ -242,11 +246,69 @@ class GoogleSheetsManager:
 class RiskAnalyzer:
     """Risk analizi ana sınıfı"""
 
+    # Tüm carilerin bekleyen siparişleri (cari filtresi boş); iki analiz aynı
+    # sonucu sorgu cache'i üzerinden paylaşır
+    BEKLEYEN_SIPARIS_SQL = """
+    EXEC dbo.sp_SiparisOperasyonlari 0,'20230101','20770101',0,0,2,0,0,0,N'',1,N'',0,0,0,1
+    """
+
+    # Tek sorguda gönderilen azami cari sayısı (SQL Server parametre sınırı 2100)
+    SQL_CHUNK_SIZE = 500
+
+    # fn_CariRiskFoyu set bazlı uygulanamazsa eşzamanlı kullanılacak bağlantı sayısı
+    RISK_FANOUT_WORKERS = 4
+
     def __init__(self, config: RiskAnalysisConfig):
         self.config = config
         self.db_manager = DatabaseManager(config.connection_string)
         self.sheets_manager = GoogleSheetsManager(config.config_manager)
 
+    @staticmethod
+    def _chunks(items: List, size: int):
+        """Listeyi size uzunluğunda parçalara böl"""
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+
+    def _get_pending_orders(self) -> pd.DataFrame:
+        """Tüm cariler için bekleyen siparişler (SP tek kez, tazelik süresi içinde cache'ten)"""
+        return self.config.config_manager.cached_query(
+            self.db_manager.connection_string, self.BEKLEYEN_SIPARIS_SQL
+        )
+
+    def _get_last_orders(self, connection: pyodbc.Connection, cari_codes: List[str]) -> Dict[str, tuple]:
+        """
+        Carilerin son siparişini (satıcı, sipariş tarihi) toplu getir
+
+        fn_CariSiparisFoyu her parça için tek sorguda CROSS APPLY ile uygulanır.
+
+        Returns:
+            {cariKod: (satıcı, sipariş tarihi)} (siparişi olmayan cariler dahil edilmez)
+        """
+        last_orders = {}
+        unique_codes = list(dict.fromkeys(cari_codes))
+
+        for chunk in self._chunks(unique_codes, self.SQL_CHUNK_SIZE):
+            values = ','.join(['(?)'] * len(chunk))
+            query = f"""
+            SELECT k.cariKod, f.[#msg_S_1130], f.[msg_S_0241]
+            FROM (VALUES {values}) AS k(cariKod)
+            CROSS APPLY (
+                SELECT TOP 1 [#msg_S_1130], [msg_S_0241]
+                FROM dbo.fn_CariSiparisFoyu(k.cariKod, '20230101', '20771231')
+                ORDER BY [msg_S_0088] DESC
+            ) AS f
+            """
+
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, tuple(chunk))
+                for cari_kod, last_delivery_info, order_date_raw in cursor.fetchall():
+                    last_orders[cari_kod] = (last_delivery_info, order_date_raw)
+            finally:
+                cursor.close()
+
+        return last_orders
+
     def get_high_risk_customers(self, no_risk_codes: List[str]) -> pd.DataFrame:
         """
         Yüksek riskli müşterileri getir
@@ -296,64 +358,39 @@ class RiskAnalyzer:
                     cursor.execute(query)
 
                 initial_rows = cursor.fetchall()
+                cursor.close()
 
-                for row in initial_rows:
-                    cari_kod = row[4]
-
-                    sp_query = """
-                    EXEC dbo.sp_SiparisOperasyonlari 0,'20230101','20770711',0,0,2,0,0,0,N'',1,?,0,0,0,1
-                    """
-
-                    sp_cursor = connection.cursor()
-                    sp_cursor.execute(sp_query, (cari_kod,))
-
-                    sp_has_results = False
-
-                    # Tüm sonuç setlerini tüket
-                    while True:
-                        try:
-                            rows = sp_cursor.fetchall()
-                            if rows:
-                                sp_has_results = True
-                        except pyodbc.ProgrammingError:
-                            pass
-
-                        if not sp_cursor.nextset():
-                            break
-
-                    sp_cursor.close()
-
-                    if not sp_has_results:
-                        siparis_query = """
-                        SELECT TOP 1 [#msg_S_1130], [msg_S_0241]
-                        FROM dbo.fn_CariSiparisFoyu(?, '20230101', '20771231')
-                        ORDER BY [msg_S_0088] DESC
-                        """
-
-                        siparis_cursor = connection.cursor()
-                        siparis_cursor.execute(siparis_query, (cari_kod,))
-                        siparis_result = siparis_cursor.fetchone()
-                        siparis_cursor.close()
-
-                        last_delivery_info = siparis_result[0] if siparis_result else None
-                        order_date_raw = siparis_result[1] if siparis_result else None
-
-                        order_date = (
-                            order_date_raw.strftime('%Y-%m-%d')
-                            if isinstance(order_date_raw, datetime)
-                            else ''
-                        )
-
-                        high_risk_data.append({
-                            'msg_S_0088': row[0],
-                            'cariAdi': row[1],
-                            'cariAciklama': row[2],
-                            'cariTelefon': row[3],
-                            'cariKod': row[4],
-                            'cariBakiye': round(row[5]),
-                            'Personel': last_delivery_info,
-                            'Tarih': order_date
-                        })
+                # Bekleyen siparişi olan cariler: SP tüm cariler için bir kez çalışır
+                # (cari başına SP çağrısı yerine hash lookup)
+                pending_orders = self._get_pending_orders()
+                open_order_codes = (
+                    set(pending_orders['msg_S_0200'].astype(str))
+                    if 'msg_S_0200' in pending_orders.columns else set()
+                )
+                candidates = [row for row in initial_rows if str(row[4]) not in open_order_codes]
+
+                # Son sipariş bilgisi sadece bekleyen siparişi olmayanlar için, parça parça
+                last_orders = self._get_last_orders(connection, [row[4] for row in candidates])
+
+                for row in candidates:
+                    last_delivery_info, order_date_raw = last_orders.get(row[4], (None, None))
+
+                    order_date = (
+                        order_date_raw.strftime('%Y-%m-%d')
+                        if isinstance(order_date_raw, datetime)
+                        else ''
+                    )
+
+                    high_risk_data.append({
+                        'msg_S_0088': row[0],
+                        'cariAdi': row[1],
+                        'cariAciklama': row[2],
+                        'cariTelefon': row[3],
+                        'cariKod': row[4],
+                        'cariBakiye': round(row[5]),
+                        'Personel': last_delivery_info,
+                        'Tarih': order_date
+                    })
 
             except pyodbc.Error as e:
                 logger.error(f"High risk customers hatası: {e}")
@@ -361,36 +398,122 @@ class RiskAnalyzer:
 
         return pd.DataFrame(high_risk_data)
 
-    def get_pending_risk_customers(self) -> pd.DataFrame:
-        """Bekleyen riskli müşterileri getir"""
-        with self.db_manager.get_connection() as connection:
+    def _get_customer_details(self, connection: pyodbc.Connection, cari_codes: List[str]) -> pd.DataFrame:
+        """CARI_HESAPLAR_CHOOSE_3A satırlarını parçalı IN-listeleriyle tek geçişte getir"""
+        frames = []
+        for chunk in self._chunks(cari_codes, self.SQL_CHUNK_SIZE):
+            placeholders = ','.join(['?'] * len(chunk))
+            detail_query = f"""
+            SELECT
+                [msg_S_0088],
+                [cariAdi],
+                [cariAciklama],
+                [cariTelefon],
+                [cariKod],
+                [cariBakiye]
+            FROM
+                [dbo].[CARI_HESAPLAR_CHOOSE_3A]
+            WHERE
+                [cariKod] IN ({placeholders})
+            """
+
+            cursor = connection.cursor()
             try:
-                cursor = connection.cursor()
+                cursor.execute(detail_query, tuple(chunk))
+                columns = [column[0] for column in cursor.description]
+                frames.append(pd.DataFrame.from_records(cursor.fetchall(), columns=columns))
+            finally:
+                cursor.close()
+
+        if not frames:
+            return pd.DataFrame()
+        details = pd.concat(frames, ignore_index=True)
+
+        # Carilerin bekleyen listesindeki sırası korunur
+        position = {code: index for index, code in enumerate(cari_codes)}
+        details['_sira'] = details['cariKod'].map(position)
+        return details.sort_values('_sira', kind='stable').drop(columns='_sira').reset_index(drop=True)
+
+    def _get_risk_rows(self, connection: pyodbc.Connection, cari_codes: List[str]) -> pd.DataFrame:
+        """
+        fn_CariRiskFoyu satırlarını (cariKod, #msg_S_1720, msg_S_0111) toplu getir
 
-                sql_query = """
-                EXEC dbo.sp_SiparisOperasyonlari 0,'20230101','20770101',0,0,2,0,0,0,N'',1,N'',0,0,0,1
+        Fonksiyon her parça için CROSS APPLY ile tek sorguda uygulanır; set bazlı
+        uygulanamazsa cari başına çağrılar paylaşılan havuzdaki bağlantılara dağıtılır.
+        """
+        frames = []
+        try:
+            for chunk in self._chunks(cari_codes, self.SQL_CHUNK_SIZE):
+                values = ','.join(['(?)'] * len(chunk))
+                risk_query = f"""
+                SELECT k.cariKod, r.[#msg_S_1720], r.[msg_S_0111]
+                FROM (VALUES {values}) AS k(cariKod)
+                CROSS APPLY dbo.fn_CariRiskFoyu(0, k.cariKod, '20000101', '20000101', '20770101', 0, N'', 0) AS r
                 """
 
-                cursor.execute(sql_query)
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(risk_query, tuple(chunk))
+                    frames.append(pd.DataFrame.from_records(
+                        cursor.fetchall(), columns=['cariKod', '#msg_S_1720', 'msg_S_0111']
+                    ))
+                finally:
+                    cursor.close()
 
-                # Sonuç seti olan ilk seti bul
-                columns = None
-                rows = []
+        except pyodbc.Error as e:
+            logger.warning(f"fn_CariRiskFoyu set bazlı uygulanamadı, cari bazında çalıştırılıyor: {e}")
+            return self._get_risk_rows_fanout(cari_codes)
+
+        if not frames:
+            return pd.DataFrame(columns=['cariKod', '#msg_S_1720', 'msg_S_0111'])
+        return pd.concat(frames, ignore_index=True)
+
+    def _get_risk_rows_fanout(self, cari_codes: List[str]) -> pd.DataFrame:
+        """fn_CariRiskFoyu'nu cari başına, havuzdaki birden fazla bağlantıda eşzamanlı çalıştır"""
+        pool = get_connection_pool(self.db_manager.connection_string)
+        risk_query = """
+        SELECT * FROM dbo.fn_CariRiskFoyu(0,?,'20000101','20000101','20770101',0,N'',0)
+        """
 
-                while True:
-                    if cursor.description:
-                        columns = [column[0] for column in cursor.description]
+        def fetch(cari_kod: str) -> Optional[pd.DataFrame]:
+            try:
+                with pool.connection() as connection:
+                    cursor = connection.cursor()
+                    try:
+                        cursor.execute(risk_query, (cari_kod,))
                         rows = cursor.fetchall()
-                        break
+                        if not rows or not cursor.description:
+                            return None
+                        columns = [column[0] for column in cursor.description]
+                    finally:
+                        cursor.close()
+            except pyodbc.Error as e:
+                logger.warning(f"Risk data hatası ({cari_kod}): {e}")
+                return None
 
-                    if not cursor.nextset():
-                        break
+            if '#msg_S_1720' not in columns or 'msg_S_0111' not in columns:
+                return None
+            frame = pd.DataFrame.from_records(rows, columns=columns)[['#msg_S_1720', 'msg_S_0111']]
+            frame.insert(0, 'cariKod', cari_kod)
+            return frame
 
-                if not columns:
-                    cursor.close()
+        with ThreadPoolExecutor(max_workers=self.RISK_FANOUT_WORKERS) as executor:
+            frames = [frame for frame in executor.map(fetch, cari_codes) if frame is not None]
+
+        if not frames:
+            return pd.DataFrame(columns=['cariKod', '#msg_S_1720', 'msg_S_0111'])
+        return pd.concat(frames, ignore_index=True)
+
+    def get_pending_risk_customers(self) -> pd.DataFrame:
+        """Bekleyen riskli müşterileri getir"""
+        with self.db_manager.get_connection() as connection:
+            try:
+                # Tazelik süresi içinde çalıştırıldıysa sonuç cache'inden gelir
+                df = self._get_pending_orders()
+
+                if df.empty:
                     return pd.DataFrame()
 
-                df = pd.DataFrame.from_records(rows, columns=columns)
                 df.sort_values(by='msg_S_0088', inplace=True)
                 df.drop_duplicates(subset=['msg_S_0200'], keep='first', inplace=True)
 
@@ -398,74 +521,23 @@ class RiskAnalyzer:
                 final_df['msg_S_0241'] = pd.to_datetime(final_df['msg_S_0241'], errors='coerce').dt.strftime('%Y-%m-%d')
                 final_df['msg_S_0241'] = final_df['msg_S_0241'].fillna('')
 
-                all_results = []
-
-                for cari_kod in final_df['msg_S_0200']:
-                    detail_query = """
-                    SELECT
-                        [msg_S_0088],
-                        [cariAdi],
-                        [cariAciklama],
-                        [cariTelefon],
-                        [cariKod],
-                        [cariBakiye]
-                    FROM
-                        [dbo].[CARI_HESAPLAR_CHOOSE_3A]
-                    WHERE
-                        [cariKod] = ?
-                    """
-
-                    detail_cursor = connection.cursor()
-                    detail_cursor.execute(detail_query, (cari_kod,))
-                    results = detail_cursor.fetchall()
-
-                    if results:
-                        results_columns = [column[0] for column in detail_cursor.description]
-                        results_list_of_dicts = [dict(zip(results_columns, row)) for row in results]
-
-                        for res_dict in results_list_of_dicts:
-                            current_cari_kod = res_dict['cariKod']
-                            risk_query = """
-                            SELECT * FROM dbo.fn_CariRiskFoyu(0,?,'20000101','20000101','20770101',0,N'',0)
-                            """
-
-                            risk_cursor = None
-                            try:
-                                risk_cursor = connection.cursor()
-                                risk_cursor.execute(risk_query, (current_cari_kod,))
-                                risk_results = risk_cursor.fetchall()
-
-                                s0111_values = []
-                                if risk_results and risk_cursor.description:
-                                    risk_columns = [column[0] for column in risk_cursor.description]
-                                    s1720_index = risk_columns.index('#msg_S_1720') if '#msg_S_1720' in risk_columns else -1
-                                    s0111_index = risk_columns.index('msg_S_0111') if 'msg_S_0111' in risk_columns else -1
-
-                                    if s1720_index != -1 and s0111_index != -1:
-                                        for risk_row in risk_results:
-                                            if str(risk_row[s1720_index]) == '9':
-                                                s0111_values.append(risk_row[s0111_index])
-
-                                res_dict['Risk_Verileri'] = s0111_values
-
-                            except pyodbc.Error as e:
-                                logger.warning(f"Risk data hatası ({current_cari_kod}): {e}")
-                                res_dict['Risk_Verileri'] = []
-                            finally:
-                                if risk_cursor:
-                                    risk_cursor.close()
-
-                            total_risk = sum(res_dict['Risk_Verileri'])
-                            res_dict['sonuc'] = round(res_dict['cariBakiye'] + total_risk)
-                            all_results.append(res_dict)
-
-                    detail_cursor.close()
-
-                if not all_results:
-                    cursor.close()
+                # Cari detayları ve risk föyü cari başına değil, parçalar halinde toplu çekilir
+                cari_codes = list(final_df['msg_S_0200'])
+                sonuc_df = self._get_customer_details(connection, cari_codes)
+
+                if sonuc_df.empty:
                     return pd.DataFrame()
 
-                sonuc_df = pd.DataFrame(all_results)
+                risk_rows = self._get_risk_rows(connection, list(dict.fromkeys(sonuc_df['cariKod'])))
+
+                # Risk toplamı: #msg_S_1720 == 9 olan satırların msg_S_0111 toplamı
+                # (sayısal karşılaştırma: NULL içeren sütun float olur, '9.0' != '9')
+                risk_rows = risk_rows[pd.to_numeric(risk_rows['#msg_S_1720'], errors='coerce') == 9]
+                risk_totals = risk_rows.groupby('cariKod')['msg_S_0111'].sum()
+
+                total_risk = sonuc_df['cariKod'].map(risk_totals).fillna(0)
+                sonuc_df['sonuc'] = (sonuc_df['cariBakiye'] + total_risk).map(round)
+
                 final_df_for_merge = final_df[['msg_S_0200', 'msg_S_0241', '#msg_S_1130']]
                 merged_sonuc_df = pd.merge(
                     sonuc_df,
@@ -482,7 +554,7 @@ class RiskAnalyzer:
                     (merged_sonuc_df['sonuc'] < -7) | (merged_sonuc_df['sonuc'] > 7)
                 ].copy()
 
-                filtered_df.drop(columns=['Risk_Verileri', 'cariBakiye'], inplace=True)
+                filtered_df.drop(columns=['cariBakiye'], inplace=True)
                 filtered_df.rename(columns={'sonuc': 'cariBakiye'}, inplace=True)
 
                 ordered_columns = [
@@ -492,7 +564,6 @@ class RiskAnalyzer:
                 existing_columns = [col for col in ordered_columns if col in filtered_df.columns]
                 filtered_df = filtered_df[existing_columns]
 
-                cursor.close()
                 return filtered_df
 
             except pyodbc.Error as e:
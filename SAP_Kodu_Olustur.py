@@ -18,15 +18,15 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, get_connection_pool
+
 import pyodbc
 import logging
 import pandas as pd
 from contextlib import contextmanager
 from pathlib import Path
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -67,8 +67,8 @@ class SAPKoduConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheets'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -141,16 +141,16 @@ class DatabaseManager:
         """Context manager ile güvenli bağlantı yönetimi"""
         connection = None
         try:
-            connection = pyodbc.connect(self.connection_string)
-            logger.info("Database connection established")
+            connection = get_connection_pool(self.connection_string).acquire()
+            logger.info("Database connection acquired from pool")
             yield connection
         except pyodbc.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
         finally:
             if connection:
-                connection.close()
-                logger.info("Database connection closed")
+                get_connection_pool(self.connection_string).release(connection)
+                logger.info("Database connection returned to pool")
 
 # ============================================================================
 # SAP KODU ANALYZER
@@ -10,13 +10,14 @@ Merkezi config ve Service Account ile güvenli SSH analizi
 """
 
 import logging
+
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager
+
 import pandas as pd
 from pathlib import Path
 import sys
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -52,8 +53,8 @@ class SshConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -85,6 +86,10 @@ class SshConfig:
 # GOOGLE SHEETS MANAGER - Service Account
 # ============================================================================
 
+# Ssh sayfası okunurken tüm sütunlar metin; tam sayı ID'lerde '.0' oluşmaz
+# (bkz. central_config.apply_sheet_schema)
+SSH_SEMASI = {'*': 'text'}
+
 class GoogleSheetsManager:
     """
     Service Account kullanan Google Sheets yöneticisi
@@ -98,27 +103,13 @@ class GoogleSheetsManager:
     def mevcut_veriyi_al(self) -> pd.DataFrame:
         """Ssh sayfasındaki mevcut veriyi al"""
         try:
-            # PRGsheet'i doğrudan aç
-            spreadsheet = self.gc.open_by_key(
-                self.config_manager.MASTER_SPREADSHEET_ID
-            )
-
             try:
-                ssh_sayfasi = spreadsheet.worksheet('Ssh')
-                mevcut_veri = ssh_sayfasi.get_all_values()
-
-                if len(mevcut_veri) > 1:  # Başlık + veri var mı
-                    basliklar = mevcut_veri[0]
-                    veri_satirlari = mevcut_veri[1:]
-                    df = pd.DataFrame(veri_satirlari, columns=basliklar)
-
-                    # Sayısal sütunları temizle
-                    numeric_columns = ['Servis Bakım ID', 'Sözleşme Numarası', 'Yedek Parça Sipariş No',
-                                     'Ürün ID', 'Yedek Parça Ürün ID', 'Yedek Parça Ürün Miktarı']
-                    for col in numeric_columns:
-                        if col in df.columns:
-                            df[col] = df[col].apply(lambda x: str(x).replace('.0', '') if str(x).endswith('.0') else str(x))
+                # UNFORMATTED_VALUE + şema: ID sütunları '.0' olmadan metin gelir
+                df = self.config_manager.get_worksheets_data(
+                    'PRGsheet', ['Ssh'], schemas={'Ssh': SSH_SEMASI}
+                ).get('Ssh')
 
+                if df is not None and not df.empty:  # Başlık + veri var mı
                     # "Parça Durumu" sütununu ekle (yoksa)
                     if 'Parça Durumu' not in df.columns:
                         df['Parça Durumu'] = ''
@@ -16,16 +16,16 @@ import sys
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from contextlib import contextmanager
 from pathlib import Path
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, dataframe_to_sheet_values, get_connection_pool
+
 import pandas as pd
 import pyodbc
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -51,6 +51,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# USER_ENTERED yazımda sayıya/bilimsel notasyona çevrilmemesi için apostrofla yazılan sütunlar
+SHEETS_TEXT_COLUMNS = ('Cari Kodu', 'Kalem No', 'Telefon')
+
 # ============================================================================
 # CONFIGURATION - Service Account ve Merkezi Config
 # ============================================================================
@@ -60,8 +63,8 @@ class SevkiyatConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -151,12 +154,10 @@ class DatabaseManager:
         """Database bağlantısı context manager'ı."""
         connection = None
         try:
-            connection = pyodbc.connect(
-                self.config.connection_string,
-                timeout=30
-            )
+            # Paylaşılan havuzdan al (her işte yeniden login olunmaz)
+            connection = get_connection_pool(self.config.connection_string).acquire()
             connection.timeout = 300  # 5 dakika sorgu timeout
-            logger.debug("Database bağlantısı kuruldu")
+            logger.debug("Database bağlantısı havuzdan alındı")
             yield connection
         except pyodbc.Error as e:
             logger.error(f"Database bağlantı hatası: {e}")
@@ -167,10 +168,10 @@ class DatabaseManager:
         finally:
             if connection:
                 try:
-                    connection.close()
-                    logger.debug("Database bağlantısı kapatıldı")
+                    get_connection_pool(self.config.connection_string).release(connection)
+                    logger.debug("Database bağlantısı havuza iade edildi")
                 except Exception as e:
-                    logger.warning(f"Database bağlantısı kapatılırken hata: {e}")
+                    logger.warning(f"Database bağlantısı iade edilirken hata: {e}")
 
 # ============================================================================
 # GOOGLE SHEETS MANAGER - Service Account
@@ -181,13 +182,14 @@ class GoogleSheetsManager:
 
     def __init__(self, config: GoogleSheetsConfig):
         self.config = config
-        self.gc = config.config_manager.gc  # Service Account ile yetkilendirilmiş client
+        self.config_manager = config.config_manager
+        self.gc = self.config_manager.gc  # Service Account ile yetkilendirilmiş client
         self._test_connection()
 
     def _test_connection(self) -> None:
         """Google Sheets bağlantısını test eder."""
         try:
-            spreadsheet = self.gc.open_by_key(self.config.spreadsheet_id)
+            spreadsheet = self.config_manager.open_by_key(self.config.spreadsheet_id)
             logger.info(f"Google Sheets bağlantı testi başarılı: {spreadsheet.title}")
         except Exception as e:
             logger.error(f"Google Sheets bağlantı testi başarısız: {e}")
@@ -209,25 +211,24 @@ class GoogleSheetsManager:
             if clear_if_empty:
                 logger.warning(f"{target_worksheet} için veri yok, sadece başlıklar korunuyor")
                 try:
-                    spreadsheet = self.gc.open_by_key(self.config.spreadsheet_id)
-                    worksheet = self._get_or_create_worksheet(spreadsheet, target_worksheet)
+                    worksheet = self._get_or_create_worksheet(target_worksheet)
 
                     # Mevcut başlıkları al (ilk satır)
                     try:
                         existing_headers = worksheet.row_values(1)
                         if existing_headers:
                             # Worksheet'i temizle
-                            worksheet.clear()
+                            self.config_manager.clear_worksheet(worksheet)
                             # Sadece başlıkları geri yaz
                             worksheet.update(values=[existing_headers], range_name='A1')
                             logger.info(f"{target_worksheet} worksheet temizlendi, başlıklar korundu: {existing_headers}")
                         else:
                             # Başlık yoksa tamamen temizle
-                            worksheet.clear()
+                            self.config_manager.clear_worksheet(worksheet)
                             logger.info(f"{target_worksheet} worksheet tamamen temizlendi")
                     except Exception as header_error:
                         logger.warning(f"Başlık alınamadı, worksheet tamamen temizleniyor: {header_error}")
-                        worksheet.clear()
+                        self.config_manager.clear_worksheet(worksheet)
 
                 except Exception as e:
                     logger.error(f"{target_worksheet} worksheet temizleme hatası: {e}")
@@ -236,18 +237,16 @@ class GoogleSheetsManager:
             return
 
         try:
-            spreadsheet = self.gc.open_by_key(self.config.spreadsheet_id)
-            worksheet = self._get_or_create_worksheet(spreadsheet, target_worksheet)
-
-            # Worksheet'i temizle
-            worksheet.clear()
-            logger.info(f"{target_worksheet} worksheet temizlendi")
-
             # Veriyi hazırla ve yükle
-            values = self._prepare_data_for_sheets(data)
-
-            # Batch update kullanarak performansı artır
-            worksheet.update(values=values, range_name='A1', value_input_option='USER_ENTERED')
+            # Ortak vektörel serializer; kod/telefon sütunları apostrofla metin kalır
+            values = dataframe_to_sheet_values(data, text_columns=SHEETS_TEXT_COLUMNS)
+
+            # Gizli tampona yaz ve takas et: zincirdeki sonraki iş (Stok → Plan)
+            # yükleme sırasında boş veya yarım sayfa görmez
+            self.config_manager.publish_worksheet_values(
+                target_worksheet, values, self.config.spreadsheet_id,
+                value_input_option='USER_ENTERED'
+            )
 
             logger.info(
                 f"{target_worksheet} worksheet güncellendi: "
@@ -258,15 +257,50 @@ class GoogleSheetsManager:
             logger.error(f"Worksheet güncelleme hatası: {e}")
             raise
 
-    def _get_or_create_worksheet(self, spreadsheet, worksheet_name: str = None):
-        """Worksheet'i getirir, yoksa oluşturur."""
+    def update_worksheets(self, frames: Dict[str, pd.DataFrame], clear_if_empty: Tuple[str, ...] = ()) -> None:
+        """Birden fazla worksheet'i tek seferde (birkaç toplu istekle) günceller.
+
+        Args:
+            frames: {worksheet_adı: DataFrame}; boş DataFrame'ler atlanır
+            clear_if_empty: Boş veri geldiğinde başlıkları korunarak temizlenecek worksheet'ler
+        """
+        payloads = {}
+        for worksheet_name, data in frames.items():
+            if not data.empty:
+                # Ortak vektörel serializer; kod/telefon sütunları apostrofla metin kalır
+                payloads[worksheet_name] = dataframe_to_sheet_values(
+                    data, text_columns=SHEETS_TEXT_COLUMNS
+                )
+            elif worksheet_name in clear_if_empty:
+                logger.warning(f"{worksheet_name} için veri yok, sadece başlıklar korunuyor")
+                payloads[worksheet_name] = []
+            else:
+                logger.warning(f"{worksheet_name} için veri yok, işlem yapılmadı")
+
+        try:
+            written = self.config_manager.publish_worksheets(
+                payloads, self.config.spreadsheet_id, value_input_option='USER_ENTERED'
+            )
+            for worksheet_name, data in frames.items():
+                if worksheet_name in written:
+                    logger.info(
+                        f"{worksheet_name} worksheet güncellendi: "
+                        f"{len(data)} satır, {len(data.columns)} sütun"
+                    )
+        except Exception as e:
+            logger.error(f"Toplu worksheet güncelleme hatası: {e}")
+            raise
+
+    def _get_or_create_worksheet(self, worksheet_name: str = None):
+        """Worksheet'i getirir (handle cache üzerinden), yoksa oluşturur."""
         target_name = worksheet_name or self.config.worksheet_name
         try:
-            worksheet = spreadsheet.worksheet(target_name)
+            worksheet = self.config_manager.get_worksheet(target_name, self.config.spreadsheet_id)
             logger.debug(f"Mevcut worksheet bulundu: {target_name}")
             return worksheet
         except:
             logger.info(f"Worksheet bulunamadı, yeni oluşturuluyor: {target_name}")
+            spreadsheet = self.config_manager.open_by_key(self.config.spreadsheet_id)
             worksheet = spreadsheet.add_worksheet(
                 title=target_name,
                 rows=1000,
@@ -274,46 +308,6 @@ class GoogleSheetsManager:
             )
             return worksheet
 
-    def _prepare_data_for_sheets(self, data: pd.DataFrame) -> List[List]:
-        """DataFrame'i Google Sheets formatına çevirir."""
-        # Başlıkları ekle
-        values = [data.columns.tolist()]
-
-        # Özel sütunların indekslerini bul
-        cari_kodu_index = None
-        kalem_no_index = None
-        telefon_index = None
-        
-        if 'Cari Kodu' in data.columns:
-            cari_kodu_index = data.columns.get_loc('Cari Kodu')
-        if 'Kalem No' in data.columns:
-            kalem_no_index = data.columns.get_loc('Kalem No')
-        if 'Telefon' in data.columns:
-            telefon_index = data.columns.get_loc('Telefon')
-
-        # Veriyi satır satır ekle, None değerleri boş string yap
-        for _, row in data.iterrows():
-            row_values = []
-            for col_index, value in enumerate(row):
-                if pd.isna(value) or value is None:
-                    row_values.append('')
-                elif col_index == cari_kodu_index:
-                    # Cari Kodu için özel işlem - text olarak formatla
-                    row_values.append(f"'{str(value)}")  # Apostrofla başlat
-                elif col_index == kalem_no_index:
-                    # Kalem No için özel işlem - büyük sayıları text olarak formatla
-                    row_values.append(f"'{str(value)}")  # Apostrofla başlat
-                elif col_index == telefon_index:
-                    # Telefon için özel işlem - text olarak formatla
-                    row_values.append(f"'{str(value)}")  # Apostrofla başlat
-                elif isinstance(value, (int, float)):
-                    row_values.append(value)
-                else:
-                    row_values.append(str(value))
-            values.append(row_values)
-
-        return values
-
 # ============================================================================
 # SEVKIYAT DATA PROCESSOR
 # ============================================================================
@@ -328,6 +322,18 @@ class SevkiyatDataProcessor:
         self.db_manager = db_manager
         self.config_manager = config_manager
         self.gc = config_manager.gc
+        # Toplu okunan Google Sheets sayfaları {sayfa_adi: DataFrame}
+        self._sheet_frames: Dict[str, pd.DataFrame] = {}
+
+    def prefetch_sheet_data(self, worksheet_names: List[str] = None) -> None:
+        """Risk ve Bekleyen sayfalarını tek values.batchGet isteğiyle (veya lokal snapshot'tan) önceden okur."""
+        worksheet_names = worksheet_names or ['Risk', 'Bekleyen']
+        # UNFORMATTED_VALUE: sayılar API'den sayı gelir, hücre bazında numericise gerekmez
+        self._sheet_frames = self.config_manager.get_worksheets_data(
+            'PRGsheet', worksheet_names, as_dataframe=True, unformatted=True,
+            use_snapshot=True
+        )
+        logger.info(f"Google Sheets toplu okuma: {list(self._sheet_frames.keys())}")
 
     def extract_cari_data(self, sevkiyat_df: pd.DataFrame) -> pd.DataFrame:
         """Sevkiyat verisinden cari bilgilerini çıkarır ve detaylandırır."""
@@ -462,11 +468,16 @@ class SevkiyatDataProcessor:
     def _get_risk_data(self) -> pd.DataFrame:
         """Google Sheets'ten Risk sayfasından veri çeker."""
         try:
-            # PRGsheet'i aç
-            spreadsheet = self.gc.open_by_key(self.config_manager.MASTER_SPREADSHEET_ID)
+            # Toplu okumada geldiyse tekrar istek atma
+            if 'Risk' in self._sheet_frames:
+                risk_df = self._sheet_frames['Risk']
+                if risk_df.empty:
+                    logger.warning("Risk sayfasında veri yok")
+                return risk_df
 
+            # PRGsheet → Risk sayfası (handle cache üzerinden)
             try:
-                risk_worksheet = spreadsheet.worksheet('Risk')
+                risk_worksheet = self.config_manager.get_worksheet('Risk')
                 risk_data = risk_worksheet.get_all_records()
 
                 if not risk_data:
@@ -532,18 +543,23 @@ class SevkiyatDataProcessor:
     def _get_bekleyen_data(self) -> pd.DataFrame:
         """PRGsheets dosyasının Bekleyen sayfasından veri okur."""
         try:
-            # Google Sheets'ten Bekleyen sayfasını oku
-            spreadsheet = self.gc.open_by_key(self.config_manager.MASTER_SPREADSHEET_ID)
+            # Toplu okumada geldiyse tekrar istek atma
+            if 'Bekleyen' in self._sheet_frames:
+                bekleyen_df = self._sheet_frames['Bekleyen']
+                if bekleyen_df.empty:
+                    logger.warning("Bekleyen sayfasında veri yok")
+                return bekleyen_df
 
+            # PRGsheet → Bekleyen sayfası (get_all_records yerine UNFORMATTED_VALUE okuma)
             try:
-                bekleyen_worksheet = spreadsheet.worksheet('Bekleyen')
-                bekleyen_data = bekleyen_worksheet.get_all_records()
+                bekleyen_df = self.config_manager.get_worksheets_data(
+                    'PRGsheet', ['Bekleyen'], as_dataframe=True, unformatted=True
+                ).get('Bekleyen')
 
-                if not bekleyen_data:
+                if bekleyen_df is None or bekleyen_df.empty:
                     logger.warning("Bekleyen sayfasında veri yok")
                     return pd.DataFrame()
 
-                bekleyen_df = pd.DataFrame(bekleyen_data)
                 logger.info(f"Bekleyen sayfasından {len(bekleyen_df)} kayıt okundu")
                 return bekleyen_df
 
@@ -880,41 +896,33 @@ class SevkiyatDataProcessor:
             raise
 
     def extract_raw_data(self) -> pd.DataFrame:
-        """SQL Server'dan ham veri çeker."""
-        with self.db_manager.get_connection() as connection:
-            try:
-                cursor = connection.cursor()
-                logger.info("Stored procedure çalıştırılıyor: sp_SiparisOperasyonlari")
-
-                # SQL sorgusunu tanımla
-                sql_query = """
-                SET NOCOUNT ON;
-                EXEC dbo.sp_SiparisOperasyonlari 0, '20230101', '20770717', 0, 0, 2, 1, 0, 0, N'', 1, N'', 0, 0, 0, 1
-                """
-
-                # SQL sorgusunu çalıştır
-                cursor.execute(sql_query)
+        """SQL Server'dan ham veri çeker (tazelik süresi içindeyse sonuç cache'inden)."""
+        try:
+            logger.info("Stored procedure çalıştırılıyor: sp_SiparisOperasyonlari")
 
-                # Sonuçları al
-                rows = cursor.fetchall()
+            # SQL sorgusunu tanımla (Stok modülüyle aynı; sonuç cache'i paylaşılır)
+            sql_query = """
+            SET NOCOUNT ON;
+            EXEC dbo.sp_SiparisOperasyonlari 0, '20230101', '20770717', 0, 0, 2, 1, 0, 0, N'', 1, N'', 0, 0, 0, 1
+            """
 
-                if not rows:
-                    logger.warning("Stored procedure'dan veri dönemedi")
-                    return pd.DataFrame()
+            df = self.config_manager.cached_query(
+                self.db_manager.config.connection_string, sql_query, query_timeout=300
+            )
 
-                # Sonuçları pandas DataFrame'e dönüştür
-                columns = [column[0] for column in cursor.description]
-                df = pd.DataFrame.from_records(rows, columns=columns)
+            if df.empty:
+                logger.warning("Stored procedure'dan veri dönemedi")
+                return pd.DataFrame()
 
-                logger.info(f"Ham veri çekildi: {len(df)} satır, {len(df.columns)} sütun")
-                return df
+            logger.info(f"Ham veri çekildi: {len(df)} satır, {len(df.columns)} sütun")
+            return df
 
-            except pyodbc.Error as e:
-                logger.error(f"SQL sorgu hatası: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"Veri çekme hatası: {e}")
-                raise
+        except pyodbc.Error as e:
+            logger.error(f"SQL sorgu hatası: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Veri çekme hatası: {e}")
+            raise
 
     def transform_data(self, raw_df: pd.DataFrame) -> pd.DataFrame:
         """Ham veriyi işler ve dönüştürür."""
@@ -1028,6 +1036,9 @@ class SevkiyatAnalyzer:
                 logger.warning("Dönüştürülmüş sevkiyat verisi boş")
                 return
 
+            # Risk ve Bekleyen sayfalarını tek istekte oku
+            self.data_processor.prefetch_sheet_data()
+
             # 3. Cari verilerini çıkar
             cari_data = self.data_processor.extract_cari_data(processed_data)
 
@@ -1043,44 +1054,18 @@ class SevkiyatAnalyzer:
             # 7. Plan verilerini oluştur
             plan_data = self.data_processor.create_plan_data()
 
-            # 8. Google Sheets'e yükle - Sevkiyat sayfası
-            self.sheets_manager.update_worksheet(processed_data, 'Sevkiyat')
-
-            # 9. Google Sheets'e yükle - Cari sayfası
-            if not cari_data.empty:
-                self.sheets_manager.update_worksheet(cari_data, 'Cari')
-                logger.info(f"Cari verileri yüklendi: {len(cari_data)} kayıt")
-            else:
-                logger.warning("Cari verileri boş, yüklenmedi")
-
-            # 10. Google Sheets'e yükle - Borc sayfası
-            if not borc_data.empty:
-                self.sheets_manager.update_worksheet(borc_data, 'Borc')
-                logger.info(f"Borç verileri yüklendi: {len(borc_data)} kayıt")
-            else:
-                logger.warning("Borç verileri boş, yüklenmedi")
-
-            # 11. Google Sheets'e yükle - Malzeme sayfası
-            if not malzeme_data.empty:
-                self.sheets_manager.update_worksheet(malzeme_data, 'Malzeme')
-                logger.info(f"Malzeme verileri yüklendi: {len(malzeme_data)} kayıt")
-            else:
-                logger.warning("Malzeme verileri boş, yüklenmedi")
-
-            # 12. Google Sheets'e yükle - Bekleyenler sayfası
-            if not bekleyenler_data.empty:
-                self.sheets_manager.update_worksheet(bekleyenler_data, 'Bekleyenler')
-                logger.info(f"Bekleyenler verileri yüklendi: {len(bekleyenler_data)} kayıt")
-            else:
-                logger.warning("Bekleyenler verileri boş, yüklenmedi")
-
-            # 13. Google Sheets'e yükle - Plan sayfası (boşsa da temizle)
-            if not plan_data.empty:
-                self.sheets_manager.update_worksheet(plan_data, 'Plan')
-                logger.info(f"Plan verileri yüklendi: {len(plan_data)} kayıt")
-            else:
-                logger.warning("Plan verileri boş, worksheet temizleniyor")
-                self.sheets_manager.update_worksheet(plan_data, 'Plan', clear_if_empty=True)
+            # 8. Tüm çıktı sayfalarını toplu istekle yükle (Plan boşsa da temizlenir)
+            self.sheets_manager.update_worksheets(
+                {
+                    'Sevkiyat': processed_data,
+                    'Cari': cari_data,
+                    'Borc': borc_data,
+                    'Malzeme': malzeme_data,
+                    'Bekleyenler': bekleyenler_data,
+                    'Plan': plan_data,
+                },
+                clear_if_empty=('Plan',)
+            )
 
             logger.info(
                 f"Sevkiyat analizi başarıyla tamamlandı: "
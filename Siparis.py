@@ -10,6 +10,9 @@ Merkezi config ve Service Account ile güvenli sipariş analizi
 - Batch processing ile performans optimizasyonu
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, get_connection_pool
+
 import pyodbc
 import logging
 from datetime import datetime, timedelta
@@ -20,9 +23,6 @@ import time
 from pathlib import Path
 import sys
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -58,8 +58,8 @@ class SiparisConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -125,7 +125,7 @@ class DatabaseManager:
         try:
             while retry_count < self.max_retries:
                 try:
-                    connection = pyodbc.connect(self.connection_string)
+                    connection = get_connection_pool(self.connection_string).acquire()
                     yield connection
                     break
 
@@ -139,7 +139,7 @@ class DatabaseManager:
         finally:
             if connection:
                 try:
-                    connection.close()
+                    get_connection_pool(self.connection_string).release(connection)
                 except Exception:
                     pass
 
@@ -170,8 +170,6 @@ class GoogleSheetsManager:
     def __init__(self, config_manager: CentralConfigManager):
         self.config_manager = config_manager
         self.gc = config_manager.gc  # Service Account ile yetkilendirilmiş client
-        self.max_retries = 3
-        self.retry_delay = 2
 
     def get_date_37_days_ago(self) -> str:
         """37 gün önceki tarihi YYYYMMDD formatında döndürür"""
@@ -180,43 +178,39 @@ class GoogleSheetsManager:
 
     def update_siparis_worksheet(self, data: pd.DataFrame) -> None:
         """Sipariş çalışma sayfasını günceller"""
-        retry_count = 0
+        # 429/5xx tekrar denemeleri ortak kota zamanlayıcısında (central_config) yapılır
+        try:
+            # PRGsheet'i doğrudan aç (Config entry'si gerekmez)
+            spreadsheet = self.gc.open_by_key(
+                self.config_manager.MASTER_SPREADSHEET_ID
+            )
 
-        while retry_count < self.max_retries:
+            from gspread.exceptions import WorksheetNotFound
             try:
-                # PRGsheet'i doğrudan aç (Config entry'si gerekmez)
-                spreadsheet = self.gc.open_by_key(
-                    self.config_manager.MASTER_SPREADSHEET_ID
-                )
-
-                try:
-                    siparis_worksheet = spreadsheet.worksheet('Siparis')
-                    siparis_worksheet.clear()
-                except:
-                    siparis_worksheet = spreadsheet.add_worksheet(title='Siparis', rows=2000, cols=25)
-
-                if not data.empty:
-                    # NaN değerleri boş string ile değiştir
-                    data_cleaned = data.fillna('')
+                siparis_worksheet = spreadsheet.worksheet('Siparis')
+            except WorksheetNotFound:
+                siparis_worksheet = spreadsheet.add_worksheet(title='Siparis', rows=2000, cols=25)
+            else:
+                # Temizleme hatası yeni sayfa açmaya değil, işin durmasına yol açmalı
+                self.config_manager.clear_worksheet(siparis_worksheet)
 
-                    # "Cari Kod" sütununu string olarak formatla (bilimsel notasyon engelle)
-                    if 'Cari Kod' in data_cleaned.columns:
-                        data_cleaned['Cari Kod'] = data_cleaned['Cari Kod'].astype(str)
+            if not data.empty:
+                # NaN değerleri boş string ile değiştir
+                data_cleaned = data.fillna('')
 
-                    # Sütun başlıklarını ve verileri hazırla
-                    values = [data_cleaned.columns.values.tolist()] + data_cleaned.values.tolist()
+                # "Cari Kod" sütununu string olarak formatla (bilimsel notasyon engelle)
+                if 'Cari Kod' in data_cleaned.columns:
+                    data_cleaned['Cari Kod'] = data_cleaned['Cari Kod'].astype(str)
 
-                    # Verileri toplu olarak güncelle (RAW: binlik ayraç eklenmez)
-                    siparis_worksheet.update(values, value_input_option='RAW')
+                # Sütun başlıklarını ve verileri hazırla
+                values = [data_cleaned.columns.values.tolist()] + data_cleaned.values.tolist()
 
-                break  # Başarılı olursa döngüden çık
+                # Verileri toplu olarak güncelle (RAW: binlik ayraç eklenmez)
+                siparis_worksheet.update(values, value_input_option='RAW')
 
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= self.max_retries:
-                    logger.error(f"Google Sheets güncelleme başarısız: {e}")
-                    raise
-                time.sleep(self.retry_delay)
+        except Exception as e:
+            logger.error(f"Google Sheets güncelleme başarısız: {e}")
+            raise
 
 # ============================================================================
 # SIPARIS ANALYZER
@@ -10,6 +10,9 @@ Merkezi config ve Service Account ile güvenli sipariş analizi
 - Batch processing ile performans optimizasyonu
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, get_connection_pool
+
 import pyodbc
 import logging
 from datetime import datetime
@@ -18,9 +21,6 @@ import pandas as pd
 from contextlib import contextmanager
 import time
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -62,7 +62,7 @@ class SiparislerConfig:
     def __init__(self):
         try:
             # Merkezi config manager olustur (Service Account otomatik baslar)
-            self.config_manager = CentralConfigManager()
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarlari yukle
             self.settings = self.config_manager.get_settings()
@@ -128,7 +128,7 @@ class DatabaseManager:
         try:
             while retry_count < self.max_retries:
                 try:
-                    connection = pyodbc.connect(self.connection_string)
+                    connection = get_connection_pool(self.connection_string).acquire()
                     yield connection
                     break
 
@@ -142,7 +142,7 @@ class DatabaseManager:
         finally:
             if connection:
                 try:
-                    connection.close()
+                    get_connection_pool(self.connection_string).release(connection)
                 except Exception as e:
                     logger.error(f"Baglanti kapatma hatasi: {e}")
 
@@ -178,8 +178,6 @@ class GoogleSheetsManager:
     def __init__(self, config_manager: CentralConfigManager):
         self.config_manager = config_manager
         self.gc = config_manager.gc  # Service Account ile yetkilendirilmis client
-        self.max_retries = 3
-        self.retry_delay = 2
 
     def get_last_two_years_start_date(self) -> str:
         """Son 2 yilin baslangic tarihini YYYYMMDD formatinda dondurur"""
@@ -189,48 +187,44 @@ class GoogleSheetsManager:
 
     def update_siparisler_worksheet(self, data: pd.DataFrame) -> None:
         """Siparisler calisma sayfasini gunceller"""
-        retry_count = 0
+        # 429/5xx tekrar denemeleri ortak kota zamanlayicisinda (central_config) yapilir
+        try:
+            # PRGsheet'i dogrudan ac (Config entry'si gerekmez)
+            spreadsheet = self.config_manager.gc.open_by_key(
+                self.config_manager.MASTER_SPREADSHEET_ID
+            )
 
-        while retry_count < self.max_retries:
+            # Siparisler sayfasini bul veya olustur
+            from gspread.exceptions import WorksheetNotFound
             try:
-                # PRGsheet'i dogrudan ac (Config entry'si gerekmez)
-                spreadsheet = self.config_manager.gc.open_by_key(
-                    self.config_manager.MASTER_SPREADSHEET_ID
+                siparisler_worksheet = spreadsheet.worksheet('Siparisler')
+            except WorksheetNotFound:
+                siparisler_worksheet = spreadsheet.add_worksheet(
+                    title='Siparisler',
+                    rows=2000,
+                    cols=25
                 )
+            else:
+                # Temizleme hatasi yeni sayfa acmaya degil, isin durmasina yol acmali
+                self.config_manager.clear_worksheet(siparisler_worksheet)
 
-                # Siparisler sayfasini bul veya olustur
-                try:
-                    siparisler_worksheet = spreadsheet.worksheet('Siparisler')
-                    siparisler_worksheet.clear()
-                except:
-                    siparisler_worksheet = spreadsheet.add_worksheet(
-                        title='Siparisler',
-                        rows=2000,
-                        cols=25
-                    )
-
-                if not data.empty:
-                    # NaN degerleri bos string ile degistir
-                    data_cleaned = data.fillna('')
-
-                    # "Cari Kod" sütununu string olarak formatla (bilimsel notasyon engelle)
-                    if 'Cari Kod' in data_cleaned.columns:
-                        data_cleaned['Cari Kod'] = data_cleaned['Cari Kod'].astype(str)
+            if not data.empty:
+                # NaN degerleri bos string ile degistir
+                data_cleaned = data.fillna('')
 
-                    # Sutun basliklarini ve verileri hazirla
-                    values = [data_cleaned.columns.values.tolist()] + data_cleaned.values.tolist()
+                # "Cari Kod" sütununu string olarak formatla (bilimsel notasyon engelle)
+                if 'Cari Kod' in data_cleaned.columns:
+                    data_cleaned['Cari Kod'] = data_cleaned['Cari Kod'].astype(str)
 
-                    # Verileri toplu olarak guncelle (RAW: binlik ayraç eklenmez)
-                    siparisler_worksheet.update(values, value_input_option='RAW')
+                # Sutun basliklarini ve verileri hazirla
+                values = [data_cleaned.columns.values.tolist()] + data_cleaned.values.tolist()
 
-                break  # Basarili olursa donguden cik
+                # Verileri toplu olarak guncelle (RAW: binlik ayraç eklenmez)
+                siparisler_worksheet.update(values, value_input_option='RAW')
 
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= self.max_retries:
-                    logger.error(f"Google Sheets guncelleme basarisiz: {e}")
-                    raise
-                time.sleep(self.retry_delay)
+        except Exception as e:
+            logger.error(f"Google Sheets guncelleme basarisiz: {e}")
+            raise
 
 # ============================================================================
 # SIPARISLER ANALYZER
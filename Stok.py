@@ -9,17 +9,19 @@ Merkezi config ve Service Account ile güvenli stok yönetim otomasyonu
 - Tüm hassas bilgiler PRGsheet'te saklanır
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, get_connection_pool
+
 import pandas as pd
 import pyodbc
 import os
 import numpy as np
 import sys
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # Pandas FutureWarning'i önlemek için ayar
 pd.set_option('future.no_silent_downcasting', True)
 
@@ -56,8 +58,8 @@ class StokConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -126,8 +128,41 @@ class GoogleSheetsYoneticisi:
         self.config = config
         self.spreadsheet_name = config.spreadsheet_name
 
-        # Service Account ile yetkilendirilmiş client'i al
-        self.gc = config.config_manager.gc
+        # Paylaşılan config manager (handle cache ve yetkilendirilmiş client)
+        self.config_manager = config.config_manager
+        self.gc = self.config_manager.gc
+
+    def sayfalari_oku(self, sayfa_adlari: list) -> dict:
+        """
+        Birden fazla sayfayı tek values.batchGet isteğiyle okur
+        (PRGsheet değişmemişse lokal snapshot cache'inden)
+
+        Args:
+            sayfa_adlari: Okunacak sayfa adları
+
+        Returns:
+            dict: {sayfa_adi: 2D liste} (okunamayan sayfalar dahil edilmez)
+        """
+        return self.config_manager.get_worksheets_data(
+            self.spreadsheet_name, sayfa_adlari, use_snapshot=True
+        )
+
+    def tipli_sayfalari_oku(self, semalar: dict) -> dict:
+        """
+        Sayfaların sadece şemadaki sütunlarını UNFORMATTED_VALUE ile tek istekte
+        okuyup şemaya göre tipler (tüm sayfa indirilmez)
+
+        Args:
+            semalar: {sayfa_adi: {sütun: tip}} (bkz. central_config.apply_sheet_schema)
+
+        Returns:
+            dict: {sayfa_adi: tiplenmiş DataFrame} (okunamayan sayfalar dahil edilmez)
+        """
+        return self.config_manager.get_columns_data(
+            self.spreadsheet_name,
+            {sayfa_adi: list(sema) for sayfa_adi, sema in semalar.items()},
+            schemas=semalar
+        )
 
     def sayfa_guncelle(self, sayfa_adi: str, data: pd.DataFrame) -> bool:
         """
@@ -150,31 +185,23 @@ class GoogleSheetsYoneticisi:
                 logger.error(f"'{sayfa_adi}' için geçersiz veri tipi: {type(data)}")
                 return False
 
-            spreadsheet = self.gc.open(self.spreadsheet_name)
-
-            # Worksheet'i güvenli oluştur/al
-            try:
-                worksheet = spreadsheet.worksheet(sayfa_adi)
-                worksheet.clear()  # Mevcut veriyi temizle
-            except:
-                # Yeni worksheet oluştur - daha büyük boyutlarla
-                worksheet = spreadsheet.add_worksheet(title=sayfa_adi, rows=5000, cols=30)
-
             if not data.empty:
-                # Veri boyutu kontrolü
-                max_rows = 4900  # Google Sheets limit'ine yakın ama güvenli
-                if len(data) > max_rows:
-                    logger.warning(f"Veri çok büyük ({len(data)} satır), ilk {max_rows} satır alınacak")
-                    data = data.head(max_rows)
-
                 # Batch güncelleme için veriyi hazırla
                 values = [data.columns.values.tolist()] + data.values.tolist()
 
-                # Güvenli güncelleme
-                worksheet.update(range_name='A1', values=values, value_input_option='RAW')
+                # Gizli tampona yaz ve takas et: okuyanlar (Plan/Stok zinciri)
+                # yükleme sırasında boş veya yarım sayfa görmez
+                self.config_manager.publish_worksheet_values(sayfa_adi, values, value_input_option='RAW')
                 return True
             else:
                 logger.warning(f"'{sayfa_adi}' sayfası için boş veri")
+                from gspread.exceptions import WorksheetNotFound
+                try:
+                    worksheet = self.config_manager.get_worksheet(sayfa_adi)
+                except WorksheetNotFound:
+                    # Sayfa hiç yoksa temizlenecek içerik de yok
+                    return False
+                self.config_manager.clear_worksheet(worksheet)
                 return False
 
         except Exception as e:
@@ -190,7 +217,8 @@ def baglanti_bilgilerini_al(config: StokConfig):
     SQL Server ERP Sistemi Bağlantı Yönetimi - Service Account Versiyonu
 
     PRGsheet'ten güvenli şekilde veritabanı bağlantı bilgilerini alır
-    ve ODBC connection oluşturur. Optimize edilmiş hata yönetimi ile.
+    ve paylaşılan havuzdan ODBC connection alır. Kullanım sonunda
+    baglantiyi_birak() ile havuza iade edilmelidir.
 
     Args:
         config: StokConfig instance (Service Account ile yüklenmiş)
@@ -198,11 +226,8 @@ def baglanti_bilgilerini_al(config: StokConfig):
     Returns:
         pyodbc.Connection: Yetkilendirilmiş veritabanı bağlantısı veya None (hata durumu)
     """
-    connection = None
     try:
-        connection_string = config.connection_string
-        connection = pyodbc.connect(connection_string)
-        return connection
+        return get_connection_pool(config.connection_string).acquire()
 
     except pyodbc.Error as e:
         logger.error(f"SQL Server bağlantı hatası: {e}")
@@ -211,6 +236,10 @@ def baglanti_bilgilerini_al(config: StokConfig):
         logger.error(f"Beklenmeyen bağlantı hatası: {e}")
         return None
 
+def baglantiyi_birak(config: StokConfig, baglanti) -> None:
+    """baglanti_bilgilerini_al() ile alınan bağlantıyı havuza iade eder"""
+    get_connection_pool(config.connection_string).release(baglanti)
+
 # ============================================================================
 # SQL DATA EXTRACTION FUNCTIONS
 # ============================================================================
@@ -262,7 +291,7 @@ def malzeme_listesini_al(config: StokConfig):
         logger.error(f"Malzeme listesi alınamadı: {e}")
         return pd.DataFrame()
     finally:
-        baglanti.close()
+        baglantiyi_birak(config, baglanti)
 
 def cari_sevkiyat_borcu_al(config: StokConfig):
     """
@@ -288,25 +317,15 @@ def cari_sevkiyat_borcu_al(config: StokConfig):
 
     Özel İşlem: SUBE ve EXC depo tipleri için 'Kalan Siparis' sıfırlanır
     """
-    baglanti = baglanti_bilgilerini_al(config)
-    if not baglanti:
-        return pd.DataFrame()
-
     try:
-        cursor = baglanti.cursor()
-
-        # Sevkiyat borcu SQL sorgusu
+        # Sevkiyat borcu SQL sorgusu (Sevkiyat modülüyle aynı; sonuç cache'i paylaşılır)
         sql_sorgusu = """
         SET NOCOUNT ON;
         EXEC dbo.sp_SiparisOperasyonlari 0, '20230101', '20770717', 0, 0, 2, 1, 0, 0, N'', 1, N'', 0, 0, 0, 1
         """
 
-        cursor.execute(sql_sorgusu)
-        satirlar = cursor.fetchall()
-
-        # DataFrame oluştur
-        sutun_isimleri = [sutun[0] for sutun in cursor.description]
-        df = pd.DataFrame.from_records(satirlar, columns=sutun_isimleri)
+        # Tazelik süresi içinde başka bir iş çalıştırdıysa SP tekrar çalıştırılmaz
+        df = config.config_manager.cached_query(config.connection_string, sql_sorgusu)
 
         # Gerekli sütunları seç ve yeniden adlandır
         df = df[['msg_S_0463', '#msg_S_0469', '#msg_S_0119',
@@ -347,8 +366,6 @@ def cari_sevkiyat_borcu_al(config: StokConfig):
     except Exception as e:
         logger.error(f"Sevkiyat borcu alınamadı: {e}")
         return pd.DataFrame()
-    finally:
-        baglanti.close()
 
 def barkod_bilgilerini_al(config: StokConfig):
     """
@@ -407,15 +424,20 @@ def barkod_bilgilerini_al(config: StokConfig):
         logger.error(f"Barkod bilgileri alınamadı: {e}")
         return pd.DataFrame()
     finally:
-        baglanti.close()
+        baglantiyi_birak(config, baglanti)
 
 # ============================================================================
 # GOOGLE SHEETS DATA FUNCTIONS
 # ============================================================================
 
+# Tipli okunan sayfaların sütun şemaları (bkz. central_config.apply_sheet_schema)
+PLAN_SEMASI = {'Malzeme Kodu': 'text', 'Adet': 'int'}
+FIYAT_SEMASI = {'SAP Kodu': 'text', 'TOPTAN': 'decimal', 'PERAKENDE': 'decimal', 'LISTE': 'decimal'}
+
 def ayar_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi):
     """
-    PRGsheets/Ayar sayfasından ayar verilerini çeker
+    PRGsheets/Ayar değerlerini tipli ayar registry'sinden alır
+    (Ayar sayfası tekrar indirilmez, settings cache kullanılır)
 
     Args:
         sheets_yoneticisi: GoogleSheetsYoneticisi instance
@@ -424,83 +446,39 @@ def ayar_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi):
         dict: Ayar verileri {'KDV': value, 'Ön Ödeme İskonto': value}
     """
     try:
-        # Google Sheets'den Ayar sayfasını oku
-        spreadsheet = sheets_yoneticisi.gc.open(sheets_yoneticisi.spreadsheet_name)
-        worksheet = spreadsheet.worksheet('Ayar')
-
-        # Veriyi liste olarak al
-        data = worksheet.get_all_values()
-
-        ayar_dict = {}
-
-        # Verileri satır satır oku ve ayar değerlerini bul
-        for row in data:
-            if len(row) >= 2:
-                key = row[0].strip()
-                value = row[1].strip()
-
-                if key == 'KDV':
-                    try:
-                        # Virgülü noktaya çevir ve float'a dönüştür
-                        value_clean = value.replace(',', '.')
-                        ayar_dict['KDV'] = float(value_clean)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"KDV değeri okunamadı ({value}): {e}")
-                        ayar_dict['KDV'] = 1.10  # Varsayılan değer
-
-                elif key == 'Ön Ödeme İskonto':
-                    try:
-                        # Virgülü noktaya çevir ve float'a dönüştür
-                        value_clean = value.replace(',', '.')
-                        ayar_dict['Ön Ödeme İskonto'] = float(value_clean)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Ön Ödeme İskonto değeri okunamadı ({value}): {e}")
-                        ayar_dict['Ön Ödeme İskonto'] = 0.90  # Varsayılan değer
-
-        # Eğer değerler bulunamadıysa varsayılan değerleri ata
-        if 'KDV' not in ayar_dict:
-            ayar_dict['KDV'] = 1.10
-        if 'Ön Ödeme İskonto' not in ayar_dict:
-            ayar_dict['Ön Ödeme İskonto'] = 0.90
-
-        return ayar_dict
+        # Tanımlı varsayılanlar: KDV=1.10, Ön Ödeme İskonto=0.90
+        return sheets_yoneticisi.config_manager.registry.get_many('KDV', 'Ön Ödeme İskonto')
 
     except Exception as e:
-        logger.warning(f"Ayar sayfası okunamadı: {e}")
+        logger.warning(f"Ayar değerleri okunamadı: {e}")
         # Varsayılan değerler döndür
         return {'KDV': 1.10, 'Ön Ödeme İskonto': 0.90}
 
-def fiyat_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi):
+def fiyat_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi, data=None):
     """
     PRGsheets/Fiyat sayfasından fiyat verilerini çeker
 
     Args:
         sheets_yoneticisi: GoogleSheetsYoneticisi instance
+        data: Önceden okunmuş, FIYAT_SEMASI ile tiplenmiş DataFrame (None ise sayfa okunur)
 
     Returns:
         pd.DataFrame: Fiyat verileri (SAP_KODU, TOPTAN, PERAKENDE, LISTE sütunları ile)
     """
     try:
-        # Google Sheets'den Fiyat sayfasını oku
-        spreadsheet = sheets_yoneticisi.gc.open(sheets_yoneticisi.spreadsheet_name)
-        worksheet = spreadsheet.worksheet('Fiyat')
+        # Google Sheets'den Fiyat sayfasını tipli oku (toplu okumada gelmediyse)
+        if data is None:
+            data = sheets_yoneticisi.tipli_sayfalari_oku({'Fiyat': FIYAT_SEMASI}).get('Fiyat')
 
-        # Veriyi liste olarak al
-        data = worksheet.get_all_values()
-
-        # Başlıkları ayır ve DataFrame oluştur
-        if len(data) > 0:
-            headers = data[0]
-            rows = data[1:] if len(data) > 1 else []
-            fiyat_df = pd.DataFrame(rows, columns=headers)
+        if data is not None and not data.empty:
+            fiyat_df = data
 
             # Gerekli sütunların varlığını kontrol et
             required_columns = ['SAP Kodu', 'TOPTAN', 'PERAKENDE', 'LISTE']
             if all(col in fiyat_df.columns for col in required_columns):
-                # Veri tipi dönüşümü
-                fiyat_df['SAP Kodu'] = fiyat_df['SAP Kodu'].astype(str)
-                for col in ['TOPTAN', 'PERAKENDE', 'LISTE']:
-                    fiyat_df[col] = pd.to_numeric(fiyat_df[col], errors='coerce').fillna(0)
+                # Sayısal sütunlar okumada decimal tiplendi; boş fiyatlar 0
+                fiyat_df = fiyat_df.copy()
+                fiyat_df[['TOPTAN', 'PERAKENDE', 'LISTE']] = fiyat_df[['TOPTAN', 'PERAKENDE', 'LISTE']].fillna(0)
 
                 return fiyat_df
             else:
@@ -515,34 +493,29 @@ def fiyat_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi):
         logger.warning(f"Fiyat sayfası okunamadı: {e}")
         return pd.DataFrame(columns=['SAP Kodu', 'TOPTAN', 'PERAKENDE', 'LISTE'])
 
-def plan_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi):
+def plan_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi, data=None):
     """
     PRGsheets/Plan sayfasından plan verilerini çeker
 
     Args:
         sheets_yoneticisi: GoogleSheetsYoneticisi instance
+        data: Önceden okunmuş, PLAN_SEMASI ile tiplenmiş DataFrame (None ise sayfa okunur)
 
     Returns:
         pd.DataFrame: Plan verileri (Malzeme Kodu ve Adet sütunları ile)
     """
     try:
-        # Google Sheets'den Plan sayfasını oku
-        spreadsheet = sheets_yoneticisi.gc.open(sheets_yoneticisi.spreadsheet_name)
-        worksheet = spreadsheet.worksheet('Plan')
+        # Google Sheets'den Plan sayfasını tipli oku (toplu okumada gelmediyse)
+        if data is None:
+            data = sheets_yoneticisi.tipli_sayfalari_oku({'Plan': PLAN_SEMASI}).get('Plan')
 
-        # Veriyi liste olarak al
-        data = worksheet.get_all_values()
+        if data is not None and not data.empty:
+            plan_df = data
 
-        # Başlıkları ayır ve DataFrame oluştur
-        if len(data) > 0:
-            headers = data[0]
-            rows = data[1:] if len(data) > 1 else []
-            plan_df = pd.DataFrame(rows, columns=headers)
-
-            # Malzeme Kodu ve Adet sütunları için veri tipi dönüşümü
+            # Sütun tipleri okumada şemayla belirlendi (metin temizliği gerekmez)
             if 'Malzeme Kodu' in plan_df.columns and 'Adet' in plan_df.columns:
-                plan_df['Malzeme Kodu'] = plan_df['Malzeme Kodu'].astype(str)
-                plan_df['Adet'] = pd.to_numeric(plan_df['Adet'], errors='coerce').fillna(0).astype(int)
+                plan_df = plan_df[['Malzeme Kodu', 'Adet']].copy()
+                plan_df['Adet'] = plan_df['Adet'].fillna(0).astype(int)
 
                 # Malzeme Kodu'na göre gruplandır ve Adet'i topla
                 plan_df = plan_df.groupby('Malzeme Kodu', as_index=False).agg({'Adet': 'sum'})
@@ -559,14 +532,12 @@ def plan_verilerini_al(sheets_yoneticisi: GoogleSheetsYoneticisi):
         logger.warning(f"Plan sayfası okunamadı: {e}")
         return pd.DataFrame(columns=['Malzeme Kodu', 'Adet'])
 
-def bekleyen_siparisleri_isle_dataframe(sheets_yoneticisi: GoogleSheetsYoneticisi, bagKodu_df):
+def bekleyen_siparisleri_isle_dataframe(sheets_yoneticisi: GoogleSheetsYoneticisi, bagKodu_df, data=None):
     try:
-        # Google Sheets'den veri çek
-        spreadsheet = sheets_yoneticisi.gc.open(sheets_yoneticisi.spreadsheet_name)
-        worksheet = spreadsheet.worksheet('Bekleyen')
-
-        # Veriyi liste olarak al
-        data = worksheet.get_all_values()
+        # Google Sheets'den veri çek (toplu okumada gelmediyse)
+        if data is None:
+            worksheet = sheets_yoneticisi.config_manager.get_worksheet('Bekleyen')
+            data = worksheet.get_all_values()
 
         # Başlıkları ayır ve DataFrame oluştur
         if len(data) > 0:
@@ -904,6 +875,40 @@ def stok_verilerini_duzenle_ve_kaydet(malzeme, bekleyen, malzeme_toplam_borc, pl
 # MAIN ORCHESTRATION
 # ============================================================================
 
+def kaynaklari_paralel_cek(kaynaklar: dict, max_workers: int = None):
+    """
+    Birbirinden bağımsız veri kaynaklarını eşzamanlı çeker (SQL + Google Sheets)
+
+    Her SQL fonksiyonu paylaşılan havuzdan kendi bağlantısını alır; Sheets
+    okumaları ortak kota zamanlayıcısından geçer. Toplam süre yaklaşık olarak
+    en yavaş tek kaynağın süresine iner.
+
+    Args:
+        kaynaklar: {kaynak_adi: parametresiz fonksiyon}
+        max_workers: Thread sayısı (None: kaynak sayısı)
+
+    Returns:
+        tuple: ({kaynak_adi: sonuç (hata durumunda None)}, {kaynak_adi: süre (sn)})
+    """
+    def calistir(ad, fonksiyon):
+        baslangic = time.perf_counter()
+        try:
+            return fonksiyon(), time.perf_counter() - baslangic
+        except Exception as e:
+            logger.error(f"     ⚠ {ad} kaynağı çekilemedi: {e}")
+            return None, time.perf_counter() - baslangic
+
+    sonuclar, sureler = {}, {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(kaynaklar) or 1,
+                            thread_name_prefix='stok-kaynak') as executor:
+        gorevler = {ad: executor.submit(calistir, ad, fonksiyon) for ad, fonksiyon in kaynaklar.items()}
+        for ad, gorev in gorevler.items():
+            sonuclar[ad], sureler[ad] = gorev.result()
+
+    for ad, sure in sorted(sureler.items(), key=lambda item: -item[1]):
+        logger.info(f"     ⏱ {ad}: {sure:.2f} sn")
+    return sonuclar, sureler
+
 def main():
     """
     [ANA KONTROLÇÜ] Stok Yönetim Sistemi Orchestration Engine - Service Account
@@ -911,12 +916,13 @@ def main():
     Tüm stok yönetimi işlemlerini belirlenen sırada koordine eder
     ve Google Sheets ile entegre final raporlama sağlar.
 
-    İşlem Akışı (Sequential Execution):
+    İşlem Akışı:
 
-    PHASE 1 - Veri Çekimi:
+    PHASE 1 - Veri Çekimi (eşzamanlı, kaynak başına süre loglanır):
       1.1. Sevkiyat borç verilerini çek (SQL SP)
       1.2. Master malzeme listesini çek (SQL)
       1.3. Barkod bilgilerini çek (SQL JOIN)
+      1.4. Google Sheets kaynakları (Bekleyen, Plan, Fiyat)
 
     PHASE 2 - Veri İşleme:
       2.1. Toplam borç hesaplama (GROUP BY malzeme)
@@ -955,25 +961,48 @@ def main():
             logger.error(f"Google Sheets baglantisi kurulamadi: {e}")
             sheets_yoneticisi = None
 
-        # PHASE 1: ERP SİSTEMİNDEN VERİ ÇEKİMİ
-        logger.info("PHASE 1: ERP sisteminden master data çekimi başlatılıyor...")
+        # PHASE 1: ERP VE GOOGLE SHEETS KAYNAKLARINDAN VERİ ÇEKİMİ
+        logger.info("PHASE 1: ERP ve Google Sheets kaynakları eşzamanlı çekiliyor...")
         logger.info("-" * 60)
 
-        # 1.1. Sevkiyat borç analizi (Stored Procedure)
-        logger.info("1.1. Sevkiyat borç analizi çalıştırılıyor (SP)...")
-        cari_sevkiyat_df = cari_sevkiyat_borcu_al(config)
+        # SQL sorguları ve Sheets okumaları birbirinden bağımsız (I/O bekler)
+        kaynaklar = {
+            'Sevkiyat borcu (SP)': lambda: cari_sevkiyat_borcu_al(config),
+            'Malzeme listesi': lambda: malzeme_listesini_al(config),
+            'Barkod eşleştirme': lambda: barkod_bilgilerini_al(config),
+        }
+        if sheets_yoneticisi:
+            kaynaklar['Sheets: Bekleyen'] = lambda: sheets_yoneticisi.sayfalari_oku(['Bekleyen'])
+            # Plan ve Fiyat tipli okunur (UNFORMATTED_VALUE + şema)
+            kaynaklar['Sheets: Plan, Fiyat'] = lambda: sheets_yoneticisi.tipli_sayfalari_oku(
+                {'Plan': PLAN_SEMASI, 'Fiyat': FIYAT_SEMASI}
+            )
+
+        baslangic = time.perf_counter()
+        sonuclar, _ = kaynaklari_paralel_cek(kaynaklar)
+        logger.info(f"     ✓ Phase 1 toplam: {time.perf_counter() - baslangic:.2f} sn")
+
+        cari_sevkiyat_df = sonuclar['Sevkiyat borcu (SP)']
+        if cari_sevkiyat_df is None:
+            cari_sevkiyat_df = pd.DataFrame()
         logger.info(f"     ✓ Sevkiyat borç kayıtları: {len(cari_sevkiyat_df):,}")
 
-        # 1.2. Master malzeme listesi (STOKLAR_CHOOSE_3A)
-        logger.info("1.2. Master malzeme listesi çekiliyor...")
-        malzeme_df = malzeme_listesini_al(config)
+        malzeme_df = sonuclar['Malzeme listesi']
+        if malzeme_df is None:
+            malzeme_df = pd.DataFrame()
         logger.info(f"     ✓ Malzeme master kayıtları: {len(malzeme_df):,}")
 
-        # 1.3. Barkod-malzeme eşleştirme matrisi
-        logger.info("1.3. Barkod eşleştirme matrisi çekiliyor...")
-        barkod_df = barkod_bilgilerini_al(config)
+        barkod_df = sonuclar['Barkod eşleştirme']
+        if barkod_df is None:
+            barkod_df = pd.DataFrame()
         logger.info(f"     ✓ Barkod eşleştirme kayıtları: {len(barkod_df):,}")
 
+        sayfa_verileri = {}
+        for ad in ('Sheets: Bekleyen', 'Sheets: Plan, Fiyat'):
+            sayfa_verileri.update(sonuclar.get(ad) or {})
+        if sheets_yoneticisi:
+            logger.info(f"     ✓ Google Sheets toplu okuma: {len(sayfa_verileri)} sayfa")
+
         # PHASE 2: VERİ İŞLEME VE HESAPLAMALAR
         logger.info("")
         logger.info("PHASE 2: Veri işleme ve business logic hesaplamaları...")
@@ -995,7 +1024,9 @@ def main():
 
         if sheets_yoneticisi and not barkod_df.empty:
             try:
-                bekleyen_df = bekleyen_siparisleri_isle_dataframe(sheets_yoneticisi, barkod_df)
+                bekleyen_df = bekleyen_siparisleri_isle_dataframe(
+                    sheets_yoneticisi, barkod_df, sayfa_verileri.get('Bekleyen')
+                )
                 logger.info(f"     ✓ Bekleyen sipariş kayıtları: {len(bekleyen_df):,}")
             except Exception as e:
                 logger.warning(f"     ⚠ PRGsheets/Bekleyen sayfası okunamadı: {e}")
@@ -1028,7 +1059,7 @@ def main():
         plan_df = pd.DataFrame(columns=['Malzeme Kodu', 'Adet'])
         if sheets_yoneticisi:
             try:
-                plan_df = plan_verilerini_al(sheets_yoneticisi)
+                plan_df = plan_verilerini_al(sheets_yoneticisi, sayfa_verileri.get('Plan'))
                 logger.info(f"     ✓ Plan verisi yüklendi: {len(plan_df):,} kayıt")
             except Exception as e:
                 logger.warning(f"     ⚠ Plan verisi okuma hatası: {e}")
@@ -1039,7 +1070,7 @@ def main():
         liste_df = pd.DataFrame(columns=['SAP Kodu', 'TOPTAN', 'PERAKENDE', 'LISTE'])
         if sheets_yoneticisi:
             try:
-                liste_df = fiyat_verilerini_al(sheets_yoneticisi)
+                liste_df = fiyat_verilerini_al(sheets_yoneticisi, sayfa_verileri.get('Fiyat'))
                 logger.info(f"     ✓ Fiyat listesi yüklendi: {len(liste_df):,} kayıt")
             except Exception as e:
                 logger.warning(f"     ⚠ Fiyat verisi okuma hatası: {e}")
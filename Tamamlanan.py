@@ -9,6 +9,9 @@ Merkezi config ve Service Account ile güvenli tamamlanan sipariş analizi
 - Tüm hassas bilgiler PRGsheet'te saklanır
 """
 
+# Merkezi config manager'ı ağır bağımlılıklardan önce import et (--import-profile)
+from central_config import CentralConfigManager, dataframe_to_sheet_values, get_connection_pool
+
 import pyodbc
 import logging
 from datetime import datetime
@@ -18,9 +21,6 @@ import pandas as pd
 from pathlib import Path
 import sys
 
-# Merkezi config manager'ı import et
-from central_config import CentralConfigManager
-
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -56,8 +56,8 @@ class TamamlananConfig:
 
     def __init__(self):
         try:
-            # Merkezi config manager oluştur (Service Account otomatik başlar)
-            self.config_manager = CentralConfigManager()
+            # Paylaşılan merkezi config manager (Service Account ilk Sheets çağrısında yetkilendirilir)
+            self.config_manager = CentralConfigManager.shared()
 
             # PRGsheet'ten ayarları yükle
             self.settings = self.config_manager.get_settings()
@@ -115,14 +115,14 @@ class DatabaseManager:
         """Context manager ile güvenli bağlantı yönetimi"""
         connection = None
         try:
-            connection = pyodbc.connect(self.connection_string)
+            connection = get_connection_pool(self.connection_string).acquire()
             yield connection
         except pyodbc.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
         finally:
             if connection:
-                connection.close()
+                get_connection_pool(self.connection_string).release(connection)
 
     def execute_query(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
         """
@@ -169,30 +169,6 @@ class GoogleSheetsManager:
         self.config_manager = config_manager
         self.gc = config_manager.gc  # Service Account ile yetkilendirilmiş client
 
-    def _clean_dataframe_for_json(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean DataFrame for JSON serialization"""
-        df_clean = df.copy()
-        df_clean = df_clean.fillna('')
-
-        for col in df_clean.columns:
-            if df_clean[col].dtype == 'datetime64[ns]':
-                df_clean[col] = df_clean[col].astype(str).replace('NaT', '')
-            elif df_clean[col].dtype in ['float64', 'float32']:
-                df_clean[col] = df_clean[col].replace([float('inf'), float('-inf')], '')
-                df_clean[col] = df_clean[col].astype(str).replace('nan', '').replace('NaN', '')
-            elif df_clean[col].dtype in ['int64', 'int32']:
-                df_clean[col] = df_clean[col].astype(str)
-            else:
-                df_clean[col] = df_clean[col].astype(str).replace('nan', '').replace('NaN', '').replace('None', '')
-
-        # Final cleanup
-        for col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(
-                lambda x: '' if str(x) in ['nan', 'NaN', 'None', 'NaT'] else str(x)
-            )
-
-        return df_clean
-
     def save_to_worksheet(self, df: pd.DataFrame, worksheet_name: str) -> None:
         """Save DataFrame to Google Sheets worksheet"""
         try:
@@ -203,21 +179,18 @@ class GoogleSheetsManager:
 
             try:
                 worksheet = spreadsheet.worksheet(worksheet_name)
-                worksheet.clear()
             except:
                 worksheet = spreadsheet.add_worksheet(title=worksheet_name, rows=1000, cols=20)
 
             if not df.empty:
-                # Clean data for JSON serialization
-                df_clean = self._clean_dataframe_for_json(df)
-
-                # "sip_musteri_kod" sütununu string olarak formatla (bilimsel notasyon engelle)
-                if 'sip_musteri_kod' in df_clean.columns:
-                    df_clean['sip_musteri_kod'] = df_clean['sip_musteri_kod'].astype(str)
-
-                values = [df_clean.columns.values.tolist()] + df_clean.values.tolist()
+                # Ortak serializer: tüm hücreler metin (sip_musteri_kod dahil,
+                # bilimsel notasyon oluşmaz), NaN/NaT/None boş
+                values = dataframe_to_sheet_values(df, as_text=True)
                 # RAW: binlik ayraç eklenmez, veri olduğu gibi yazılır
-                worksheet.update(values, value_input_option='RAW')
+                self.config_manager.write_worksheet_values(worksheet, values, value_input_option='RAW')
+            else:
+                # Veri yoksa eski içerik kalmasın
+                self.config_manager.clear_worksheet(worksheet)
 
         except Exception as e:
             logger.error(f"{worksheet_name} worksheet güncelleme hatası: {e}")
@@ -225,22 +198,14 @@ class GoogleSheetsManager:
 
     def _get_sip_tarih_from_ayar(self) -> str:
         """
-        Ayar sayfasından sip_tarih değerini oku
+        Ayar registry'sinden sip_tarih değerini oku (sayfa tekrar indirilmez)
 
         Returns:
             str: sip_tarih değeri (örn: '2023-09-01')
         """
         try:
-            spreadsheet = self.gc.open_by_key(self.config_manager.MASTER_SPREADSHEET_ID)
-            sheet = spreadsheet.worksheet('Ayar')
-            config = {row[0]: row[1] for row in sheet.get_all_values() if len(row) >= 2}
-
-            # Kayıtlı sip_tarih değerini kullan
-            if 'sip_tarih' in config and config['sip_tarih']:
-                return config['sip_tarih']
-            else:
-                # Varsayılan olarak 2023-09-01
-                return '2023-09-01'
+            # Kayıtlı sip_tarih değerini kullan (varsayılan 2023-09-01)
+            return self.config_manager.registry.get('sip_tarih').strftime('%Y-%m-%d')
         except Exception:
             # Hata durumunda varsayılan değer
             return '2023-09-01'
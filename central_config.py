@@ -22,17 +22,75 @@ Kullanım Örnekleri:
     settings = manager.get_settings()
     sql_server = settings.get('SQL_SERVER')
     etiket_url = settings.get('Etiket_ETIKET_BASLIK_URL')
+
+    # 4. Süreç genelinde paylaşılan manager (tek yetkilendirme)
+    manager = CentralConfigManager.shared()
+
+    # 5. Worksheet handle'ı (TTL'li cache, tekrar metadata çağrısı yapmaz)
+    bekleyen = manager.get_worksheet('Bekleyen')
+
+    # 6. Birden fazla sayfayı tek istekte, değişmemişse lokal snapshot'tan oku
+    data = manager.get_worksheets_data('PRGsheet', ['Plan', 'Fiyat'], use_snapshot=True)
+
+    # 7. GUI istekleri batch işlerin önüne geçsin (ortak kota zamanlayıcısı)
+    with CentralConfigManager.scheduler.priority('interactive'):
+        data = manager.get_worksheet_data('PRGsheet', 'Hedef')
+
+    # 8. Sadece değişen satırları yaz (clear() + tam yazım yerine)
+    manager.write_worksheet_values(worksheet, values, value_input_option='RAW')
+
+    # 9. Gizli tampona yazıp tek batchUpdate ile takas et (boş sayfa penceresi yok)
+    manager.publish_worksheet_values('Stok', values)
+
+    # 10. Birden fazla sayfayı birkaç toplu istekle yayınla
+    manager.publish_worksheets({'Cari': cari_values, 'Plan': plan_values})
+
+    # 11. Sadece gereken sütunları oku (başlık → sütun harfi cache'li)
+    plan = manager.get_columns_data('PRGsheet', {'Plan': ['Malzeme Kodu', 'Adet']})['Plan']
+
+    # 12. Paylaşılan SQL Server bağlantı havuzu (tüm DatabaseManager'lar ortak kullanır)
+    with pooled_connection(connection_string, query_timeout=300) as connection:
+        cursor = connection.cursor()
+
+    # 13. Pahalı SP sonuçlarını işler arasında paylaş (SQL_CACHE_SURESI saniye)
+    df = manager.cached_query(connection_string, "EXEC dbo.sp_SiparisOperasyonlari ...")
+
+Açılış Süresi:
+    gspread, google-auth ve cryptography ilk kullanımda import edilir. Bir
+    giriş noktasının import maliyetini görmek için `--import-profile` ile
+    çalıştırın; rapor logs/import_profile_<script>.txt dosyasına yazılır.
+
+Sheets Çağrı Ölçümü:
+    `--sheets-metrics` ile (veya CentralConfigManager.enable_call_metrics())
+    her Sheets/Drive çağrısı kaydedilir; iş özeti logs/sheets_calls_<script>.json.
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
+from __future__ import annotations
+
 import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Union
 import logging
 import json
-from cryptography.fernet import Fernet
+import zlib
+import hashlib
+import random
+import re
+from contextlib import contextmanager
+from urllib.parse import urlparse, unquote
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Tuple, TYPE_CHECKING
+import builtins
+import atexit
+
+if TYPE_CHECKING:
+    import gspread
+    import pandas as pd
+    from cryptography.fernet import Fernet
 
 # Logging ayarları
 logging.basicConfig(
@@ -42,6 +100,100 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# IMPORT PROFİLİ (--import-profile)
+# ============================================================================
+
+class ImportProfiler:
+    """
+    Modül import sürelerini ölç (PyInstaller exe'lerinde de çalışır)
+
+    builtins.__import__ sarmalanır; her yeni modül için toplam (alt importlar
+    dahil) ve kendi süresi kaydedilir. Rapor süreç kapanırken yazılır.
+    """
+
+    def __init__(self, entry_point: str):
+        self.entry_point = entry_point
+        self.records = []
+        self._local = threading.local()
+        self._original_import = None
+        self._started = None
+
+    def install(self):
+        self._original_import = builtins.__import__
+        self._started = time.perf_counter()
+        builtins.__import__ = self._import
+        atexit.register(self.report)
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Relative import ve zaten yüklü modüller ölçülmez
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.records.append((name, elapsed, elapsed - children, len(stack)))
+
+    def report(self, top: int = 30) -> str:
+        """Raporu logs/import_profile_<entry>.txt dosyasına ve stderr'e yaz"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+
+        top_level = sum(elapsed for _, elapsed, _, depth in self.records if depth == 0)
+        lines = [
+            f"Import profili: {self.entry_point}",
+            f"Toplam import süresi: {top_level * 1000:.0f} ms "
+            f"(çalışma süresi: {(time.perf_counter() - self._started) * 1000:.0f} ms)",
+            "",
+            f"{'toplam ms':>10} {'kendi ms':>10}  modül",
+        ]
+        for name, elapsed, own, depth in sorted(self.records, key=lambda r: r[1], reverse=True)[:top]:
+            lines.append(f"{elapsed * 1000:10.1f} {own * 1000:10.1f}  {'  ' * depth}{name}")
+        text = "\n".join(lines)
+
+        try:
+            log_dir = Path(_entry_base_dir()) / 'logs'
+            log_dir.mkdir(exist_ok=True)
+            (log_dir / f"import_profile_{self.entry_point}.txt").write_text(text, encoding='utf-8')
+        except Exception as e:
+            logger.warning(f"Import profili yazılamadı: {e}")
+        if sys.stderr:
+            print(text, file=sys.stderr)
+        return text
+
+
+def _entry_base_dir() -> str:
+    """Giriş noktasının dizini (PyInstaller desteğiyle)"""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def _install_import_profiler_if_requested() -> Optional[ImportProfiler]:
+    """`--import-profile` argümanı varsa profiler'ı kur ve argümanı sys.argv'den çıkar"""
+    if '--import-profile' not in sys.argv:
+        return None
+    sys.argv.remove('--import-profile')
+    entry_point = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else 'interactive'
+    profiler = ImportProfiler(entry_point)
+    profiler.install()
+    return profiler
+
+
+import_profiler = _install_import_profiler_if_requested()
+
+# `--sheets-metrics`: Sheets çağrı enstrümantasyonunu aç (bkz. SheetsCallRecorder)
+_SHEETS_METRICS_REQUESTED = '--sheets-metrics' in sys.argv
+if _SHEETS_METRICS_REQUESTED:
+    sys.argv.remove('--sheets-metrics')
 
 
 # ============================================================================
@@ -49,20 +201,38 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 class SettingsCache:
-    """Ayarları şifreli olarak lokal cache'e kaydet/yükle"""
+    """
+    Ayarları şifreli olarak lokal cache'e kaydet/yükle
+
+    Cache, ayarlarla birlikte PRGsheet'in Drive revizyonunu (modifiedTime) ve
+    son kontrol zamanını saklar; böylece cache'in güncelliği ucuz bir metadata
+    çağrısıyla doğrulanabilir.
+    """
 
     def __init__(self, base_dir: str):
         self.base_dir = base_dir
         self.key_file = os.path.join(base_dir, '.settings_key')
         self.cache_file = os.path.join(base_dir, '.settings_cache')
-        self._init_encryption_key()
+        self._cipher = None
+        self._cipher_lock = threading.Lock()
+
+    @property
+    def cipher(self) -> Fernet:
+        """Fernet nesnesi (cryptography ilk şifreleme/çözmede import edilir)"""
+        if self._cipher is None:
+            with self._cipher_lock:
+                if self._cipher is None:
+                    self._init_encryption_key()
+        return self._cipher
 
     def _init_encryption_key(self):
+        from cryptography.fernet import Fernet
+
         if os.path.exists(self.key_file):
             try:
                 with open(self.key_file, 'rb') as f:
                     self.key = f.read()
-                self.cipher = Fernet(self.key)
+                self._cipher = Fernet(self.key)
                 logger.info("Encryption key loaded")
             except:
                 self._create_new_key()
@@ -70,38 +240,66 @@ class SettingsCache:
             self._create_new_key()
 
     def _create_new_key(self):
+        from cryptography.fernet import Fernet
+
         self.key = Fernet.generate_key()
-        self.cipher = Fernet(self.key)
+        self._cipher = Fernet(self.key)
         try:
             with open(self.key_file, 'wb') as f:
                 f.write(self.key)
         except Exception as e:
             logger.warning(f"Key save error: {e}")
 
-    def save(self, settings: Dict[str, str]) -> bool:
+    def save(self, settings: Dict[str, str], revision: Optional[str] = None,
+             checked_at: Optional[float] = None, fallback: Optional[Dict[str, str]] = None) -> bool:
         try:
-            json_data = json.dumps(settings, ensure_ascii=False)
+            payload = {
+                'settings': settings,
+                'meta': {
+                    'revision': revision,
+                    'checked_at': time.time() if checked_at is None else checked_at,
+                    # App'ten bağımsız anahtar → değer haritası (eski okuyucular)
+                    'fallback': fallback or {},
+                },
+            }
+            json_data = json.dumps(payload, ensure_ascii=False)
             encrypted = self.cipher.encrypt(json_data.encode('utf-8'))
             with open(self.cache_file, 'wb') as f:
                 f.write(encrypted)
-            logger.info(f"{len(settings)} settings cached")
+            logger.info(f"{len(settings)} settings cached (revision: {revision})")
             return True
         except Exception as e:
             logger.warning(f"Cache save error: {e}")
             return False
 
-    def load(self) -> Optional[Dict[str, str]]:
+    def load_entry(self) -> Tuple[Optional[Dict[str, str]], Dict[str, Any]]:
+        """
+        Ayarları revizyon bilgisiyle birlikte yükle
+
+        Returns:
+            (settings veya None, {'revision': ..., 'checked_at': ..., 'fallback': {...}})
+        """
+        empty_meta = {'revision': None, 'checked_at': 0}
         if not os.path.exists(self.cache_file):
-            return None
+            return None, empty_meta
         try:
             with open(self.cache_file, 'rb') as f:
                 encrypted = f.read()
             decrypted = self.cipher.decrypt(encrypted)
-            settings = json.loads(decrypted.decode('utf-8'))
+            payload = json.loads(decrypted.decode('utf-8'))
+
+            # Eski format: doğrudan ayar sözlüğü (revizyon bilgisi yok)
+            if 'settings' not in payload or 'meta' not in payload:
+                return payload, empty_meta
+
+            settings = payload['settings']
             logger.info(f"{len(settings)} settings loaded from cache")
-            return settings
+            return settings, {**empty_meta, **payload['meta']}
         except:
-            return None
+            return None, empty_meta
+
+    def load(self) -> Optional[Dict[str, str]]:
+        return self.load_entry()[0]
 
     def clear(self):
         try:
@@ -110,6 +308,1080 @@ class SettingsCache:
         except:
             pass
 
+class WorksheetSnapshotCache:
+    """
+    Worksheet verilerini şifreli + sıkıştırılmış olarak lokal diskte sakla
+
+    SettingsCache ile aynı Fernet anahtarını kullanır (ilk kullanımda yüklenir). Her snapshot
+    (spreadsheet ID, worksheet/aralık) ile anahtarlanır ve yazıldığı andaki
+    revizyonu (Drive revizyonu veya worksheet yazım damgası) taşır; revizyon
+    değişmişse snapshot kullanılmaz.
+    Toplam boyut max_bytes'ı aşarsa en uzun süredir kullanılmayanlar silinir (LRU).
+    """
+
+    def __init__(self, base_dir: str, key_cache: SettingsCache, max_bytes: int):
+        self.cache_dir = os.path.join(base_dir, '.sheet_snapshots')
+        self.key_cache = key_cache
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def cipher(self) -> Fernet:
+        return self.key_cache.cipher
+
+    def _path(self, spreadsheet_id: str, worksheet: str) -> str:
+        digest = hashlib.sha1(f"{spreadsheet_id}|{worksheet}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.snap")
+
+    def load(self, spreadsheet_id: str, worksheet: str, revision: str) -> Optional[List[List]]:
+        """Revizyonu eşleşen snapshot'ı yükle (yoksa/eskiyse None)"""
+        if not revision:
+            return None
+        path = self._path(spreadsheet_id, worksheet)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                payload = json.loads(zlib.decompress(self.cipher.decrypt(f.read())).decode('utf-8'))
+            if payload.get('revision') != revision:
+                return None
+            # LRU: son kullanım zamanını güncelle
+            os.utime(path, None)
+            logger.info(f"Snapshot kullanıldı: {worksheet} ({len(payload['values'])} satır)")
+            return payload['values']
+        except Exception as e:
+            logger.warning(f"Snapshot okuma hatası ({worksheet}): {e}")
+            return None
+
+    def save(self, spreadsheet_id: str, worksheet: str, revision: str, values: List[List]) -> bool:
+        """Snapshot'ı atomik olarak yaz ve boyut sınırını uygula"""
+        if not revision:
+            return False
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = {
+                'spreadsheet_id': spreadsheet_id,
+                'worksheet': worksheet,
+                'revision': revision,
+                'values': values,
+            }
+            data = self.cipher.encrypt(
+                zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'), 6)
+            )
+            path = self._path(spreadsheet_id, worksheet)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._evict()
+            return True
+        except Exception as e:
+            logger.warning(f"Snapshot kaydetme hatası ({worksheet}): {e}")
+            return False
+
+    def _evict(self):
+        """Toplam boyut sınırı aşıldıysa en eski kullanılan snapshot'ları sil"""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.snap'):
+                    path = os.path.join(self.cache_dir, name)
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def invalidate(self, spreadsheet_id: str, worksheet: str):
+        try:
+            os.remove(self._path(spreadsheet_id, worksheet))
+        except OSError:
+            pass
+
+    def clear(self):
+        try:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.snap'):
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
+
+
+class PublishManifest:
+    """
+    Yayınlanan worksheet içeriklerinin parmak izlerini lokal manifest'te sakla
+
+    Her kayıt (spreadsheet ID, worksheet adı) ile anahtarlanır ve yazıldığı
+    sheetId'yi taşır; sayfa silinip yeniden oluşturulduysa eşleşme olmaz.
+    Spreadsheet revizyonu diğer sayfaların yazımıyla da değiştiğinden
+    karşılaştırma sadece içerik parmak izine dayanır.
+    """
+
+    def __init__(self, base_dir: str):
+        self.manifest_file = os.path.join(base_dir, '.publish_manifest.json')
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        try:
+            tmp_path = f"{self.manifest_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.manifest_file)
+        except OSError as e:
+            logger.warning(f"Publish manifest kaydetme hatası: {e}")
+
+    def matches(self, spreadsheet_id: str, worksheet: str, sheet_id: int, fingerprint: str) -> bool:
+        """Son yayın aynı sayfaya aynı içerikle mi yapıldı"""
+        with self._lock:
+            entry = self._load().get(f"{spreadsheet_id}|{worksheet}")
+        return bool(entry) and entry.get('fingerprint') == fingerprint and entry.get('sheet_id') == sheet_id
+
+    def record(self, spreadsheet_id: str, worksheet: str, sheet_id: int, fingerprint: str):
+        with self._lock:
+            self._load()[f"{spreadsheet_id}|{worksheet}"] = {
+                'fingerprint': fingerprint,
+                'sheet_id': sheet_id,
+                'published_at': time.time(),
+            }
+            self._save()
+
+    def forget(self, spreadsheet_id: str, worksheet: str):
+        with self._lock:
+            if self._load().pop(f"{spreadsheet_id}|{worksheet}", None) is not None:
+                self._save()
+
+
+class QueryResultCache:
+    """
+    Pahalı SQL sorgularının (stored procedure) sonuçlarını lokal diskte sakla
+
+    Sonuçlar sütun bazlı (her sütun tek liste) tutulur, zlib ile sıkıştırılır ve
+    SettingsCache'in Fernet anahtarıyla şifrelenir; dosyalar atomik yazılır.
+    Anahtar; bağlantı dizesi, boşlukları sadeleştirilmiş SQL ve parametrelerden
+    üretilir. max_age saniyeden eski sonuçlar kullanılmaz.
+    """
+
+    def __init__(self, base_dir: str, key_cache: SettingsCache):
+        self.cache_dir = os.path.join(base_dir, '.query_cache')
+        self.key_cache = key_cache
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    @property
+    def cipher(self) -> Fernet:
+        return self.key_cache.cipher
+
+    @staticmethod
+    def make_key(connection_string: str, sql: str, params: tuple = ()) -> str:
+        normalized = ' '.join(sql.split())
+        return hashlib.sha256(
+            f"{connection_string}|{normalized}|{params!r}".encode('utf-8')
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.qc")
+
+    def key_lock(self, key: str) -> threading.Lock:
+        """Aynı sorgunun süreç içinde eşzamanlı iki kez çalışmasını önleyen kilit"""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def load(self, key: str, max_age: float) -> Optional[Tuple[List[str], List[list]]]:
+        """Taze sonucu yükle: (sütun adları, sütun listeleri) veya None"""
+        path = self._path(key)
+        try:
+            if max_age <= 0 or time.time() - os.path.getmtime(path) > max_age:
+                return None
+            import pickle
+            with open(path, 'rb') as f:
+                payload = pickle.loads(zlib.decompress(self.cipher.decrypt(f.read())))
+            if payload.get('key') != key or time.time() - payload['created_at'] > max_age:
+                return None
+            return payload['columns'], payload['data']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Sorgu cache okuma hatası: {e}")
+            return None
+
+    def save(self, key: str, columns: List[str], data: List[list]) -> bool:
+        """Sütun bazlı sonucu atomik olarak yaz"""
+        try:
+            import pickle
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = {'key': key, 'created_at': time.time(), 'columns': columns, 'data': data}
+            encrypted = self.cipher.encrypt(
+                zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), 6)
+            )
+            path = self._path(key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(encrypted)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.warning(f"Sorgu cache kaydetme hatası: {e}")
+            return False
+
+    def invalidate(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        try:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.qc'):
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
+
+
+# ============================================================================
+# SHEETS API KOTA ZAMANLAYICISI
+# ============================================================================
+
+class SheetsRequestScheduler:
+    """
+    Tüm Sheets/Drive isteklerini ortak kota üzerinden geçiren zamanlayıcı
+
+    - Token bucket: dakikada requests_per_minute istek (proje kotası)
+    - Öncelik sınıfları: 'interactive' (GUI) ve 'batch' (zamanlanmış işler);
+      batch istekleri kovanın interactive_reserve kadarlık kısmını kullanamaz
+    - 429 ve 5xx yanıtlarında jitter'lı üstel backoff ile tekrar deneme
+    - get_metrics() ile istek/bekleme/tekrar sayaçları
+
+    Örnek:
+        scheduler = CentralConfigManager.scheduler
+        with scheduler.priority('interactive'):
+            worksheet.get_all_values()
+    """
+
+    PRIORITIES = ('interactive', 'batch')
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        requests_per_minute: int = 60,
+        interactive_reserve: float = 0.2,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 64.0
+    ):
+        self.capacity = float(requests_per_minute)
+        self.refill_rate = requests_per_minute / 60.0
+        self.reserve = self.capacity * interactive_reserve
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._metrics = {
+            'requests': 0,
+            'retries': 0,
+            'failures': 0,
+            'throttled': 0,
+            'wait_seconds': 0.0,
+            'by_priority': {name: 0 for name in self.PRIORITIES},
+            'by_status': {},
+        }
+
+    @contextmanager
+    def priority(self, name: str):
+        """Bu thread'deki istekler için öncelik sınıfını geçici olarak değiştir"""
+        if name not in self.PRIORITIES:
+            raise ValueError(f"Geçersiz öncelik: {name}")
+        previous = getattr(self._local, 'priority', None)
+        self._local.priority = name
+        try:
+            yield self
+        finally:
+            self._local.priority = previous
+
+    def current_priority(self) -> str:
+        return getattr(self._local, 'priority', None) or 'batch'
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+        self._last_refill = now
+
+    def acquire(self, priority: str = None) -> float:
+        """
+        Kovadan bir token al (gerekirse bekler)
+
+        Returns:
+            Beklenen süre (saniye)
+        """
+        priority = priority or self.current_priority()
+        floor = 1.0 if priority == 'interactive' else 1.0 + self.reserve
+        waited = 0.0
+
+        with self._condition:
+            self._refill()
+            while self._tokens < floor:
+                delay = (floor - self._tokens) / self.refill_rate
+                self._condition.wait(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= 1.0
+
+            self._metrics['requests'] += 1
+            self._metrics['by_priority'][priority] += 1
+            if waited:
+                self._metrics['throttled'] += 1
+                self._metrics['wait_seconds'] += waited
+        return waited
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Jitter'lı üstel bekleme süresi (full jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def run(self, func, priority: str = None):
+        """
+        İsteği kota ve tekrar deneme kurallarıyla çalıştır
+
+        Args:
+            func: Argümansız çağrılabilir (HTTP isteği)
+            priority: 'interactive' veya 'batch' (None ise thread önceliği)
+        """
+        attempt = 0
+        while True:
+            self.acquire(priority)
+            try:
+                return func()
+            except _gspread().exceptions.APIError as e:
+                status = _api_error_status(e)
+                with self._condition:
+                    by_status = self._metrics['by_status']
+                    by_status[status] = by_status.get(status, 0) + 1
+
+                if status not in self.RETRYABLE_STATUS or attempt >= self.max_retries:
+                    with self._condition:
+                        self._metrics['failures'] += 1
+                    raise
+
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                with self._condition:
+                    self._metrics['retries'] += 1
+                    # 429: kovayı boşalt, diğer thread'ler de yavaşlasın
+                    if status == 429:
+                        self._tokens = min(self._tokens, 0.0)
+                logger.warning(f"Sheets API {status}, {delay:.1f} sn sonra tekrar (deneme {attempt})")
+                time.sleep(delay)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Zamanlayıcı sayaçlarının kopyasını döndür"""
+        with self._condition:
+            self._refill()
+            return {
+                **self._metrics,
+                'by_priority': dict(self._metrics['by_priority']),
+                'by_status': dict(self._metrics['by_status']),
+                'tokens_available': round(self._tokens, 2),
+            }
+
+
+def _api_error_status(error: Exception) -> Optional[int]:
+    """gspread APIError'dan HTTP durum kodunu çıkar"""
+    code = getattr(error, 'code', None)
+    if isinstance(code, int):
+        return code
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+
+def _gspread():
+    """gspread'i ilk Sheets çağrısında import et"""
+    import gspread
+    return gspread
+
+
+_scheduled_http_client = None
+
+
+def scheduled_http_client(scheduler: SheetsRequestScheduler):
+    """
+    Tüm istekleri scheduler üzerinden gönderen gspread HTTP client sınıfı
+
+    Sınıf gspread import edildikten sonra (ilk yetkilendirmede) bir kez oluşturulur.
+    """
+    global _scheduled_http_client
+    if _scheduled_http_client is None:
+        from gspread.http_client import HTTPClient
+
+        class ScheduledHTTPClient(HTTPClient):
+            def request(self, method, endpoint, params=None, **kwargs):
+                parent_request = super().request
+                recorder = call_recorder
+                if recorder is None:
+                    return scheduler.run(lambda: parent_request(method, endpoint, params=params, **kwargs))
+
+                # Enstrümantasyon açık: deneme sayısı, süre ve hücre sayısı kaydedilir
+                attempts = [0]
+
+                def call():
+                    attempts[0] += 1
+                    return parent_request(method, endpoint, params=params, **kwargs)
+
+                start = time.perf_counter()
+                response = None
+                try:
+                    response = scheduler.run(call)
+                    return response
+                finally:
+                    recorder.record(
+                        method, endpoint, params, kwargs.get('json'), response,
+                        time.perf_counter() - start, attempts[0] - 1
+                    )
+
+        _scheduled_http_client = ScheduledHTTPClient
+    return _scheduled_http_client
+
+
+# ============================================================================
+# SHEETS ÇAĞRI ENSTRÜMANTASYONU
+# ============================================================================
+
+class SheetsCallRecorder:
+    """
+    Sheets/Drive çağrılarını kaydet ve iş bazında JSON özet üret
+
+    Her çağrı için: işlem (values.get, values.batchGet, batchUpdate, ...),
+    spreadsheet, aralık, aktarılan hücre sayısı, süre ve tekrar sayısı.
+    Açmak için CentralConfigManager.enable_call_metrics() veya scripti
+    `--sheets-metrics` ile çalıştırın; özet logs/sheets_calls_<iş>.json'a yazılır.
+    """
+
+    VALUES_OPERATIONS = {'append', 'clear'}
+
+    def __init__(self, job_name: str):
+        self.job_name = job_name
+        self.started_at = datetime.now()
+        self.calls = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def describe_endpoint(method: str, endpoint: str, params: Optional[dict] = None) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        URL'den (işlem, spreadsheet ID, aralık) çıkar
+
+        Örnek:
+            GET .../v4/spreadsheets/<id>/values/Bekleyen!A1:B2 → ('values.get', '<id>', 'Bekleyen!A1:B2')
+        """
+        path = urlparse(endpoint).path
+        params = params or {}
+
+        match = re.search(r'/drive/v\d+/files/([^/]+)', path)
+        if match:
+            return f"drive.files.{method.lower()}", match.group(1), None
+
+        match = re.search(r'/v4/spreadsheets/([^/:]+)(.*)$', path)
+        if not match:
+            return f"{method.lower()} {path}", None, None
+
+        spreadsheet_id, rest = match.groups()
+        if rest.startswith('/values'):
+            rest = rest[len('/values'):]
+            if rest.startswith(':'):
+                ranges = params.get('ranges')
+                if isinstance(ranges, (list, tuple)):
+                    ranges = ','.join(ranges)
+                return f"values.{rest[1:]}", spreadsheet_id, ranges
+
+            # Aralık 'A1:B2' gibi ':' içerebilir; yalnızca bilinen işlem ekleri ayrılır
+            value_range = unquote(rest.lstrip('/'))
+            head, _, suffix = value_range.rpartition(':')
+            if head and suffix in SheetsCallRecorder.VALUES_OPERATIONS:
+                return f"values.{suffix}", spreadsheet_id, head
+            operation = 'values.get' if method.upper() == 'GET' else 'values.update'
+            return operation, spreadsheet_id, value_range
+
+        if rest.startswith(':'):
+            return rest[1:], spreadsheet_id, None
+        if rest:
+            return f"spreadsheets{rest.replace('/', '.')}", spreadsheet_id, None
+        return 'spreadsheets.get', spreadsheet_id, None
+
+    @staticmethod
+    def count_cells(payload: Any) -> int:
+        """values / valueRanges / data[].values yapılarındaki hücre sayısı"""
+        if not isinstance(payload, dict):
+            return 0
+        if 'updatedCells' in payload:
+            return int(payload['updatedCells'] or 0)
+        if 'totalUpdatedCells' in payload:
+            return int(payload['totalUpdatedCells'] or 0)
+        if isinstance(payload.get('values'), list):
+            return sum(len(row) for row in payload['values'] if isinstance(row, list))
+        total = 0
+        for key in ('valueRanges', 'data'):
+            for item in payload.get(key) or []:
+                total += SheetsCallRecorder.count_cells(item)
+        return total
+
+    def record(self, method: str, endpoint: str, params: Optional[dict], body: Any,
+               response: Any, latency: float, retries: int):
+        """Tek bir HTTP çağrısını kaydet (response None ise çağrı hata vermiştir)"""
+        operation, spreadsheet_id, value_range = self.describe_endpoint(method, endpoint, params)
+
+        cells = self.count_cells(body)
+        status = getattr(response, 'status_code', None)
+        if response is not None and not cells:
+            try:
+                cells = self.count_cells(response.json())
+            except Exception:
+                pass
+
+        with self._lock:
+            self.calls.append({
+                'operation': operation,
+                'method': method.upper(),
+                'spreadsheet_id': spreadsheet_id,
+                'range': value_range,
+                'cells': cells,
+                'latency_ms': round(latency * 1000, 1),
+                'retries': retries,
+                'status': status,
+                'ok': response is not None,
+            })
+
+    def summary(self) -> Dict[str, Any]:
+        """İşlem ve spreadsheet bazında toplanmış özet"""
+        with self._lock:
+            calls = list(self.calls)
+
+        def aggregate(key: str) -> Dict[str, Dict[str, Any]]:
+            groups = {}
+            for call in calls:
+                group = groups.setdefault(str(call[key]), {
+                    'calls': 0, 'cells': 0, 'retries': 0, 'errors': 0, 'latency_ms': 0.0
+                })
+                group['calls'] += 1
+                group['cells'] += call['cells']
+                group['retries'] += call['retries']
+                group['errors'] += 0 if call['ok'] else 1
+                group['latency_ms'] = round(group['latency_ms'] + call['latency_ms'], 1)
+            return groups
+
+        finished_at = datetime.now()
+        return {
+            'job': self.job_name,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': finished_at.isoformat(timespec='seconds'),
+            'duration_s': round((finished_at - self.started_at).total_seconds(), 2),
+            'total_calls': len(calls),
+            'total_cells': sum(c['cells'] for c in calls),
+            'total_retries': sum(c['retries'] for c in calls),
+            'total_latency_ms': round(sum(c['latency_ms'] for c in calls), 1),
+            'by_operation': aggregate('operation'),
+            'by_spreadsheet': aggregate('spreadsheet_id'),
+            'scheduler': CentralConfigManager.scheduler.get_metrics(),
+            'calls': calls,
+        }
+
+    def write_summary(self, path: Optional[str] = None) -> Optional[str]:
+        """Özeti JSON olarak yaz (varsayılan: logs/sheets_calls_<iş>.json)"""
+        try:
+            if path is None:
+                log_dir = Path(_entry_base_dir()) / 'logs'
+                log_dir.mkdir(exist_ok=True)
+                path = str(log_dir / f"sheets_calls_{self.job_name}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.summary(), f, ensure_ascii=False, indent=2, default=str)
+            return path
+        except Exception as e:
+            logger.warning(f"Sheets çağrı özeti yazılamadı: {e}")
+            return None
+
+
+# Aktif kaydedici (None: enstrümantasyon kapalı)
+call_recorder: Optional[SheetsCallRecorder] = None
+
+
+# ============================================================================
+# SQL SERVER BAĞLANTI HAVUZU
+# ============================================================================
+
+class ConnectionPool:
+    """
+    Bağlantı dizesi başına paylaşılan pyodbc bağlantı havuzu
+
+    - min_size kadar bağlantı ilk kullanımda açılır, en fazla max_size açık kalır
+    - Havuzdan alınan bağlantı, health_check_after saniyeden uzun boşta kaldıysa
+      'SELECT 1' ile doğrulanır; kopmuşsa kapatılıp yenisi açılır
+    - idle_timeout saniyeden uzun boşta kalan bağlantılar (min_size üstü) kapatılır
+    - Tüm bağlantılar kullanımdaysa acquire() en fazla timeout saniye bekler
+
+    Örnek:
+        with pooled_connection(connection_string) as connection:
+            cursor = connection.cursor()
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        min_size: int = 1,
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+        health_check_after: float = 30.0,
+        connect_timeout: int = 30,
+        acquire_timeout: float = 60.0
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Geçersiz havuz boyutu: min={min_size}, max={max_size}")
+        self.connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.connect_timeout = connect_timeout
+        self.acquire_timeout = acquire_timeout
+
+        # Boştaki bağlantılar: [(connection, iade_zamanı)] (LIFO: en sıcak bağlantı önce)
+        self._idle: List[Tuple[Any, float]] = []
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._metrics = {'connects': 0, 'reuses': 0, 'health_failures': 0, 'evictions': 0, 'waits': 0}
+
+    def _connect(self):
+        import pyodbc
+        connection = pyodbc.connect(self.connection_string, timeout=self.connect_timeout)
+        self._metrics['connects'] += 1
+        return connection
+
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_healthy(connection) -> bool:
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _evict_idle(self) -> List[Any]:
+        """idle_timeout'u aşan boştaki bağlantıları havuzdan çıkar (lock altında çağrılır)"""
+        now = time.monotonic()
+        evicted = []
+        # En eski bağlantılar listenin başında
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            evicted.append(self._idle.pop(0)[0])
+            self._size -= 1
+        self._metrics['evictions'] += len(evicted)
+        return evicted
+
+    def acquire(self, timeout: float = None):
+        """
+        Havuzdan bir bağlantı al (gerekirse yeni bağlantı açar ya da bekler)
+
+        Args:
+            timeout: Tüm bağlantılar kullanımdayken beklenecek süre (None: acquire_timeout)
+
+        Raises:
+            TimeoutError: Süre içinde bağlantı boşalmazsa
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            candidate = None
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Bağlantı havuzu kapatıldı")
+                stale = self._evict_idle()
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"{timeout:g} sn içinde veritabanı bağlantısı alınamadı (max_size={self.max_size})"
+                        )
+                    self._metrics['waits'] += 1
+                    self._condition.wait(remaining)
+                if self._idle:
+                    candidate, returned_at = self._idle.pop()
+                else:
+                    # Yer ayır; bağlantı lock dışında açılır
+                    self._size += 1
+
+            for connection in stale:
+                self._close_quietly(connection)
+
+            if candidate is None:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+
+            if time.monotonic() - returned_at < self.health_check_after or self._is_healthy(candidate):
+                self._metrics['reuses'] += 1
+                return candidate
+
+            # Kopmuş bağlantı: kapat ve tekrar dene
+            self._metrics['health_failures'] += 1
+            self._discard(candidate)
+
+    def release(self, connection, discard: bool = False) -> None:
+        """
+        Bağlantıyı havuza iade et
+
+        Açık transaction geri alınır; geri alma başarısızsa ya da discard=True ise
+        bağlantı kapatılır.
+        """
+        if connection is None:
+            return
+        if not discard:
+            try:
+                connection.rollback()
+                # Sonraki kullanıcı kendi sorgu zaman aşımını ayarlar
+                connection.timeout = 0
+            except Exception:
+                discard = True
+        if discard:
+            self._discard(connection)
+            return
+        with self._condition:
+            if self._closed:
+                self._size -= 1
+                self._close_quietly(connection)
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def _discard(self, connection) -> None:
+        self._close_quietly(connection)
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: float = None, query_timeout: int = None):
+        """
+        Havuzdan bağlantı alıp blok sonunda iade eden context manager
+
+        Args:
+            timeout: Havuzdan bağlantı bekleme süresi (saniye)
+            query_timeout: Bu kullanım için sorgu zaman aşımı (connection.timeout)
+        """
+        connection = self.acquire(timeout)
+        try:
+            connection.timeout = query_timeout or 0
+            yield connection
+        finally:
+            # Hata sonrası da iade edilir; release() rollback başarısızsa bağlantıyı kapatır
+            self.release(connection)
+
+    def warm_up(self) -> None:
+        """min_size kadar bağlantıyı önceden aç"""
+        connections = []
+        try:
+            while True:
+                with self._condition:
+                    if self._size + len(connections) >= self.min_size:
+                        break
+                connections.append(self.acquire())
+        finally:
+            for connection in connections:
+                self.release(connection)
+
+    def close(self) -> None:
+        """Boştaki tüm bağlantıları kapat; kullanımdakiler iade edilince kapanır"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._condition:
+            return {**self._metrics, 'size': self._size, 'idle': len(self._idle)}
+
+
+_connection_pools: Dict[str, ConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+def get_connection_pool(connection_string: str, **options) -> ConnectionPool:
+    """
+    Bağlantı dizesine ait paylaşılan havuzu getir (yoksa oluştur)
+
+    Aynı süreçteki tüm modüller (Risk, Stok, Sevkiyat ...) aynı havuzu kullanır;
+    böylece MikroDB'ye yapılan TLS/login el sıkışmaları tekrarlanmaz.
+    options yalnızca havuz ilk oluşturulurken dikkate alınır.
+    """
+    with _connection_pools_lock:
+        pool = _connection_pools.get(connection_string)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(connection_string, **options)
+            _connection_pools[connection_string] = pool
+        return pool
+
+
+def pooled_connection(connection_string: str, timeout: float = None, query_timeout: int = None):
+    """
+    Paylaşılan havuzdan bağlantı veren context manager
+
+    Örnek:
+        with pooled_connection(connection_string, query_timeout=300) as connection:
+            cursor = connection.cursor()
+    """
+    return get_connection_pool(connection_string).connection(timeout=timeout, query_timeout=query_timeout)
+
+
+@atexit.register
+def close_connection_pools() -> None:
+    """Süreç kapanırken tüm havuzlardaki bağlantıları kapat"""
+    with _connection_pools_lock:
+        pools = list(_connection_pools.values())
+        _connection_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+# ============================================================================
+# TİPLİ AYAR REGISTRY'Sİ
+# ============================================================================
+
+@dataclass(frozen=True)
+class SettingSpec:
+    """Ayar sayfasındaki tek bir anahtarın tanımı"""
+    key: str
+    type: str = 'str'        # 'str', 'int', 'float', 'date', 'url', 'secret'
+    default: Any = ''
+    date_format: str = '%d.%m.%Y'
+    description: str = ''
+    required: bool = False   # Boş çözülürse hata loglanır
+
+
+# Ayar sayfasından okunan, tipleri belirli anahtarlar
+SETTING_SPECS: Tuple[SettingSpec, ...] = (
+    # SQL Server
+    SettingSpec('SQL_SERVER', description='SQL Server IP', required=True),
+    SettingSpec('SQL_DATABASE', description='Database adı', required=True),
+    SettingSpec('SQL_USERNAME', description='SQL kullanıcı adı', required=True),
+    SettingSpec('SQL_PASSWORD', 'secret', description='SQL şifresi', required=True),
+    # Doğtaş API
+    SettingSpec('base_url', 'url', description='Doğtaş API adresi', required=True),
+    SettingSpec('bekleyenler', description='Bekleyen sipariş endpoint', required=True),
+    SettingSpec('CustomerNo', description='Bayi müşteri no', required=True),
+    SettingSpec('userName', description='API kullanıcı adı', required=True),
+    SettingSpec('password', 'secret', description='API şifresi', required=True),
+    SettingSpec('clientId', description='API client ID', required=True),
+    SettingSpec('clientSecret', 'secret', description='API client secret', required=True),
+    SettingSpec('applicationCode', description='API uygulama kodu', required=True),
+    # Tarihler
+    SettingSpec('RegistrationDateStart', 'date', None, '%d.%m.%Y',
+                'Bekleyen sipariş başlangıç tarihi'),
+    SettingSpec('sip_tarih', 'date', datetime(2023, 9, 1), '%Y-%m-%d',
+                'Tamamlanan sipariş başlangıç tarihi'),
+    # Fiyat hesaplama
+    SettingSpec('KDV', 'float', 1.10, description='KDV çarpanı'),
+    SettingSpec('Ön Ödeme İskonto', 'float', 0.90, description='Ön ödeme iskonto çarpanı'),
+    # SQL sonuç cache'i
+    SettingSpec('SQL_CACHE_SURESI', 'int', None,
+                description='SP sonuçlarının tekrar kullanılacağı süre (sn, 0: kapalı)'),
+)
+
+
+def build_fallback_settings(all_values: List[List[str]]) -> Dict[str, str]:
+    """
+    Ayar sayfasından app'ten bağımsız {anahtar: değer} haritası kur
+
+    Eski okuyucuların iki davranışını birleştirir:
+    - Başlık düzenindeki her satırın Key → Value çifti, App Name ne olursa
+      olsun (BekleyenAPI/HGO'nun eski _load_config'i; sonraki satır kazanır)
+    - Başlık düzeninde olmayan satırlar: A sütunu anahtar, B sütunu değer
+      (Stok/Tamamlanan'ın eskiden okuduğu KDV, Ön Ödeme İskonto, sip_tarih)
+
+    Value sütunu dolu satırlar başlık düzenindedir. A sütunu 'Global' ya da bir
+    app adı olan satırlar A/B satırı sayılmaz (App Name → Key çifti üretmez).
+
+    Args:
+        all_values: get_all_values() çıktısı (ilk satır başlık olabilir)
+
+    Returns:
+        {anahtar: değer}; başlık düzeni değerleri A/B değerlerini ezer
+    """
+    if not all_values:
+        return {}
+
+    headers = [str(header).strip() for header in all_values[0]]
+    if 'Key' in headers and 'Value' in headers:
+        key_index, value_index = headers.index('Key'), headers.index('Value')
+        app_index = headers.index('App Name') if 'App Name' in headers else None
+        rows = all_values[1:]
+    else:
+        # Başlık yok: sayfanın tamamı eski düzende
+        key_index = value_index = app_index = None
+        rows = all_values
+
+    def cell(row, index):
+        return str(row[index]).strip() if index is not None and index < len(row) else ''
+
+    header_rows, other_rows = [], []
+    for row in rows:
+        if cell(row, key_index) and cell(row, value_index):
+            header_rows.append(row)
+        else:
+            other_rows.append(row)
+    app_names = {'Global', 'App Name'} | {cell(row, app_index) for row in header_rows}
+
+    fallback = {}
+    for row in other_rows:
+        key = cell(row, 0)
+        if key and key not in app_names and len(row) >= 2:
+            fallback[key] = cell(row, 1)
+
+    conflicts = set()
+    keyed = {}
+    for row in header_rows:
+        key, value = cell(row, key_index), cell(row, value_index)
+        if key in keyed and keyed[key] != value:
+            conflicts.add(key)
+        keyed[key] = value
+    if conflicts:
+        logger.warning(
+            f"Farklı app'lerde farklı değerli anahtarlar (app_name verilmezse son satır kullanılır): "
+            f"{', '.join(sorted(conflicts))}"
+        )
+    fallback.update(keyed)
+    return fallback
+
+
+class SettingsRegistry:
+    """
+    Ayar sayfasından tipli ayar okuma (süreç başına bir kez parse edilir)
+
+    Değerler CentralConfigManager.get_settings() sözlüğünden (bellek +
+    şifreli lokal cache) okunur; Ayar sayfası tekrar indirilmez.
+
+    Arama sırası: app_name verildiyse o app'in satırı ('AppName_Key'), Global
+    satır, son olarak app'ten bağımsız anahtar → değer haritası (herhangi bir
+    app satırındaki Key/Value ya da eski düzen A/B satırı; eski okuyucuların
+    davranışı). Değer bulunamazsa tanımlı varsayılan uyarıyla döner; zorunlu
+    bir ayar boş çözülürse hata loglanır.
+
+    Örnek:
+        registry = manager.registry
+        kdv = registry.get('KDV')                        # 1.1 (float)
+        start = registry.get('RegistrationDateStart')    # datetime veya None
+        baslik = registry.get('KDV', app_name='Stok')    # önce 'Stok_KDV'
+    """
+
+    def __init__(self, manager: 'CentralConfigManager', specs: Tuple[SettingSpec, ...] = SETTING_SPECS):
+        self.manager = manager
+        self.specs = {spec.key: spec for spec in specs}
+        self._values: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def _raw_value(self, settings: Dict[str, str], key: str) -> str:
+        """Global anahtarı, yoksa app'ten bağımsız anahtar → değer satırını bul"""
+        value = settings.get(key, '')
+        if value:
+            return value
+        return self.manager.fallback_settings.get(key, '')
+
+    def _parse(self, spec: SettingSpec, raw: str) -> Any:
+        """Ham metni tanımlı tipe çevir (hatalıysa varsayılan)"""
+        if not raw:
+            if spec.default not in ('', None):
+                logger.warning(f"Ayar bulunamadı, varsayılan kullanılıyor ({spec.key}={spec.default!r})")
+            return spec.default
+        try:
+            if spec.type == 'float':
+                return float(raw.replace(',', '.'))
+            if spec.type == 'int':
+                return int(float(raw.replace(',', '.')))
+            if spec.type == 'date':
+                return datetime.strptime(raw, spec.date_format)
+            if spec.type == 'url' and not raw.startswith(('http://', 'https://')):
+                logger.warning(f"Ayar değeri URL değil ({spec.key}={raw!r})")
+            return raw
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ayar değeri okunamadı ({spec.key}={raw!r}): {e}")
+            return spec.default
+
+    def load(self) -> Dict[str, Any]:
+        """Tüm tanımlı ayarları bir kez parse et (sonraki çağrılar bellekten)"""
+        if self._values is None:
+            with self._lock:
+                if self._values is None:
+                    settings = self.manager.get_settings()
+                    self._values = {
+                        key: self._parse(spec, self._raw_value(settings, key))
+                        for key, spec in self.specs.items()
+                    }
+        return self._values
+
+    def get(self, key: str, app_name: str = None) -> Any:
+        """
+        Tanımlı bir ayarın tipli değerini getir
+
+        Args:
+            key: SETTING_SPECS'teki anahtar
+            app_name: Verilirse önce bu app'in satırı ('AppName_Key') aranır
+
+        Raises:
+            KeyError: Anahtar SETTING_SPECS içinde tanımlı değilse
+        """
+        if key not in self.specs:
+            raise KeyError(f"Tanımsız ayar: {key}")
+        spec = self.specs[key]
+        if app_name:
+            raw = self.manager.get_settings().get(f"{app_name}_{key}", '')
+            if raw:
+                return self._parse(spec, raw)
+        value = self.load()[key]
+        if spec.required and value in ('', None):
+            logger.error(f"Zorunlu ayar boş: {key} (Ayar sayfasını kontrol edin)")
+        return value
+
+    def get_many(self, *keys: str, app_name: str = None) -> Dict[str, Any]:
+        """Birden fazla ayarı sözlük olarak getir"""
+        return {key: self.get(key, app_name=app_name) for key in keys}
+
+    def reset(self):
+        """Parse edilmiş değerleri unut (bir sonraki get'te yeniden yüklenir)"""
+        with self._lock:
+            self._values = None
+
+
 class CentralConfigManager:
     """
     Merkezi Google Service Account ve Config Yönetimi
@@ -119,6 +1391,7 @@ class CentralConfigManager:
     - PRGsheet'ten config çekme
     - Spreadsheet ID yönetimi
     - SQL server ayarları yönetimi
+    - Süreç genelinde paylaşılan instance (shared) ve lazy yetkilendirme
     """
 
     # Ana config sayfası ID'si (PRGsheet)
@@ -130,12 +1403,115 @@ class CentralConfigManager:
         'https://www.googleapis.com/auth/drive'
     ]
 
-    def __init__(self, service_account_file: str = None):
+    # Spreadsheet/worksheet handle cache süresi (saniye)
+    HANDLE_CACHE_TTL = 300
+
+    # Lokal settings cache'inin Drive revizyonuyla en fazla hangi sıklıkta
+    # doğrulanacağı (saniye)
+    SETTINGS_REVISION_CHECK_INTERVAL = 600
+
+    # Worksheet snapshot cache'inin diskteki azami toplam boyutu (byte)
+    SNAPSHOT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+    # Sorgu sonucu cache'inin varsayılan tazelik süresi (Ayar: SQL_CACHE_SURESI)
+    QUERY_CACHE_MAX_AGE = 600
+
+    # Çift tamponlu yayında gizli tampon worksheet'inin ad eki
+    PUBLISH_STAGING_SUFFIX = '_staging'
+
+    # Toplu yayında tek values.batchUpdate isteğine konan azami hücre sayısı ve
+    # tahmini payload boyutu (Sheets istek gövdesi sınırının altında)
+    PUBLISH_MAX_CELLS_PER_CALL = 500_000
+    PUBLISH_MAX_BYTES_PER_CALL = 8 * 1024 * 1024
+
+    # Toplu yayında yeni eklenen sayfanın grid'ine veri dışında bırakılan satır payı
+    PUBLISH_NEW_SHEET_ROW_MARGIN = 10
+
+    # Parçalı yüklemede parça başına azami hücre / tahmini payload boyutu ve
+    # eşzamanlı istek sayısı
+    UPLOAD_MAX_CELLS = 50_000
+    UPLOAD_MAX_BYTES = 2 * 1024 * 1024
+    UPLOAD_MAX_WORKERS = 4
+
+    # Son yazımın parmak izini worksheet üzerinde taşıyan developer metadata
+    # anahtarı (snapshot'ın sayfa bazında geçerliliği)
+    WORKSHEET_STAMP_KEY = 'prg_written_fingerprint'
+
+    # Bu süreden eski yükleme checkpoint'leri silinir (saniye)
+    UPLOAD_CHECKPOINT_MAX_AGE = 24 * 60 * 60
+
+    # Google Sheets'in spreadsheet başına hücre sınırı (tüm sayfaların grid'leri)
+    SPREADSHEET_CELL_LIMIT = 10_000_000
+
+    # Sheets API kotası (proje: dakikada istek sayısı)
+    SHEETS_REQUESTS_PER_MINUTE = 60
+
+    # Süreç genelinde paylaşılan manager ve service account dosyası başına
+    # yetkilendirilmiş gspread client'ları (aynı HTTP session tekrar kullanılır)
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+    _clients: Dict[str, gspread.Client] = {}
+    _client_lock = threading.Lock()
+
+    # Tüm client'ların paylaştığı istek zamanlayıcısı
+    scheduler = SheetsRequestScheduler(SHEETS_REQUESTS_PER_MINUTE)
+
+    @staticmethod
+    def enable_call_metrics(job_name: str = None, write_at_exit: bool = True) -> SheetsCallRecorder:
+        """
+        Sheets/Drive çağrı enstrümantasyonunu aç (opt-in)
+
+        Args:
+            job_name: Özet dosyası adı (varsayılan: çalışan scriptin adı)
+            write_at_exit: True ise özet süreç kapanırken JSON'a yazılır
+
+        Returns:
+            Aktif SheetsCallRecorder
+        """
+        global call_recorder
+        if call_recorder is None:
+            if job_name is None:
+                job_name = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else 'interactive'
+            call_recorder = SheetsCallRecorder(job_name)
+            if write_at_exit:
+                atexit.register(call_recorder.write_summary)
+        return call_recorder
+
+    @staticmethod
+    def disable_call_metrics() -> Optional[SheetsCallRecorder]:
+        """Enstrümantasyonu kapat ve son kaydediciyi döndür"""
+        global call_recorder
+        recorder, call_recorder = call_recorder, None
+        return recorder
+
+    @classmethod
+    def shared(cls, service_account_file: str = None) -> 'CentralConfigManager':
+        """
+        Süreç genelinde tek CentralConfigManager instance'ını döndür (thread-safe)
+
+        Aynı process'te çalışan tüm modüller (veya masaüstü uygulaması) bu
+        instance'ı kullanarak config/settings cache'ini ve gspread client'ını
+        paylaşır. Yetkilendirme ilk Sheets çağrısında bir kez yapılır.
+
+        Args:
+            service_account_file: İlk oluşturmada kullanılacak dosya yolu
+
+        Returns:
+            CentralConfigManager: Paylaşılan instance
+        """
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls(service_account_file)
+        return cls._shared_instance
+
+    def __init__(self, service_account_file: str = None, handle_cache_ttl: float = None):
         """
         Initialize central config manager with Service Account
 
         Args:
             service_account_file: service_account.json dosya yolu (None ise otomatik bulur)
+            handle_cache_ttl: Spreadsheet/worksheet handle cache süresi (saniye)
         """
         self.base_dir = self._get_base_dir()
         self.service_account_file = service_account_file or self._find_service_account_file()
@@ -147,168 +1523,1277 @@ class CentralConfigManager:
                 f"{self.base_dir}"
             )
 
-        # Service Account ile Google Sheets client oluştur
-        self.gc = self._authorize()
+        # Google Sheets client ilk kullanımda oluşturulur (bkz. gc property)
+        self._gc = None
 
         # Config cache (bellekte)
         self.config_cache = {}
         self.settings_cache = {}
 
-        # Şifreli lokal cache
-        self.local_cache = SettingsCache(self.base_dir)
+        # App'ten bağımsız {anahtar: değer} haritası (app satırları + eski
+        # düzen A/B satırları); registry'nin son arama adımı
+        self.fallback_settings: Dict[str, str] = {}
+
+        # App bazlı ayar indeksi: {app_name: {key: value}}; _app_index_source
+        # indeksin üretildiği settings_cache sözlüğüdür (değişirse yeniden kurulur)
+        self._app_settings_index = {}
+        self._app_index_source = None
+
+        # Şifreli lokal cache
+        self.local_cache = SettingsCache(self.base_dir)
+
+        # Şifreli, revizyon doğrulamalı worksheet snapshot cache'i
+        self.snapshot_cache = WorksheetSnapshotCache(
+            self.base_dir, self.local_cache, self.SNAPSHOT_CACHE_MAX_BYTES
+        )
+
+        # Yayınlanan içeriklerin parmak izleri (değişmeyen yazımlar atlanır)
+        self.publish_manifest = PublishManifest(self.base_dir)
+
+        # Pahalı SQL sorgusu sonuçları (sp_SiparisOperasyonlari gibi)
+        self.query_cache = QueryResultCache(self.base_dir, self.local_cache)
+
+        # Tipli ayar registry'si (ilk erişimde settings'ten parse edilir)
+        self.registry = SettingsRegistry(self)
+
+        # Spreadsheet/worksheet handle cache: {key: (handle, zaman)}
+        self.handle_cache_ttl = (
+            self.HANDLE_CACHE_TTL if handle_cache_ttl is None else handle_cache_ttl
+        )
+        self._spreadsheet_handles = {}
+        self._worksheet_handles = {}
+        self._handle_lock = threading.RLock()
+        self._handle_stats = {'hits': 0, 'misses': 0}
+
+        # Başlık satırı cache'i (sütun bazlı okumalarda ad → harf çözümü)
+        self._header_cache: Dict[Tuple[str, str], List[str]] = {}
+
+    def _get_base_dir(self) -> str:
+        """Çalışma dizinini döndür (PyInstaller desteğiyle)"""
+        if getattr(sys, 'frozen', False):
+            # Exe olarak çalışıyorsa: exe'nin bulunduğu dizini kullan
+            return os.path.dirname(sys.executable)
+        else:
+            # Normal Python olarak çalışıyorsa
+            return os.path.dirname(os.path.abspath(__file__))
+
+    def _find_service_account_file(self) -> Optional[str]:
+        """service_account.json dosyasını bul (PyInstaller desteğiyle)"""
+        possible_paths = [
+            # PyInstaller'ın geçici extract klasörü (_MEIPASS)
+            os.path.join(getattr(sys, '_MEIPASS', self.base_dir), 'service_account.json'),
+            # Exe'nin bulunduğu dizin
+            os.path.join(self.base_dir, 'service_account.json'),
+            # Home dizini
+            os.path.join(Path.home(), 'service_account.json'),
+            # Varsayılan konum
+            'D:/GoogleDrive/PRG/OAuth2/service_account.json',
+        ]
+
+        for path in possible_paths:
+            if os.path.exists(path):
+                logger.info(f"Service Account dosyası bulundu: {path}")
+                return path
+
+        return None
+
+    @property
+    def gc(self) -> gspread.Client:
+        """
+        Yetkilendirilmiş gspread client (lazy, thread-safe)
+
+        İlk erişimde service_account.json okunur ve yetkilendirme yapılır.
+        Aynı dosyayı kullanan tüm manager'lar tek client'ı paylaşır.
+        """
+        if self._gc is None:
+            with self._client_lock:
+                client = self._clients.get(self.service_account_file)
+                if client is None:
+                    client = self._authorize()
+                    self._clients[self.service_account_file] = client
+                self._gc = client
+        return self._gc
+
+    def _authorize(self) -> gspread.Client:
+        """
+        Google Service Account ile yetkilendirme
+
+        Returns:
+            gspread.Client: Yetkilendirilmiş Google Sheets client
+        """
+        try:
+            # Ağır bağımlılıklar ilk yetkilendirmede yüklenir
+            import gspread
+            from google.oauth2.service_account import Credentials
+
+            # Service Account credentials oluştur
+            creds = Credentials.from_service_account_file(
+                self.service_account_file,
+                scopes=self.SCOPES
+            )
+
+            # gspread client oluştur (istekler ortak kota zamanlayıcısından geçer)
+            logger.info("Service Account ile yetkilendirme başarılı")
+            return gspread.authorize(creds, http_client=scheduled_http_client(self.scheduler))
+
+        except Exception as e:
+            logger.error(f"Service Account yetkilendirme hatası: {e}")
+            raise
+
+    # ------------------------------------------------------------------
+    # SPREADSHEET / WORKSHEET HANDLE CACHE
+    # ------------------------------------------------------------------
+
+    def _handle_fresh(self, cached_at: float) -> bool:
+        """Handle cache kaydının TTL içinde olup olmadığını kontrol et"""
+        return (time.monotonic() - cached_at) < self.handle_cache_ttl
+
+    def open_by_key(self, spreadsheet_id: str) -> gspread.Spreadsheet:
+        """
+        Spreadsheet'i ID ile aç (TTL'li handle cache ile)
+
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+
+        Returns:
+            gspread.Spreadsheet nesnesi
+        """
+        with self._handle_lock:
+            entry = self._spreadsheet_handles.get(spreadsheet_id)
+            if entry and self._handle_fresh(entry[1]):
+                self._handle_stats['hits'] += 1
+                return entry[0]
+
+            self._handle_stats['misses'] += 1
+            spreadsheet = self.gc.open_by_key(spreadsheet_id)
+            self._spreadsheet_handles[spreadsheet_id] = (spreadsheet, time.monotonic())
+            return spreadsheet
+
+    def get_worksheet(self, worksheet_name: str, spreadsheet_id: str = None) -> gspread.Worksheet:
+        """
+        Worksheet handle'ını getir (TTL'li handle cache ile)
+
+        Cache'te yoksa spreadsheet'in tüm worksheet'leri tek metadata
+        çağrısıyla okunur ve hepsi cache'e eklenir.
+
+        Args:
+            worksheet_name: Worksheet adı ('Bekleyen', 'Plan' gibi)
+            spreadsheet_id: Spreadsheet ID (None ise PRGsheet)
+
+        Returns:
+            gspread.Worksheet nesnesi
+
+        Raises:
+            gspread.WorksheetNotFound: Worksheet yoksa
+        """
+        spreadsheet_id = spreadsheet_id or self.MASTER_SPREADSHEET_ID
+        key = (spreadsheet_id, worksheet_name)
+
+        with self._handle_lock:
+            entry = self._worksheet_handles.get(key)
+            if entry and self._handle_fresh(entry[1]):
+                self._handle_stats['hits'] += 1
+                return entry[0]
+
+            spreadsheet = self.open_by_key(spreadsheet_id)
+            self._handle_stats['misses'] += 1
+            now = time.monotonic()
+            for worksheet in spreadsheet.worksheets():
+                self._worksheet_handles[(spreadsheet_id, worksheet.title)] = (worksheet, now)
+
+            entry = self._worksheet_handles.get(key)
+            if not entry or entry[1] != now:
+                self._worksheet_handles.pop(key, None)
+                raise _gspread().WorksheetNotFound(worksheet_name)
+            return entry[0]
+
+    def invalidate_handles(self, spreadsheet_id: str = None, worksheet_name: str = None):
+        """
+        Handle cache'ini temizle
+
+        Args:
+            spreadsheet_id: Sadece bu spreadsheet'e ait kayıtlar (None ise tümü)
+            worksheet_name: Sadece bu worksheet (spreadsheet_id ile birlikte)
+        """
+        with self._handle_lock:
+            if spreadsheet_id is None:
+                self._spreadsheet_handles.clear()
+                self._worksheet_handles.clear()
+            elif worksheet_name is not None:
+                self._worksheet_handles.pop((spreadsheet_id, worksheet_name), None)
+            else:
+                self._spreadsheet_handles.pop(spreadsheet_id, None)
+                for key in [k for k in self._worksheet_handles if k[0] == spreadsheet_id]:
+                    del self._worksheet_handles[key]
+
+    def get_handle_cache_stats(self) -> Dict[str, int]:
+        """Handle cache hit/miss sayaçlarını döndür"""
+        with self._handle_lock:
+            return {
+                **self._handle_stats,
+                'spreadsheets': len(self._spreadsheet_handles),
+                'worksheets': len(self._worksheet_handles),
+            }
+
+    def load_spreadsheet_configs(self) -> Dict[str, str]:
+        """
+        PRGsheet → Config sayfasından tüm spreadsheet ID'lerini yükle
+        
+        """
+        if self.config_cache:
+            return self.config_cache
+
+        try:
+            # Ana config sayfasını aç
+            config_worksheet = self.get_worksheet('Config')
+
+            # Tüm config'leri oku
+            configs = config_worksheet.get_all_records()
+
+            # Dictionary'ye çevir (sadece aktif olanları)
+            spreadsheet_map = {}
+            for row in configs:
+                app_name = str(row.get('App Name', '')).strip()
+                spreadsheet_id = str(row.get('Spreadsheet ID', '')).strip()
+                active = str(row.get('Active', 'TRUE')).strip().upper()
+
+                if app_name and spreadsheet_id and active == 'TRUE':
+                    spreadsheet_map[app_name] = spreadsheet_id
+
+            self.config_cache = spreadsheet_map
+            logger.info(f"{len(spreadsheet_map)} spreadsheet config yüklendi")
+            return spreadsheet_map
+
+        except Exception as e:
+            logger.error(f"Config yükleme hatası: {e}")
+            return {}
+
+    def _resolve_spreadsheet_id(self, app_name: str) -> Optional[str]:
+        """App adından spreadsheet ID'sini bul (PRGsheet için MASTER ID'ye düşer)"""
+        # Config'leri yükle (cache yoksa)
+        if not self.config_cache:
+            self.load_spreadsheet_configs()
+
+        spreadsheet_id = self.config_cache.get(app_name)
+        if not spreadsheet_id and app_name == 'PRGsheet':
+            spreadsheet_id = self.MASTER_SPREADSHEET_ID
+        return spreadsheet_id
+
+    def get_spreadsheet(self, app_name: str) -> Optional[gspread.Spreadsheet]:
+        """
+        App adına göre spreadsheet'i getir
+
+        Args:
+            app_name: 'Risk', 'Etiket', 'Kasa', 'PRGsheet' gibi
+
+        Returns:
+            gspread.Spreadsheet nesnesi veya None
+
+        Örnek:
+            risk_sheet = manager.get_spreadsheet('Risk')
+            worksheet = risk_sheet.worksheet('Risk')
+        """
+        # Spreadsheet ID'yi al
+        spreadsheet_id = self._resolve_spreadsheet_id(app_name)
+
+        if not spreadsheet_id:
+            logger.error(f"'{app_name}' için spreadsheet ID bulunamadı!")
+            logger.info(f"Mevcut app'ler: {list(self.config_cache.keys())}")
+            return None
+
+        # Spreadsheet'i aç
+        try:
+            spreadsheet = self.open_by_key(spreadsheet_id)
+            logger.info(f"'{app_name}' spreadsheet'i açıldı")
+            return spreadsheet
+        except Exception as e:
+            logger.error(f"'{app_name}' spreadsheet açma hatası: {e}")
+            return None
+
+    def get_worksheet_data(
+        self,
+        app_name: str,
+        worksheet_name: str,
+        use_snapshot: bool = False
+    ) -> List[List]:
+        """
+        Belirli bir app'in worksheet'inden veri çek
+
+        Args:
+            app_name: 'Risk', 'Etiket' gibi
+            worksheet_name: 'NoRisk', 'Settings' gibi
+            use_snapshot: True ise revizyonu değişmemişse lokal snapshot kullanılır
+
+        Returns:
+            Worksheet verileri (2D liste)
+
+        Örnek:
+            data = manager.get_worksheet_data('PRGsheet', 'NoRisk')
+            # [['Cari Kod'], ['120.01.001'], ['120.01.002'], ...]
+        """
+        if use_snapshot:
+            return self.get_worksheets_data(
+                app_name, [worksheet_name], use_snapshot=True
+            ).get(worksheet_name, [])
+
+        spreadsheet = self.get_spreadsheet(app_name)
+
+        if not spreadsheet:
+            return []
+
+        try:
+            worksheet = self.get_worksheet(worksheet_name, spreadsheet.id)
+            data = worksheet.get_all_values()
+            logger.info(f"'{app_name}' → '{worksheet_name}': {len(data)} satır okundu")
+            return data
+        except Exception as e:
+            logger.error(f"Worksheet okuma hatası ({app_name}/{worksheet_name}): {e}")
+            return []
+
+    def get_worksheets_data(
+        self,
+        app_name: str,
+        ranges: List[str],
+        as_dataframe: bool = False,
+        numericise: bool = False,
+        use_snapshot: bool = False,
+        unformatted: bool = False,
+        schemas: Dict[str, Dict[str, str]] = None
+    ) -> Dict[str, Union[List[List], 'pd.DataFrame']]:
+        """
+        Birden fazla worksheet/aralığı tek values.batchGet çağrısıyla oku
+
+        Args:
+            app_name: 'PRGsheet', 'Risk' gibi
+            ranges: Worksheet adları veya A1 aralıkları ('Ayar', 'Plan!A:B')
+            as_dataframe: True ise ilk satırı başlık kabul edip DataFrame döndürür
+            numericise: True ise sayısal metinler get_all_records gibi sayıya çevrilir
+            use_snapshot: True ise spreadsheet revizyonu değişmemiş aralıklar
+                lokal snapshot cache'inden okunur, sadece kalanlar indirilir
+            unformatted: True ise hücreler UNFORMATTED_VALUE ile okunur (sayılar
+                sayı olarak gelir, binlik ayraç/ondalık virgül ayrıştırması gerekmez)
+            schemas: {aralık: {sütun: tip}} (bkz. apply_sheet_schema); verilirse
+                unformatted okunur ve DataFrame'ler sütun bazında tiplenir.
+                Şemada 'date' varsa tarihler SERIAL_NUMBER olarak istenir
+
+        Returns:
+            {istenen_aralık: 2D liste veya DataFrame} (okunamazsa boş dict)
+
+        Örnek:
+            data = manager.get_worksheets_data('PRGsheet', ['Ayar', 'Plan', 'Fiyat'])
+            plan_rows = data['Plan']
+
+            fiyat = manager.get_worksheets_data('PRGsheet', ['Fiyat'], schemas={
+                'Fiyat': {'SAP Kodu': 'text', 'TOPTAN': 'decimal'}
+            })['Fiyat']
+        """
+        if not ranges:
+            return {}
+
+        schemas = schemas or {}
+        render_params = None
+        if unformatted or schemas:
+            as_dataframe = as_dataframe or bool(schemas)
+            has_dates = any('date' in schema.values() for schema in schemas.values())
+            render_params = {
+                'valueRenderOption': 'UNFORMATTED_VALUE',
+                'dateTimeRenderOption': 'SERIAL_NUMBER' if has_dates else 'FORMATTED_STRING',
+            }
+
+        spreadsheet_id = self._resolve_spreadsheet_id(app_name)
+        if not spreadsheet_id:
+            logger.error(f"'{app_name}' için spreadsheet ID bulunamadı!")
+            return {}
+
+        try:
+            raw_values = {}
+            revision = None
+            # Farklı render seçenekleriyle okunan snapshot'lar karışmasın
+            snapshot_suffix = (
+                f"#{render_params['valueRenderOption']}:{render_params['dateTimeRenderOption']}"
+                if render_params else ''
+            )
+            if use_snapshot:
+                revision = self.get_spreadsheet_revision(spreadsheet_id)
+                for requested in ranges:
+                    cached = self.snapshot_cache.load(
+                        spreadsheet_id, requested + snapshot_suffix, revision
+                    )
+                    if cached is not None:
+                        raw_values[requested] = cached
+
+            missing = [r for r in ranges if r not in raw_values]
+            if missing:
+                spreadsheet = self.open_by_key(spreadsheet_id)
+                response = spreadsheet.values_batch_get(
+                    [_to_a1_range(r) for r in missing], params=render_params
+                )
+                for requested, value_range in zip(missing, response.get('valueRanges', [])):
+                    raw_values[requested] = _pad_rows(value_range.get('values', []))
+                    if use_snapshot:
+                        self.snapshot_cache.save(
+                            spreadsheet_id, requested + snapshot_suffix, revision, raw_values[requested]
+                        )
+
+            result = {}
+            for requested in ranges:
+                if requested not in raw_values:
+                    continue
+                values = raw_values[requested]
+                if as_dataframe:
+                    frame = values_to_dataframe(values, numericise=numericise)
+                    if requested in schemas:
+                        frame = apply_sheet_schema(frame, schemas[requested])
+                    result[requested] = frame
+                elif numericise:
+                    result[requested] = [_gspread().utils.numericise_all(row) for row in values]
+                else:
+                    result[requested] = values
+
+            logger.info(f"'{app_name}' → {len(result)} aralık tek istekte okundu")
+            return result
+
+        except Exception as e:
+            logger.error(f"Toplu worksheet okuma hatası ({app_name}/{ranges}): {e}")
+            return {}
+
+    def get_worksheet_headers(self, app_name: str, worksheet_name: str, refresh: bool = False) -> List[str]:
+        """
+        Worksheet'in başlık satırını getir (süreç içinde cache'li)
+
+        Args:
+            app_name: 'PRGsheet' gibi
+            worksheet_name: Worksheet adı
+            refresh: True ise cache atlanıp tekrar okunur
+
+        Returns:
+            Başlık listesi (okunamazsa boş liste)
+        """
+        spreadsheet_id = self._resolve_spreadsheet_id(app_name)
+        if not spreadsheet_id:
+            return []
+        key = (spreadsheet_id, worksheet_name)
+        if refresh or key not in self._header_cache:
+            return self._fetch_headers(spreadsheet_id, [worksheet_name]).get(worksheet_name, [])
+        return list(self._header_cache[key])
+
+    def _fetch_headers(self, spreadsheet_id: str, worksheet_names: List[str]) -> Dict[str, List[str]]:
+        """Başlık satırlarını tek values.batchGet ile oku ve cache'e yaz"""
+        response = self.open_by_key(spreadsheet_id).values_batch_get(
+            [f"{_to_a1_range(name)}!1:1" for name in worksheet_names]
+        )
+        headers = {}
+        for name, value_range in zip(worksheet_names, response.get('valueRanges', [])):
+            rows = value_range.get('values', [])
+            headers[name] = [str(value) for value in rows[0]] if rows else []
+            # Boş sayfanın başlığı henüz yok; ilk yazımdan sonra tekrar okunsun
+            if headers[name]:
+                self._header_cache[(spreadsheet_id, name)] = list(headers[name])
+        return headers
+
+    def get_columns_data(
+        self,
+        app_name: str,
+        columns: Dict[str, List[str]],
+        schemas: Dict[str, Dict[str, str]] = None,
+        unformatted: bool = False
+    ) -> Dict[str, 'pd.DataFrame']:
+        """
+        Sadece gereken sütunları oku (tüm worksheet yerine)
+
+        Başlık adları sütun harflerine bir kez çözülür ve süreç içinde cache'lenir
+        (tüm sayfaların başlıkları tek istekte). Sütunlar tek values.batchGet ile
+        'Sayfa'!C:C aralıkları olarak indirilir; gelen ilk hücre beklenen başlık
+        değilse (sütunlar taşınmış) başlıklar yenilenip bir kez tekrar denenir.
+
+        Args:
+            app_name: 'PRGsheet' gibi
+            columns: {worksheet_adı: [başlık, ...]}
+            schemas: {worksheet_adı: {sütun: tip}} (bkz. apply_sheet_schema)
+            unformatted: True ise UNFORMATTED_VALUE ile okunur (schemas verilirse her zaman)
+
+        Returns:
+            {worksheet_adı: DataFrame (sadece bulunan sütunlar, istenen sırada)}
+
+        Örnek:
+            plan = manager.get_columns_data('PRGsheet', {'Plan': ['Malzeme Kodu', 'Adet']})['Plan']
+        """
+        import pandas as pd
+
+        spreadsheet_id = self._resolve_spreadsheet_id(app_name)
+        if not spreadsheet_id or not columns:
+            return {}
+
+        schemas = schemas or {}
+        render_params = None
+        if unformatted or schemas:
+            has_dates = any('date' in schema.values() for schema in schemas.values())
+            render_params = {
+                'valueRenderOption': 'UNFORMATTED_VALUE',
+                'dateTimeRenderOption': 'SERIAL_NUMBER' if has_dates else 'FORMATTED_STRING',
+            }
+
+        try:
+            for attempt in range(2):
+                unknown = [name for name in columns if (spreadsheet_id, name) not in self._header_cache]
+                if unknown:
+                    self._fetch_headers(spreadsheet_id, unknown)
+
+                requests = []
+                for name, wanted in columns.items():
+                    headers = self._header_cache.get((spreadsheet_id, name), [])
+                    for header in wanted:
+                        if header in headers:
+                            letter = _column_letter(headers.index(header) + 1)
+                            requests.append((name, header, f"{_to_a1_range(name)}!{letter}:{letter}"))
+                        else:
+                            logger.warning(f"'{name}' sayfasında sütun bulunamadı: {header}")
+
+                response = self.open_by_key(spreadsheet_id).values_batch_get(
+                    [a1_range for _, _, a1_range in requests],
+                    params={**(render_params or {}), 'majorDimension': 'COLUMNS'}
+                ) if requests else {}
+                value_ranges = response.get('valueRanges', [])
+
+                fetched = {}
+                moved = False
+                for (name, header, _), value_range in zip(requests, value_ranges):
+                    cells = (value_range.get('values') or [[]])[0]
+                    if not cells or str(cells[0]) != header:
+                        moved = True
+                        break
+                    fetched.setdefault(name, {})[header] = cells[1:]
+
+                if not moved:
+                    break
+                # Sütunlar taşınmış: başlıkları yenile ve bir kez daha dene
+                logger.info("Başlık konumları değişmiş, sütun cache'i yenileniyor")
+                for name in columns:
+                    self._header_cache.pop((spreadsheet_id, name), None)
+            else:
+                logger.error(f"Sütun okuma başlık doğrulaması başarısız ({app_name}/{list(columns)})")
+                return {}
+
+            result = {}
+            for name, data in fetched.items():
+                length = max(len(cells) for cells in data.values())
+                frame = pd.DataFrame({
+                    header: list(cells) + [''] * (length - len(cells)) for header, cells in data.items()
+                })
+                if name in schemas:
+                    frame = apply_sheet_schema(frame, schemas[name])
+                result[name] = frame
+
+            logger.info(f"'{app_name}' → {len(requests)} sütun tek istekte okundu")
+            return result
+
+        except Exception as e:
+            logger.error(f"Sütun okuma hatası ({app_name}/{list(columns)}): {e}")
+            return {}
+
+    def get_spreadsheet_revision(self, spreadsheet_id: str) -> Optional[str]:
+        """
+        Spreadsheet'in Drive modifiedTime değerini getir (tek, hafif Drive çağrısı)
+
+        Returns:
+            Revizyon metni veya None (okunamazsa)
+        """
+        try:
+            metadata = self.gc.http_client.get_file_drive_metadata(spreadsheet_id)
+            return metadata.get('modifiedTime')
+        except Exception as e:
+            logger.warning(f"Spreadsheet revizyonu okunamadı ({spreadsheet_id}): {e}")
+            return None
+
+    def _stamp_requests(self, sheet_id: int, stamp: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Worksheet'in yazım damgasını silen (stamp verilirse yenisini ekleyen) istekler"""
+        requests = [{'deleteDeveloperMetadata': {'dataFilter': {'developerMetadataLookup': {
+            'metadataKey': self.WORKSHEET_STAMP_KEY,
+            'metadataLocation': {'sheetId': sheet_id},
+        }}}}]
+        if stamp:
+            requests.append({'createDeveloperMetadata': {'developerMetadata': {
+                'metadataKey': self.WORKSHEET_STAMP_KEY,
+                'metadataValue': stamp,
+                'location': {'sheetId': sheet_id},
+                'visibility': 'DOCUMENT',
+            }}})
+        return requests
+
+    def get_worksheet_stamp(self, worksheet: gspread.Worksheet) -> Optional[str]:
+        """
+        Worksheet'e son write_worksheet_values yazımında bırakılan damgayı getir
+
+        Damga yazılan içeriğin parmak izidir; sayfayı başka yoldan değiştiren
+        yazımlar (clear_worksheet, _write_full, publish_*) damgayı siler. Drive
+        modifiedTime'ın aksine aynı dosyadaki diğer sayfaların yazımından etkilenmez.
+
+        Returns:
+            Damga veya None (yoksa/okunamazsa)
+        """
+        try:
+            metadata = worksheet.spreadsheet.fetch_sheet_metadata(params={
+                'fields': 'sheets(properties(sheetId),developerMetadata(metadataKey,metadataValue))'
+            })
+        except Exception as e:
+            logger.warning(f"Worksheet damgası okunamadı ({worksheet.title}): {e}")
+            return None
+        for sheet in metadata.get('sheets', []):
+            if sheet['properties']['sheetId'] != worksheet.id:
+                continue
+            for item in sheet.get('developerMetadata', []):
+                if item.get('metadataKey') == self.WORKSHEET_STAMP_KEY:
+                    return item.get('metadataValue')
+        return None
+
+    def clear_worksheet(self, worksheet: gspread.Worksheet) -> None:
+        """
+        Worksheet'i temizle ve yayın kayıtlarını unut
+
+        Doğrudan worksheet.clear() publish manifest'i güncellemez; temizlikten
+        sonra önceki içerikle aynı veri yayınlandığında parmak izi eşleşir ve
+        yazım atlanır (sayfa boş kalır). Sayfa temizlenirken bu metot kullanılmalı.
+        Değerler ve yazım damgası tek batchUpdate ile silinir.
+        """
+        worksheet.spreadsheet.batch_update({'requests': [
+            {'updateCells': {'range': {'sheetId': worksheet.id}, 'fields': 'userEnteredValue'}},
+            *self._stamp_requests(worksheet.id),
+        ]})
+        spreadsheet_id = worksheet.spreadsheet.id
+        self.publish_manifest.forget(spreadsheet_id, worksheet.title)
+        self.snapshot_cache.invalidate(spreadsheet_id, f"{worksheet.title}#written")
+
+    def write_worksheet_values(
+        self,
+        worksheet: gspread.Worksheet,
+        values: List[List],
+        key_column: Optional[str] = None,
+        value_input_option: str = 'RAW',
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Worksheet'i clear() + tam yazım yerine sadece değişen satırlarla güncelle
+
+        İçeriğin parmak izi son yayınla aynıysa (publish manifest) hiçbir istek
+        yapılmaz. Aksi halde mevcut içerik, worksheet'in yazım damgası (bkz.
+        get_worksheet_stamp) lokal snapshot'ınkiyle aynıysa snapshot'tan okunur;
+        dosyadaki diğer sayfaların yazımı snapshot'ı geçersiz kılmaz. Snapshot
+        geçersizse RAW hedefler sayfadan (UNFORMATTED_VALUE) okunur, USER_ENTERED
+        hedefler doğrudan tam yazılır (sayfadaki sayı/tarih değerleri yazılan
+        metinle karşılaştırılamaz). Fark en fazla bir batchUpdate (satır
+        ekle/sil) ve bir values.batchUpdate ile yazılır; ardından damga
+        yenilenir. Başlıklar değişmişse veya sayfa boşsa tam yazıma düşülür.
+
+        Args:
+            worksheet: Hedef worksheet
+            values: Yazılacak 2D liste (ilk satır başlık)
+            key_column: Satırları eşleştiren sütun (None: tüm satır içeriği)
+            value_input_option: 'RAW' veya 'USER_ENTERED'
+            force: True ise parmak izi aynı olsa da yazılır
 
-    def _get_base_dir(self) -> str:
-        """Çalışma dizinini döndür (PyInstaller desteğiyle)"""
-        if getattr(sys, 'frozen', False):
-            # Exe olarak çalışıyorsa: exe'nin bulunduğu dizini kullan
-            return os.path.dirname(sys.executable)
+        Returns:
+            {'mode': 'skipped' | 'diff' | 'full' | 'unchanged', 'cells', 'inserted', 'updated', 'deleted'}
+        """
+        spreadsheet_id = worksheet.spreadsheet.id
+        snapshot_key = f"{worksheet.title}#written"
+        user_entered = value_input_option == 'USER_ENTERED'
+
+        fingerprint = values_fingerprint(values, value_input_option)
+        if not force and self.publish_manifest.matches(
+            spreadsheet_id, worksheet.title, worksheet.id, fingerprint
+        ):
+            logger.info(f"'{worksheet.title}' içeriği değişmedi, yazım atlandı")
+            return {'mode': 'skipped', 'cells': 0, 'inserted': 0, 'updated': 0, 'deleted': 0}
+
+        stamp = self.get_worksheet_stamp(worksheet)
+        current = self.snapshot_cache.load(spreadsheet_id, snapshot_key, stamp)
+        from_snapshot = current is not None
+        if from_snapshot:
+            diff = plan_worksheet_diff(current, values, key_column, user_entered)
+        elif user_entered:
+            # Sayfadan okunan değerler yazılan metinle aynı biçimde değil
+            diff = None
         else:
-            # Normal Python olarak çalışıyorsa
-            return os.path.dirname(os.path.abspath(__file__))
+            try:
+                current = _pad_rows(worksheet.get_values(value_render_option='UNFORMATTED_VALUE'))
+            except Exception as e:
+                logger.warning(f"Mevcut içerik okunamadı ({worksheet.title}): {e}")
+                current = []
+            diff = plan_worksheet_diff(current, values, key_column, user_entered)
+
+        # Yazım yarıda kalırsa eski snapshot bir sonraki farkın tabanı olmamalı
+        self.snapshot_cache.invalidate(spreadsheet_id, snapshot_key)
+
+        if diff is None:
+            self._write_full(worksheet, values, value_input_option)
+            stats = {'mode': 'full', 'cells': sum(len(row) for row in values),
+                     'inserted': len(values) - 1, 'updated': 0, 'deleted': 0}
+        else:
+            if diff.inserted > diff.deleted:
+                self.check_grid_capacity(
+                    worksheet.spreadsheet, worksheet.id,
+                    worksheet.row_count + diff.inserted - diff.deleted, worksheet.col_count
+                )
+            if diff.row_ops:
+                worksheet.spreadsheet.batch_update({'requests': [
+                    *self._stamp_requests(worksheet.id), *diff.requests(worksheet.id)
+                ]})
+            if diff.updates:
+                worksheet.batch_update(
+                    [{'range': f"A{start}", 'values': rows} for start, rows in diff.updates],
+                    value_input_option=value_input_option
+                )
+            stats = {'mode': 'unchanged' if diff.is_empty else 'diff', 'cells': diff.cells,
+                     'inserted': diff.inserted, 'updated': diff.updated, 'deleted': diff.deleted}
+
+        # Yazılan içerik bir sonraki farkın tabanı: damga yazımdan sonra yenilenir
+        if stamp != fingerprint or stats['mode'] != 'unchanged':
+            worksheet.spreadsheet.batch_update({'requests': self._stamp_requests(worksheet.id, fingerprint)})
+        self.snapshot_cache.save(spreadsheet_id, snapshot_key, fingerprint, values)
+        self.publish_manifest.record(spreadsheet_id, worksheet.title, worksheet.id, fingerprint)
+
+        logger.info(
+            f"'{worksheet.title}' yazıldı ({stats['mode']}): {stats['cells']} hücre, "
+            f"+{stats['inserted']} / ~{stats['updated']} / -{stats['deleted']} satır"
+        )
+        return stats
+
+    def check_grid_capacity(
+        self,
+        spreadsheet: gspread.Spreadsheet,
+        sheet_id: int,
+        rows: int,
+        cols: int
+    ) -> int:
+        """
+        Worksheet'in rows x cols grid'e çıkması spreadsheet hücre sınırını aşar mı kontrol et
 
-    def _find_service_account_file(self) -> Optional[str]:
-        """service_account.json dosyasını bul (PyInstaller desteğiyle)"""
-        possible_paths = [
-            # PyInstaller'ın geçici extract klasörü (_MEIPASS)
-            os.path.join(getattr(sys, '_MEIPASS', self.base_dir), 'service_account.json'),
-            # Exe'nin bulunduğu dizin
-            os.path.join(self.base_dir, 'service_account.json'),
-            # Home dizini
-            os.path.join(Path.home(), 'service_account.json'),
-            # Varsayılan konum
-            'D:/GoogleDrive/PRG/OAuth2/service_account.json',
-        ]
+        Args:
+            spreadsheet: Spreadsheet nesnesi
+            sheet_id: Boyutu planlanan worksheet'in sheetId'si
+            rows, cols: Planlanan grid boyutu
 
-        for path in possible_paths:
-            if os.path.exists(path):
-                logger.info(f"Service Account dosyası bulundu: {path}")
-                return path
+        Returns:
+            İşlemden sonra spreadsheet'te kalacak boş hücre kapasitesi
 
-        return None
+        Raises:
+            ValueError: SPREADSHEET_CELL_LIMIT aşılıyorsa (satır kırpılmaz)
+        """
+        return self.check_grids_capacity(spreadsheet, {sheet_id: (rows, cols)})
 
-    def _authorize(self) -> gspread.Client:
+    def check_grids_capacity(
+        self,
+        spreadsheet: gspread.Spreadsheet,
+        planned: Dict[int, Tuple[int, int]],
+        metadata: Optional[Dict[str, Any]] = None,
+        removed: Tuple[int, ...] = ()
+    ) -> int:
         """
-        Google Service Account ile yetkilendirme
+        Birden fazla worksheet'in planlanan grid'leri hücre sınırını aşar mı kontrol et
+
+        Args:
+            spreadsheet: Spreadsheet nesnesi
+            planned: {sheetId: (satır, sütun)}; henüz eklenmemiş sayfalar da olabilir
+            metadata: Elde varsa gridProperties içeren sayfa metadata'sı (None ise okunur)
+            removed: Aynı işlemde silinecek sayfaların sheetId'leri
 
         Returns:
-            gspread.Client: Yetkilendirilmiş Google Sheets client
+            İşlemden sonra spreadsheet'te kalacak boş hücre kapasitesi
+
+        Raises:
+            ValueError: SPREADSHEET_CELL_LIMIT aşılıyorsa (satır kırpılmaz)
         """
-        try:
-            # Service Account credentials oluştur
-            creds = Credentials.from_service_account_file(
-                self.service_account_file,
-                scopes=self.SCOPES
+        if metadata is None:
+            metadata = spreadsheet.fetch_sheet_metadata(params={
+                'fields': 'sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))'
+            })
+        used = 0
+        for sheet in metadata.get('sheets', []):
+            properties = sheet['properties']
+            if properties['sheetId'] in planned or properties['sheetId'] in removed:
+                continue
+            grid = properties.get('gridProperties', {})
+            used += grid.get('rowCount', 0) * grid.get('columnCount', 0)
+
+        requested = sum(rows * cols for rows, cols in planned.values())
+        remaining = self.SPREADSHEET_CELL_LIMIT - used - requested
+        if remaining < 0:
+            grids = ', '.join(f"{rows}x{cols}" for rows, cols in planned.values())
+            raise ValueError(
+                f"Spreadsheet hücre sınırı aşılıyor: {grids} grid için "
+                f"{-remaining} hücre eksik (diğer sayfalar {used} hücre kullanıyor)"
             )
+        return remaining
 
-            # gspread client oluştur
-            logger.info("Service Account ile yetkilendirme başarılı")
-            return gspread.authorize(creds)
-
-        except Exception as e:
-            logger.error(f"Service Account yetkilendirme hatası: {e}")
-            raise
+    def _write_full(self, worksheet: gspread.Worksheet, values: List[List], value_input_option: str):
+        """
+        Worksheet'i baştan yaz: grid kapasitesi bir kez planlanır, veri parçalı akıtılır
 
-    def load_spreadsheet_configs(self) -> Dict[str, str]:
+        Temizleme ve grid'i tam gereken boyuta getirme tek batchUpdate'tir;
+        satırlar ardından upload_values ile hücre/boyut sınırlı parçalar halinde
+        yazılır, böylece satır sayısı için üst sınır yoktur ve tekrar resize gerekmez.
         """
-        PRGsheet → Config sayfasından tüm spreadsheet ID'lerini yükle
-        
+        # Donmuş başlık satırı varken grid tek satıra indirilemez
+        rows = max(len(values), 2)
+        cols = max((len(row) for row in values), default=1)
+        self.check_grid_capacity(worksheet.spreadsheet, worksheet.id, rows, cols)
+
+        # Temizlikten sonra önceki yarım yüklemenin onaylı parçaları sayfada yok:
+        # hedefin checkpoint'leri temizlikten önce silinir, yükleme baştan yapılır
+        self._purge_upload_checkpoints(worksheet)
+
+        worksheet.spreadsheet.batch_update({'requests': [
+            {'updateCells': {'range': {'sheetId': worksheet.id}, 'fields': 'userEnteredValue'}},
+            *self._stamp_requests(worksheet.id),
+            {'updateSheetProperties': {
+                'properties': {'sheetId': worksheet.id,
+                               'gridProperties': {'rowCount': rows, 'columnCount': cols}},
+                'fields': 'gridProperties(rowCount,columnCount)',
+            }},
+        ]})
+        self.invalidate_handles(worksheet.spreadsheet.id, worksheet.title)
+        self.upload_values(worksheet, values, value_input_option, resume=False)
+
+    def publish_worksheet_values(
+        self,
+        worksheet_name: str,
+        values: List[List],
+        spreadsheet_id: str = None,
+        key_column: Optional[str] = None,
+        value_input_option: str = 'RAW'
+    ) -> Dict[str, Any]:
         """
-        if self.config_cache:
-            return self.config_cache
+        Worksheet'i çift tamponla yayınla (okuyucular boş/yarım sayfa görmez)
+
+        Veri önce gizli '<ad>_staging' worksheet'ine yazılır (write_worksheet_values
+        ile, tampon bir önceki yayının içeriğini taşır), ardından tek bir
+        batchUpdate ile tamponun değerleri canlı sayfaya kopyalanır (copyPaste,
+        PASTE_VALUES) ve artan eski hücreler temizlenir. Sayfalar takas
+        edilmediğinden canlı sayfanın gid'i, biçimi, dondurulmuş başlığı,
+        filtreleri ve korumalı aralıkları korunur; #gid= linkleri ve diğer
+        sayfalardaki formüller bozulmaz.
+
+        Args:
+            worksheet_name: Yayınlanacak worksheet adı ('Stok', 'Plan' gibi)
+            values: Yazılacak 2D liste (ilk satır başlık)
+            spreadsheet_id: Spreadsheet ID (None ise PRGsheet)
+            key_column: Tampon yazımında satırları eşleştiren sütun
+            value_input_option: 'RAW' veya 'USER_ENTERED'
+
+        Returns:
+            write_worksheet_values istatistikleri
+        """
+        spreadsheet_id = spreadsheet_id or self.MASTER_SPREADSHEET_ID
+        staging_name = f"{worksheet_name}{self.PUBLISH_STAGING_SUFFIX}"
 
+        # İçerik son yayınla aynıysa tampon yazımı ve takas yapılmaz
+        fingerprint = values_fingerprint(values, value_input_option)
         try:
-            # Ana config sayfasını aç
-            master_sheet = self.gc.open_by_key(self.MASTER_SPREADSHEET_ID)
-            config_worksheet = master_sheet.worksheet('Config')
+            live = self.get_worksheet(worksheet_name, spreadsheet_id)
+            if self.publish_manifest.matches(spreadsheet_id, worksheet_name, live.id, fingerprint):
+                logger.info(f"'{worksheet_name}' içeriği değişmedi, yayın atlandı")
+                return {'mode': 'skipped', 'cells': 0, 'inserted': 0, 'updated': 0, 'deleted': 0}
+        except Exception:
+            pass
 
-            # Tüm config'leri oku
-            configs = config_worksheet.get_all_records()
+        spreadsheet = self.open_by_key(spreadsheet_id)
+        worksheets = {worksheet.title: worksheet for worksheet in spreadsheet.worksheets()}
 
-            # Dictionary'ye çevir (sadece aktif olanları)
-            spreadsheet_map = {}
-            for row in configs:
-                app_name = str(row.get('App Name', '')).strip()
-                spreadsheet_id = str(row.get('Spreadsheet ID', '')).strip()
-                active = str(row.get('Active', 'TRUE')).strip().upper()
+        live = worksheets.get(worksheet_name)
+        if live is None:
+            # İlk yayın: okuyan kimse yok, doğrudan yaz (grid boyutu yazımda planlanır)
+            live = spreadsheet.add_worksheet(
+                title=worksheet_name, rows=2, cols=max(len(values[0]), 1)
+            )
+            self.invalidate_handles(spreadsheet_id)
+            return self.write_worksheet_values(live, values, key_column, value_input_option)
+
+        staging = worksheets.get(staging_name)
+        if staging is None:
+            # Grid boyutu ilk yazımda (_write_full) bir kez planlanır
+            staging = spreadsheet.add_worksheet(
+                title=staging_name, rows=2, cols=max(len(values[0]), 1)
+            )
+            staging.hide()
+
+        stats = self.write_worksheet_values(
+            staging, values, key_column, value_input_option, force=True
+        )
+
+        # Tek batchUpdate atomik uygulanır: okuyucular yarım sayfa görmez
+        rows = max(len(values), 1)
+        cols = max((len(row) for row in values), default=1)
+        requests = []
+        if live.row_count < rows:
+            requests.append({'appendDimension': {
+                'sheetId': live.id, 'dimension': 'ROWS', 'length': rows - live.row_count,
+            }})
+        if live.col_count < cols:
+            requests.append({'appendDimension': {
+                'sheetId': live.id, 'dimension': 'COLUMNS', 'length': cols - live.col_count,
+            }})
+        requests.append({'copyPaste': {
+            'source': {'sheetId': staging.id, 'startRowIndex': 0, 'endRowIndex': rows,
+                       'startColumnIndex': 0, 'endColumnIndex': cols},
+            'destination': {'sheetId': live.id, 'startRowIndex': 0, 'endRowIndex': rows,
+                            'startColumnIndex': 0, 'endColumnIndex': cols},
+            'pasteType': 'PASTE_VALUES',
+        }})
+        if rows < live.row_count:
+            requests.append({'updateCells': {
+                'range': {'sheetId': live.id, 'startRowIndex': rows},
+                'fields': 'userEnteredValue',
+            }})
+        if cols < live.col_count:
+            requests.append({'updateCells': {
+                'range': {'sheetId': live.id, 'startRowIndex': 0, 'endRowIndex': rows,
+                          'startColumnIndex': cols},
+                'fields': 'userEnteredValue',
+            }})
+        requests.extend(self._stamp_requests(live.id))
+        spreadsheet.batch_update({'requests': requests})
+
+        # Canlı sayfanın son yazım snapshot'ı artık geçersiz
+        self.invalidate_handles(spreadsheet_id)
+        self.snapshot_cache.invalidate(spreadsheet_id, f"{worksheet_name}#written")
+        self.publish_manifest.record(spreadsheet_id, worksheet_name, live.id, fingerprint)
+
+        logger.info(f"'{worksheet_name}' tampondan yayınlandı")
+        return stats
+
+    def publish_worksheets(
+        self,
+        payloads: Dict[str, List[List]],
+        spreadsheet_id: str = None,
+        value_input_option: str = 'RAW'
+    ) -> Dict[str, int]:
+        """
+        Birden fazla worksheet'i toplu istekle yayınla
 
-                if app_name and spreadsheet_id and active == 'TRUE':
-                    spreadsheet_map[app_name] = spreadsheet_id
+        Sayfa başına open/clear/update yerine: bir metadata okuması, eksik sayfa
+        ekleme + grid büyütme için bir batchUpdate, tüm değerler için
+        values.batchUpdate (PUBLISH_MAX_CELLS_PER_CALL / PUBLISH_MAX_BYTES_PER_CALL'a
+        göre bölünür; bu sınırları aşan sayfalar satır parçalarına ayrılır) ve
+        eski içeriğin artan kısmını temizleyen bir batchUpdate. Planlanan
+        grid'ler yazımdan önce spreadsheet hücre sınırına göre kontrol edilir.
+        Değerler temizlikten önce yazıldığından sayfalar hiçbir an boş görünmez.
+        Parmak izi son yayınla aynı olan sayfalar hiç yazılmaz.
 
-            self.config_cache = spreadsheet_map
-            logger.info(f"{len(spreadsheet_map)} spreadsheet config yüklendi")
-            return spreadsheet_map
+        Args:
+            payloads: {worksheet_adı: 2D liste (ilk satır başlık)}; boş liste
+                verilirse başlık satırı korunur, geri kalanı temizlenir
+            spreadsheet_id: Spreadsheet ID (None ise PRGsheet)
+            value_input_option: 'RAW' veya 'USER_ENTERED'
 
-        except Exception as e:
-            logger.error(f"Config yükleme hatası: {e}")
+        Returns:
+            {worksheet_adı: yazılan hücre sayısı} (içeriği değişmeyenler hariç)
+        """
+        if not payloads:
             return {}
 
-    def get_spreadsheet(self, app_name: str) -> Optional[gspread.Spreadsheet]:
+        spreadsheet_id = spreadsheet_id or self.MASTER_SPREADSHEET_ID
+        spreadsheet = self.open_by_key(spreadsheet_id)
+        metadata = spreadsheet.fetch_sheet_metadata(params={
+            'fields': 'sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))'
+        })
+        sheets = {sheet['properties']['title']: sheet['properties'] for sheet in metadata.get('sheets', [])}
+        used_ids = {properties['sheetId'] for properties in sheets.values()}
+
+        # Toplu yayına geçen sayfaların publish_worksheet_values'tan kalan
+        # gizli tamponları silinir
+        prepare, removed = [], []
+        for title in payloads:
+            staging_name = f"{title}{self.PUBLISH_STAGING_SUFFIX}"
+            staging = sheets.pop(staging_name, None)
+            if staging is not None:
+                prepare.append({'deleteSheet': {'sheetId': staging['sheetId']}})
+                removed.append(staging['sheetId'])
+                self.publish_manifest.forget(spreadsheet_id, staging_name)
+                self.snapshot_cache.invalidate(spreadsheet_id, f"{staging_name}#written")
+                logger.info(f"Kullanılmayan tampon sayfa silindi: {staging_name}")
+
+        # İçeriği son yayınla aynı olan sayfalar atlanır
+        fingerprints = {
+            title: values_fingerprint(values, value_input_option) for title, values in payloads.items()
+        }
+        unchanged = [
+            title for title in payloads
+            if title in sheets and self.publish_manifest.matches(
+                spreadsheet_id, title, sheets[title]['sheetId'], fingerprints[title]
+            )
+        ]
+        if unchanged:
+            logger.info(f"İçeriği değişmeyen sayfalar atlandı: {', '.join(unchanged)}")
+            payloads = {title: values for title, values in payloads.items() if title not in unchanged}
+            if not payloads:
+                if prepare:
+                    spreadsheet.batch_update({'requests': prepare})
+                    self.invalidate_handles(spreadsheet_id)
+                return {}
+
+        # 1. Eksik sayfaları ekle, küçük gridleri büyüt
+        for title, values in payloads.items():
+            rows = max(len(values), 1)
+            cols = max((len(row) for row in values), default=1)
+            properties = sheets.get(title)
+            if properties is None:
+                sheet_id = random.randint(1, 2 ** 31 - 1)
+                while sheet_id in used_ids:
+                    sheet_id = random.randint(1, 2 ** 31 - 1)
+                used_ids.add(sheet_id)
+                # Grid veriye göre boyutlanır (hücre sınırına karşı); küçük
+                # satır payı sonraki yayınlarda resize ihtiyacını azaltır
+                grid = {'rowCount': rows + self.PUBLISH_NEW_SHEET_ROW_MARGIN, 'columnCount': cols}
+                sheets[title] = {'sheetId': sheet_id, 'title': title, 'gridProperties': grid}
+                prepare.append({'addSheet': {'properties': {
+                    'sheetId': sheet_id, 'title': title, 'gridProperties': grid,
+                }}})
+                continue
+
+            grid = properties.setdefault('gridProperties', {})
+            if grid.get('rowCount', 0) < rows or grid.get('columnCount', 0) < cols:
+                grid['rowCount'] = max(grid.get('rowCount', 0), rows)
+                grid['columnCount'] = max(grid.get('columnCount', 0), cols)
+                prepare.append({'updateSheetProperties': {
+                    'properties': {'sheetId': properties['sheetId'], 'gridProperties': dict(grid)},
+                    'fields': 'gridProperties(rowCount,columnCount)',
+                }})
+
+        # Büyütülen/eklenen grid'ler hücre sınırını aşmamalı (hiçbir şey yazılmadan)
+        planned = {}
+        for title in payloads:
+            grid = sheets[title]['gridProperties']
+            planned[sheets[title]['sheetId']] = (grid.get('rowCount', 0), grid.get('columnCount', 0))
+        self.check_grids_capacity(spreadsheet, planned, metadata, tuple(removed))
+
+        if prepare:
+            spreadsheet.batch_update({'requests': prepare})
+
+        # 2. Tüm değerleri values.batchUpdate ile yaz (hücre ve boyut sınırına
+        # göre böl; büyük sayfalar satır parçalarına ayrılır)
+        written = {}
+        data, cells, size = [], 0, 0
+        for title, values in payloads.items():
+            written[title] = sum(len(row) for row in values)
+            chunks = plan_upload_chunks(
+                values, self.PUBLISH_MAX_CELLS_PER_CALL, self.PUBLISH_MAX_BYTES_PER_CALL
+            )
+            for start, end in chunks:
+                rows = values[start:end]
+                chunk_cells = sum(max(len(row), 1) for row in rows)
+                chunk_size = len(json.dumps(rows, ensure_ascii=False, default=str).encode('utf-8'))
+                if data and (cells + chunk_cells > self.PUBLISH_MAX_CELLS_PER_CALL
+                             or size + chunk_size > self.PUBLISH_MAX_BYTES_PER_CALL):
+                    spreadsheet.values_batch_update({'valueInputOption': value_input_option, 'data': data})
+                    data, cells, size = [], 0, 0
+                data.append({'range': f"{_to_a1_range(title)}!A{start + 1}", 'values': rows})
+                cells += chunk_cells
+                size += chunk_size
+        if data:
+            spreadsheet.values_batch_update({'valueInputOption': value_input_option, 'data': data})
+
+        # 3. Yeni verinin dışında kalan eski hücreleri temizle; write_worksheet_values
+        # damgası ve snapshot'ı artık bu içeriği tanımlamıyor
+        cleanup = []
+        for title, values in payloads.items():
+            properties = sheets[title]
+            grid = properties['gridProperties']
+            cleanup.extend(self._stamp_requests(properties['sheetId']))
+            self.snapshot_cache.invalidate(spreadsheet_id, f"{title}#written")
+            rows = len(values) if values else 1
+            cols = max((len(row) for row in values), default=0)
+            if rows < grid['rowCount']:
+                cleanup.append({'updateCells': {
+                    'range': {'sheetId': properties['sheetId'], 'startRowIndex': rows},
+                    'fields': 'userEnteredValue',
+                }})
+            if values and cols < grid['columnCount']:
+                cleanup.append({'updateCells': {
+                    'range': {'sheetId': properties['sheetId'], 'startRowIndex': 0,
+                              'endRowIndex': rows, 'startColumnIndex': cols},
+                    'fields': 'userEnteredValue',
+                }})
+        spreadsheet.batch_update({'requests': cleanup})
+
+        for title in payloads:
+            self.publish_manifest.record(spreadsheet_id, title, sheets[title]['sheetId'], fingerprints[title])
+        self.invalidate_handles(spreadsheet_id)
+        logger.info(
+            f"{len(payloads)} worksheet toplu yayınlandı: {sum(written.values())} hücre "
+            f"({', '.join(payloads)})"
+        )
+        return written
+
+    def upload_values(
+        self,
+        worksheet: gspread.Worksheet,
+        values: List[List],
+        value_input_option: str = 'RAW',
+        max_workers: int = None,
+        resume: bool = False
+    ) -> int:
         """
-        App adına göre spreadsheet'i getir
+        Büyük veriyi boyuta göre parçalayıp paralel ve kaldığı yerden devam edebilir yükle
+
+        Parçalar UPLOAD_MAX_CELLS / UPLOAD_MAX_BYTES sınırlarıyla (satır sayısına
+        göre değil) oluşturulur ve çakışmayan aralıklar olarak sınırlı bir
+        thread havuzundan gönderilir; tüm istekler ortak kota zamanlayıcısından
+        geçer. Onaylanan parçalar lokal checkpoint'e yazılır: yükleme yarıda
+        kalırsa resume=True ile aynı veriyle tekrar çağrıldığında sadece kalan
+        parçalar gönderilir.
+
+        resume yalnızca yarım kalan denemeden sonra hedef temizlenmediyse ya da
+        yeniden boyutlandırılmadıysa kullanılmalıdır; aksi halde onaylı parçalar
+        sayfada artık yoktur. Varsayılan (False) hedefin eski checkpoint'lerini
+        siler ve tüm parçaları gönderir.
 
         Args:
-            app_name: 'Risk', 'Etiket', 'Kasa', 'PRGsheet' gibi
+            worksheet: Hedef worksheet (A1'den itibaren yazılır)
+            values: Yazılacak 2D liste (ilk satır başlık)
+            value_input_option: 'RAW' veya 'USER_ENTERED'
+            max_workers: Eşzamanlı istek sayısı (None ise UPLOAD_MAX_WORKERS)
+            resume: True ise aynı veri için kalan checkpoint'ten devam et
 
         Returns:
-            gspread.Spreadsheet nesnesi veya None
+            Bu çağrıda gönderilen parça sayısı
 
-        Örnek:
-            risk_sheet = manager.get_spreadsheet('Risk')
-            worksheet = risk_sheet.worksheet('Risk')
+        Raises:
+            Exception: Bir parça gönderilemezse (checkpoint korunur)
         """
-        # Config'leri yükle (cache yoksa)
-        if not self.config_cache:
-            self.load_spreadsheet_configs()
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        # Spreadsheet ID'yi al
-        spreadsheet_id = self.config_cache.get(app_name)
+        if not values:
+            return 0
 
-        if not spreadsheet_id:
-            logger.error(f"'{app_name}' için spreadsheet ID bulunamadı!")
-            logger.info(f"Mevcut app'ler: {list(self.config_cache.keys())}")
-            return None
+        chunks = plan_upload_chunks(values, self.UPLOAD_MAX_CELLS, self.UPLOAD_MAX_BYTES)
+        digest = hashlib.sha1(
+            json.dumps([value_input_option, values], ensure_ascii=False, default=str).encode('utf-8')
+        ).hexdigest()
+        checkpoint_path = os.path.join(
+            self._upload_checkpoint_dir(), f"{self._upload_target_key(worksheet)}-{digest}.json"
+        )
+
+        # Aynı hedefin başka veriye ait (ya da resume edilmeyecek) checkpoint'leri geçersiz
+        self._purge_upload_checkpoints(worksheet, keep=checkpoint_path if resume else None)
+
+        acknowledged = set()
+        if resume and os.path.exists(checkpoint_path):
+            try:
+                with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                    acknowledged = {tuple(chunk) for chunk in json.load(f).get('acknowledged', [])}
+                logger.info(f"Yükleme checkpoint'ten devam ediyor: {len(acknowledged)}/{len(chunks)} parça hazır")
+            except Exception as e:
+                logger.warning(f"Upload checkpoint okunamadı: {e}")
+
+        pending = [chunk for chunk in chunks if chunk not in acknowledged]
+        checkpoint_lock = threading.Lock()
+        priority = self.scheduler.current_priority()
+
+        def send(chunk: Tuple[int, int]):
+            start, end = chunk
+            with self.scheduler.priority(priority):
+                worksheet.update(
+                    values=values[start:end], range_name=f"A{start + 1}",
+                    value_input_option=value_input_option
+                )
+            with checkpoint_lock:
+                acknowledged.add(chunk)
+                os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+                tmp_path = f"{checkpoint_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'acknowledged': sorted(acknowledged)}, f)
+                os.replace(tmp_path, checkpoint_path)
+
+        workers = max(1, min(max_workers or self.UPLOAD_MAX_WORKERS, len(pending) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sheets-upload') as pool:
+            futures = [pool.submit(send, chunk) for chunk in pending]
+            errors = [future.exception() for future in as_completed(futures)]
+        errors = [error for error in errors if error is not None]
+        if errors:
+            logger.error(
+                f"'{worksheet.title}' yüklemesi yarım kaldı: "
+                f"{len(acknowledged)}/{len(chunks)} parça onaylandı"
+            )
+            raise errors[0]
 
-        # Spreadsheet'i aç
         try:
-            spreadsheet = self.gc.open_by_key(spreadsheet_id)
-            logger.info(f"'{app_name}' spreadsheet'i açıldı")
-            return spreadsheet
-        except Exception as e:
-            logger.error(f"'{app_name}' spreadsheet açma hatası: {e}")
-            return None
+            os.remove(checkpoint_path)
+        except OSError:
+            pass
+        logger.info(f"'{worksheet.title}' yüklendi: {len(values)} satır, {len(pending)} parça")
+        return len(pending)
 
-    def get_worksheet_data(
-        self,
-        app_name: str,
-        worksheet_name: str
-    ) -> List[List]:
+    def _upload_checkpoint_dir(self) -> str:
+        return os.path.join(self.base_dir, '.upload_checkpoints')
+
+    @staticmethod
+    def _upload_target_key(worksheet: gspread.Worksheet) -> str:
+        return hashlib.sha1(
+            f"{worksheet.spreadsheet.id}|{worksheet.title}".encode('utf-8')
+        ).hexdigest()[:16]
+
+    def _purge_upload_checkpoints(self, worksheet: gspread.Worksheet = None, keep: str = None):
         """
-        Belirli bir app'in worksheet'inden veri çek
+        Yükleme checkpoint'lerini temizle
 
-        Args:
-            app_name: 'Risk', 'Etiket' gibi
-            worksheet_name: 'NoRisk', 'Settings' gibi
+        worksheet verilirse o hedefin keep dışındaki tüm checkpoint'leri, her
+        durumda da UPLOAD_CHECKPOINT_MAX_AGE'den eski checkpoint'ler silinir.
+        """
+        checkpoint_dir = self._upload_checkpoint_dir()
+        prefix = f"{self._upload_target_key(worksheet)}-" if worksheet is not None else None
+        cutoff = time.time() - self.UPLOAD_CHECKPOINT_MAX_AGE
+        try:
+            names = os.listdir(checkpoint_dir)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(checkpoint_dir, name)
+            if path == keep:
+                continue
+            try:
+                if (prefix and name.startswith(prefix)) or os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
 
-        Returns:
-            Worksheet verileri (2D liste)
+    def _get_settings_revision(self) -> Optional[str]:
+        """PRGsheet'in Drive revizyonu (settings cache doğrulaması için)"""
+        return self.get_spreadsheet_revision(self.MASTER_SPREADSHEET_ID)
 
-        Örnek:
-            data = manager.get_worksheet_data('PRGsheet', 'NoRisk')
-            # [['Cari Kod'], ['120.01.001'], ['120.01.002'], ...]
+    def _load_local_settings(self) -> Optional[Dict[str, str]]:
         """
-        spreadsheet = self.get_spreadsheet(app_name)
+        Lokal cache'i revizyon kontrolüyle yükle
 
-        if not spreadsheet:
-            return []
+        Son kontrolden bu yana SETTINGS_REVISION_CHECK_INTERVAL geçmemişse cache
+        doğrudan kullanılır. Geçmişse PRGsheet'in modifiedTime değeri cache'teki
+        ile karşılaştırılır; değişmişse None döner (Sheets'ten yeniden çekilir).
+        Revizyon okunamazsa (çevrimdışı vb.) cache kullanılmaya devam eder.
+        """
+        cached_settings, meta = self.local_cache.load_entry()
+        if not cached_settings:
+            return None
 
-        try:
-            worksheet = spreadsheet.worksheet(worksheet_name)
-            data = worksheet.get_all_values()
-            logger.info(f"'{app_name}' → '{worksheet_name}': {len(data)} satır okundu")
-            return data
-        except Exception as e:
-            logger.error(f"Worksheet okuma hatası ({app_name}/{worksheet_name}): {e}")
-            return []
+        # App'ten bağımsız anahtar haritası olmayan cache bir kez yeniden çekilir
+        if 'fallback' not in meta:
+            return None
+        fallback = meta['fallback']
+
+        if time.time() - meta.get('checked_at', 0) < self.SETTINGS_REVISION_CHECK_INTERVAL:
+            self.fallback_settings = fallback
+            return cached_settings
+
+        revision = self._get_settings_revision()
+        if revision is None:
+            self.fallback_settings = fallback
+            return cached_settings
+
+        if meta.get('revision') == revision:
+            self.local_cache.save(cached_settings, revision=revision, fallback=fallback)
+            self.fallback_settings = fallback
+            return cached_settings
+
+        logger.info(f"Settings revizyonu değişti ({meta.get('revision')} → {revision})")
+        return None
 
     def get_settings(self, use_cache: bool = True) -> Dict[str, str]:
         """
@@ -317,7 +2802,9 @@ class CentralConfigManager:
         HIZLI LOKAL CACHE:
         - Ilk calistirmada: Google Sheets'ten ceker, lokal cache'e kaydeder
         - Sonraki calistirmalarda: Lokal cache'ten okur (HIZLI!)
-        - Google Sheets degisirse: use_cache=False ile yenile
+        - En fazla SETTINGS_REVISION_CHECK_INTERVAL'de bir PRGsheet'in Drive
+          revizyonu kontrol edilir; degismisse ayarlar yeniden cekilir
+        - Hemen yenilemek icin: use_cache=False
 
         Settings/Ayar sayfası formatı:
         | App Name | Key              | Value                  | Description      |
@@ -339,7 +2826,7 @@ class CentralConfigManager:
 
         # Lokal cache'i dene (use_cache=True ise)
         if use_cache:
-            cached_settings = self.local_cache.load()
+            cached_settings = self._load_local_settings()
             if cached_settings:
                 self.settings_cache = cached_settings
                 logger.info(f"FAST: {len(cached_settings)} settings loaded from local cache")
@@ -348,16 +2835,23 @@ class CentralConfigManager:
         # Google Sheets'ten cek
         try:
             logger.info("Fetching ALL settings from Google Sheets...")
-            master_sheet = self.gc.open_by_key(self.MASTER_SPREADSHEET_ID)
+
+            # Revizyonu veriden önce al: arada yapılan değişiklik bir sonraki
+            # kontrolde yakalanır
+            revision = self._get_settings_revision()
 
             # Önce "Ayar" sayfasını dene, yoksa "Settings" dene
             try:
-                settings_worksheet = master_sheet.worksheet('Ayar')
-            except:
-                settings_worksheet = master_sheet.worksheet('Settings')
+                settings_worksheet = self.get_worksheet('Ayar')
+            except Exception:
+                settings_worksheet = self.get_worksheet('Settings')
 
-            # Tüm ayarları oku
-            settings = settings_worksheet.get_all_records()
+            # Tüm ayarları oku (tek istek; kayıtlar başlık satırından kurulur)
+            all_values = settings_worksheet.get_all_values()
+            headers = all_values[0] if all_values else []
+            settings = [dict(zip(headers, row)) for row in all_values[1:]]
+
+            fallback = build_fallback_settings(all_values)
 
             # TÜM ayarları yükle (Global ve App-specific)
             settings_dict = {}
@@ -378,9 +2872,10 @@ class CentralConfigManager:
 
             # Bellekte cache'e kaydet
             self.settings_cache = settings_dict
+            self.fallback_settings = fallback
 
-            # Lokal cache'e sifreli kaydet
-            self.local_cache.save(settings_dict)
+            # Lokal cache'e sifreli kaydet (revizyon bilgisiyle)
+            self.local_cache.save(settings_dict, revision=revision, fallback=fallback)
 
             logger.info(f"{len(settings_dict)} settings loaded and cached (ALL from Ayar sheet)")
             return settings_dict
@@ -393,6 +2888,9 @@ class CentralConfigManager:
         """
         PRGsheet → Ayar sayfasından belirli bir app'in ayarlarını yükle
 
+        get_settings() ile yüklenmiş ayar haritasından cevaplanır; app başına
+        indeks ilk çağrıda bir kez kurulur.
+
         Ayar sayfası formatı:
         | App Name | Key              | Value                  | Description      |
         |----------|------------------|------------------------|------------------|
@@ -410,30 +2908,27 @@ class CentralConfigManager:
             baslik_url = etiket_settings.get('ETIKET_BASLIK_URL')
         """
         try:
-            master_sheet = self.gc.open_by_key(self.MASTER_SPREADSHEET_ID)
-
-            # Önce "Ayar" sayfasını dene, yoksa "Settings" dene
-            try:
-                settings_worksheet = master_sheet.worksheet('Ayar')
-            except:
-                settings_worksheet = master_sheet.worksheet('Settings')
-
-            # Tüm ayarları oku
-            settings = settings_worksheet.get_all_records()
-
-            # Belirli app'e ait ayarları filtrele
-            app_settings = {}
-            for row in settings:
-                row_app_name = str(row.get('App Name', '')).strip()
-                key = str(row.get('Key', '')).strip()
-                value = str(row.get('Value', '')).strip()
-
-                # Bu app'e ait ayarları ekle
-                if row_app_name == app_name and key:
-                    app_settings[key] = value
-
-            logger.info(f"{len(app_settings)} ayar yüklendi (App: {app_name})")
-            return app_settings
+            # Bellekteki/lokal cache'teki ayar haritasını kullan (Sheets'e gitmez)
+            settings = self.get_settings()
+
+            # Settings yeniden yüklendiyse indeksi sıfırla
+            if self._app_index_source is not settings:
+                self._app_settings_index = {}
+                self._app_index_source = settings
+
+            app_settings = self._app_settings_index.get(app_name)
+            if app_settings is None:
+                # 'AppName_Key' formatındaki anahtarlardan app indeksini bir kez kur
+                prefix = f"{app_name}_"
+                app_settings = {
+                    key[len(prefix):]: value
+                    for key, value in settings.items()
+                    if key.startswith(prefix) and len(key) > len(prefix)
+                }
+                self._app_settings_index[app_name] = app_settings
+                logger.info(f"{len(app_settings)} ayar yüklendi (App: {app_name})")
+
+            return dict(app_settings)
 
         except Exception as e:
             logger.warning(f"App settings yükleme hatası ({app_name}): {e}")
@@ -459,14 +2954,493 @@ class CentralConfigManager:
         """Config cache'ini temizle ve yeniden yükle (lokal + bellekte)"""
         self.config_cache = {}
         self.settings_cache = {}
+        self.fallback_settings = {}
+        self._app_settings_index = {}
+        self._app_index_source = None
         self.local_cache.clear()
+        self.registry.reset()
+        self.invalidate_handles()
         logger.info("Config cache cleared (local + memory)")
 
+    def cached_query(
+        self,
+        connection_string: str,
+        sql: str,
+        params: tuple = (),
+        max_age: float = None,
+        query_timeout: int = None
+    ) -> 'pd.DataFrame':
+        """
+        SQL sorgusunu sonuç cache'i üzerinden çalıştır
+
+        Aynı bağlantı, SQL ve parametrelerle max_age saniye içinde çalıştırılmış
+        bir sonuç varsa (başka bir işten bile) veritabanına gidilmez. Sonuç,
+        açıklaması (description) olan ilk sonuç setidir; boş sonuçlar saklanmaz.
+
+        Args:
+            connection_string: ODBC bağlantı dizesi (paylaşılan havuz kullanılır)
+            sql: Çalıştırılacak sorgu ('?' parametreli)
+            params: Sorgu parametreleri
+            max_age: Tazelik süresi (None: Ayar'daki SQL_CACHE_SURESI veya QUERY_CACHE_MAX_AGE)
+            query_timeout: Sorgu zaman aşımı (saniye)
+
+        Returns:
+            Sonuç DataFrame'i
+
+        Örnek:
+            df = manager.cached_query(conn_str, "EXEC dbo.sp_SiparisOperasyonlari ...")
+        """
+        import pandas as pd
+
+        if max_age is None:
+            max_age = self.registry.get('SQL_CACHE_SURESI')
+            if max_age is None:
+                max_age = self.QUERY_CACHE_MAX_AGE
+
+        key = QueryResultCache.make_key(connection_string, sql, tuple(params))
+
+        # Aynı süreçteki eşzamanlı çağrılar sorguyu bir kez çalıştırır
+        with self.query_cache.key_lock(key):
+            cached = self.query_cache.load(key, max_age)
+            if cached is not None:
+                columns, data = cached
+                logger.info(f"Sorgu cache'ten okundu ({len(data[0]) if data else 0} satır)")
+                return pd.DataFrame.from_records(list(zip(*data)), columns=columns)
+
+            with pooled_connection(connection_string, query_timeout=query_timeout) as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(sql, tuple(params))
+
+                    # Açıklaması olan ilk sonuç setini bul (SET NOCOUNT yoksa önce satır sayıları gelir)
+                    while cursor.description is None:
+                        if not cursor.nextset():
+                            return pd.DataFrame()
+
+                    columns = [column[0] for column in cursor.description]
+                    rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+
+            if rows and max_age > 0:
+                self.query_cache.save(key, columns, [list(column) for column in zip(*rows)])
+            return pd.DataFrame.from_records(rows, columns=columns)
+
+
+# `--sheets-metrics` ile çalıştırıldıysa enstrümantasyonu baştan aç
+if _SHEETS_METRICS_REQUESTED:
+    CentralConfigManager.enable_call_metrics()
+
 
 # ============================================================================
 # YARDIMCI FONKSİYONLAR
 # ============================================================================
 
+def _to_a1_range(range_or_title: str) -> str:
+    """Worksheet adını A1 notasyonuna çevir ('Bekleyen' → \"'Bekleyen'\")"""
+    if '!' in range_or_title:
+        return range_or_title
+    return "'{}'".format(range_or_title.replace("'", "''"))
+
+
+def _column_letter(number: int) -> str:
+    """1 tabanlı sütun numarasını harfe çevir (1 → A, 27 → AA)"""
+    letters = ''
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _pad_rows(values: List[List]) -> List[List]:
+    """Satırları en uzun satır genişliğine tamamla (get_all_values ile aynı)"""
+    if not values:
+        return []
+    width = max(len(row) for row in values)
+    return [row + [''] * (width - len(row)) for row in values]
+
+
+def values_to_dataframe(values: List[List], numericise: bool = False) -> 'pd.DataFrame':
+    """
+    2D worksheet verisini DataFrame'e çevir (ilk satır başlık)
+
+    Args:
+        values: get_all_values / batchGet çıktısı
+        numericise: True ise sayısal metinler get_all_records gibi sayıya çevrilir
+
+    Returns:
+        pd.DataFrame (veri yoksa boş DataFrame)
+    """
+    import pandas as pd
+    from gspread.utils import numericise_all
+
+    if not values:
+        return pd.DataFrame()
+
+    rows = values[1:]
+    if numericise:
+        rows = [numericise_all(row) for row in rows]
+    return pd.DataFrame(rows, columns=values[0])
+
+
+# Worksheet şemalarında kullanılabilen sütun tipleri
+SHEET_SCHEMA_TYPES = ('int', 'decimal', 'date', 'category', 'text')
+
+# Google Sheets seri tarihlerinin başlangıcı (SERIAL_NUMBER render)
+_SHEETS_EPOCH = '1899-12-30'
+
+
+def apply_sheet_schema(df: 'pd.DataFrame', schema: Dict[str, str]) -> 'pd.DataFrame':
+    """
+    UNFORMATTED_VALUE ile okunmuş DataFrame'i şemaya göre sütun bazında tiple
+
+    Hücre hücre Python dönüşümü yapılmaz; her sütun tek pandas çağrısıyla çevrilir.
+    Şemada olmayan sütunlar '*' anahtarıyla verilen tipe çevrilir; '*' yoksa
+    API'den geldiği gibi (sayı/metin/bool) kalır.
+
+    Tipler:
+        int: Nullable Int64 (boş/geçersiz → <NA>)
+        decimal: float64 (boş/geçersiz → NaN)
+        date: datetime64 (seri numarası veya tarih metni; geçersiz → NaT)
+        category: pandas category (boş → NaN)
+        text: str; tam sayı değerli sayılarda '.0' oluşmaz (kodlar, ID'ler)
+
+    Args:
+        df: values_to_dataframe çıktısı
+        schema: {sütun: tip} ('*': diğer tüm sütunlar)
+
+    Returns:
+        Tiplenmiş DataFrame (yeni nesne)
+    """
+    import pandas as pd
+
+    invalid = {column: kind for column, kind in schema.items() if kind not in SHEET_SCHEMA_TYPES}
+    if invalid:
+        raise ValueError(f"Geçersiz şema tipi: {invalid}")
+
+    columns = dict(schema)
+    default = columns.pop('*', None)
+    if default:
+        for column in df.columns:
+            columns.setdefault(column, default)
+
+    df = df.copy()
+    for column, kind in columns.items():
+        if column not in df.columns:
+            continue
+
+        series = df[column]
+        if kind in ('int', 'decimal'):
+            numbers = pd.to_numeric(series, errors='coerce')
+            df[column] = numbers.round().astype('Int64') if kind == 'int' else numbers.astype('float64')
+
+        elif kind == 'date':
+            serials = pd.to_numeric(series, errors='coerce')
+            dates = pd.to_datetime(serials, unit='D', origin=_SHEETS_EPOCH, errors='coerce')
+            texts = series.where(serials.isna() & series.ne(''))
+            if texts.notna().any():
+                dates = dates.fillna(pd.to_datetime(texts, errors='coerce'))
+            df[column] = dates
+
+        elif kind == 'category':
+            df[column] = series.where(series.ne('')).astype('category')
+
+        else:
+            # Sadece sayı olarak gelen hücreler; '00123' gibi metinler olduğu gibi kalır
+            numbers = pd.to_numeric(series.where(series.map(type).isin((int, float))), errors='coerce')
+            integral = numbers.notna() & (numbers % 1 == 0)
+            text = series.astype(str)
+            text[integral] = numbers[integral].astype('int64').astype(str)
+            df[column] = text
+
+    return df
+
+
+def dataframe_to_sheet_values(
+    df: 'pd.DataFrame',
+    text_columns: Tuple[str, ...] = (),
+    as_text: bool = False,
+    date_format: Optional[str] = None,
+    downcast_ints: bool = False,
+    include_header: bool = True
+) -> List[List]:
+    """
+    DataFrame'i worksheet.update için 2D listeye çevir (sütun bazlı, vektörel)
+
+    Tüm modüllerin ortak serializer'ı; satır satır iterrows/apply yerine her
+    sütun numpy dizisi olarak tek seferde dönüştürülür.
+
+    Args:
+        df: Yazılacak DataFrame
+        text_columns: Başına apostrof eklenecek sütunlar (Cari Kodu, Kalem No,
+            Telefon gibi; USER_ENTERED'da sayıya/bilimsel notasyona çevrilmesin)
+        as_text: True ise tüm hücreler str yazılır (RAW yazan modüller)
+        date_format: datetime sütunları için strftime formatı (None: astype(str))
+        downcast_ints: True ise tam sayı değerli float sütunları int yazılır (1.0 → 1)
+        include_header: İlk satır olarak sütun başlıklarını ekle
+
+    Returns:
+        [[başlıklar], [satır1], ...]; NaN/NaT/None/±inf hücreler ''
+    """
+    columns = [
+        _serialize_column(
+            df.iloc[:, position], df.columns[position] in text_columns,
+            as_text, date_format, downcast_ints
+        )
+        for position in range(df.shape[1])
+    ]
+    rows = [list(row) for row in zip(*columns)] if columns else [[] for _ in range(len(df))]
+    if include_header:
+        rows.insert(0, df.columns.tolist())
+    return rows
+
+
+def _serialize_column(series: 'pd.Series', is_text: bool, as_text: bool,
+                      date_format: Optional[str], downcast_ints: bool):
+    """Tek sütunu JSON'a yazılabilir Python nesnelerinden oluşan object dizisine çevir"""
+    import numpy as np
+    import pandas as pd
+    from pandas.api import types
+
+    stringify = as_text or is_text
+
+    if types.is_datetime64_any_dtype(series):
+        blank = series.isna().to_numpy()
+        formatted = series.dt.strftime(date_format) if date_format else series.astype(str)
+        out = formatted.to_numpy(dtype=object)
+
+    elif types.is_bool_dtype(series) and not series.hasnans:
+        blank = np.zeros(len(series), dtype=bool)
+        out = series.astype(str).to_numpy(dtype=object) if stringify else series.to_numpy(dtype=object)
+
+    elif types.is_numeric_dtype(series):
+        numbers = series.to_numpy(dtype='float64', na_value=np.nan)
+        blank = ~np.isfinite(numbers)
+        integral = types.is_integer_dtype(series) or (
+            downcast_ints and bool(np.all(np.mod(numbers[~blank], 1) == 0))
+        )
+        if integral:
+            # numpy int64 → Python int (JSON serileştirilebilir)
+            out = np.where(blank, 0, numbers).astype('int64').astype(object)
+        else:
+            out = numbers.astype(object)
+        if stringify:
+            source = out if integral and not types.is_integer_dtype(series) else series.to_numpy(dtype=object)
+            out = pd.Series(source, dtype=object).astype(str).to_numpy(dtype=object)
+
+    else:
+        blank = series.isna().to_numpy()
+        if stringify:
+            # copy: object/str sütunlarında dizi DataFrame'in kendi verisi olabilir
+            out = series.astype(str).to_numpy(dtype=object, copy=True)
+        else:
+            out = np.array([_to_sheet_scalar(value) for value in series.to_numpy(dtype=object)], dtype=object)
+
+    out[blank] = ''
+    if is_text:
+        filled = ~blank
+        out[filled] = "'" + out[filled]
+    return out
+
+
+def _to_sheet_scalar(value: Any) -> Any:
+    """object sütunlarındaki tarih/Decimal/numpy değerlerini JSON uyumlu hale getir"""
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, 'strftime'):
+        return str(value)
+    if hasattr(value, 'item'):
+        # numpy skaler
+        return value.item()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+# ============================================================================
+# ARTIMLI (DIFF TABANLI) WORKSHEET YAZIMI
+# ============================================================================
+
+@dataclass
+class WorksheetDiff:
+    """Mevcut ve hedef worksheet içeriği arasındaki satır bazlı fark"""
+    # ('insert' | 'delete', başlangıç, bitiş) — 0 tabanlı sheet satır indeksleri,
+    # alttan üste sıralı (her istek üsttekilerin indeksini bozmaz)
+    row_ops: List[Tuple[str, int, int]]
+    # (1 tabanlı başlangıç satırı, satırlar) — yapısal değişikliklerden sonraki koordinatlar
+    updates: List[Tuple[int, List[List]]]
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.row_ops and not self.updates
+
+    @property
+    def cells(self) -> int:
+        """Yazılacak hücre sayısı"""
+        return sum(len(row) for _, rows in self.updates for row in rows)
+
+    def requests(self, sheet_id: int) -> List[Dict[str, Any]]:
+        """row_ops'u spreadsheets.batchUpdate insert/deleteDimension isteklerine çevir"""
+        requests = []
+        for op, start, end in self.row_ops:
+            dimension_range = {
+                'sheetId': sheet_id, 'dimension': 'ROWS',
+                'startIndex': start, 'endIndex': end,
+            }
+            if op == 'insert':
+                requests.append({'insertDimension': {'range': dimension_range, 'inheritFromBefore': True}})
+            else:
+                requests.append({'deleteDimension': {'range': dimension_range}})
+        return requests
+
+
+def _normalize_cell(value: Any, user_entered: bool) -> str:
+    """Hücreyi karşılaştırma için metne indir (okunan ve yazılacak değer aynı biçime gelir)"""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return str(value).upper()
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    if isinstance(value, str) and user_entered and value.startswith("'"):
+        # USER_ENTERED'da baştaki apostrof hücreye yazılmaz
+        return value[1:]
+    return str(value)
+
+
+def plan_worksheet_diff(
+    current: List[List],
+    target: List[List],
+    key_column: Optional[str] = None,
+    user_entered: bool = False
+) -> Optional[WorksheetDiff]:
+    """
+    Mevcut worksheet içeriğini hedefe dönüştüren en küçük satır farkını hesapla
+
+    Satırlar anahtar sütununa (yoksa tüm satır içeriğine) göre hizalanır; araya
+    eklenen/silinen satırlar insert/deleteDimension ile kaydırılır, böylece
+    değişmeyen satırlar yeniden yazılmaz ve hedef satır sırası korunur.
+
+    Args:
+        current: Worksheet'in mevcut içeriği (ilk satır başlık)
+        target: Yazılacak içerik (ilk satır başlık)
+        key_column: Satırları eşleştiren sütun ('Cari Kodu' gibi; None: tüm satır)
+        user_entered: Hedef USER_ENTERED ile yazılacaksa True
+
+    Returns:
+        WorksheetDiff veya None (başlıklar farklı/sayfa boş: tam yazım gerekir)
+    """
+    from difflib import SequenceMatcher
+
+    if not current or not target or not target[0]:
+        return None
+
+    header = [_normalize_cell(value, user_entered) for value in target[0]]
+    width = len(header)
+    current_header = [_normalize_cell(value, False) for value in current[0]]
+    if current_header[:width] != header or any(current_header[width:]):
+        return None
+
+    def normalize(row: List) -> Tuple[str, ...]:
+        cells = [_normalize_cell(value, user_entered) for value in row[:width]]
+        return tuple(cells + [''] * (width - len(cells)))
+
+    current_rows = [normalize(row) for row in current[1:]]
+    # Sayfanın sonundaki boş satırlar veri değildir
+    while current_rows and not any(current_rows[-1]):
+        current_rows.pop()
+    target_rows = [normalize(row) for row in target[1:]]
+
+    if key_column is None:
+        current_keys, target_keys = current_rows, target_rows
+    else:
+        if key_column not in target[0]:
+            raise ValueError(f"Anahtar sütun bulunamadı: {key_column}")
+        position = list(target[0]).index(key_column)
+        current_keys = [row[position] for row in current_rows]
+        target_keys = [row[position] for row in target_rows]
+
+    matcher = SequenceMatcher(None, current_keys, target_keys, autojunk=False)
+    row_ops = []
+    dirty = []
+    inserted = updated = deleted = 0
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            for offset in range(i2 - i1):
+                if current_rows[i1 + offset] != target_rows[j1 + offset]:
+                    dirty.append(j1 + offset)
+                    updated += 1
+            continue
+
+        overlap = min(i2 - i1, j2 - j1)
+        dirty.extend(range(j1, j2))
+        updated += overlap
+        # Sheet indeksleri: başlık 0. satır, veri satırı i → i + 1
+        if i2 - i1 > overlap:
+            row_ops.append(('delete', i1 + overlap + 1, i2 + 1))
+            deleted += i2 - i1 - overlap
+        elif j2 - j1 > overlap:
+            row_ops.append(('insert', i1 + overlap + 1, i1 + 1 + (j2 - j1)))
+            inserted += j2 - j1 - overlap
+
+    # Ardışık kirli satırları tek aralıkta topla (hedef koordinatları)
+    updates = []
+    for index in dirty:
+        if updates and updates[-1][0] + len(updates[-1][1]) == index + 2:
+            updates[-1][1].append(target[index + 1])
+        else:
+            updates.append((index + 2, [target[index + 1]]))
+
+    return WorksheetDiff(
+        row_ops=list(reversed(row_ops)), updates=updates,
+        inserted=inserted, updated=updated, deleted=deleted
+    )
+
+
+def values_fingerprint(values: List[List], value_input_option: str = 'RAW') -> str:
+    """Yazılacak 2D listenin kararlı içerik özeti (sha256)"""
+    payload = json.dumps(
+        [value_input_option, values], ensure_ascii=False, default=str, separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def plan_upload_chunks(
+    values: List[List],
+    max_cells: int,
+    max_bytes: int
+) -> List[Tuple[int, int]]:
+    """
+    Satırları hücre sayısı ve tahmini JSON boyutuna göre parçalara böl
+
+    Args:
+        values: Yüklenecek 2D liste
+        max_cells: Parça başına azami hücre
+        max_bytes: Parça başına azami tahmini payload boyutu
+
+    Returns:
+        [(başlangıç, bitiş), ...] satır indeksleri (bitiş hariç), çakışmasız
+    """
+    chunks = []
+    start, cells, size = 0, 0, 0
+    for index, row in enumerate(values):
+        row_cells = max(len(row), 1)
+        row_bytes = len(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8'))
+        if index > start and (cells + row_cells > max_cells or size + row_bytes > max_bytes):
+            chunks.append((start, index))
+            start, cells, size = index, 0, 0
+        cells += row_cells
+        size += row_bytes
+    if start < len(values):
+        chunks.append((start, len(values)))
+    return chunks
+
+
 def test_connection():
     """Service Account bağlantısını test et"""
     try:
@@ -501,3 +3475,4 @@ def test_connection():
 if __name__ == "__main__":
     # Test
     test_connection()
+
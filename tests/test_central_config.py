@@ -0,0 +1,311 @@
+"""
+central_config saf yardımcı fonksiyonlarının tablo tabanlı testleri
+
+Ağ, Google Sheets veya SQL Server gerektirmez:
+    python -m unittest discover tests
+"""
+
+import math
+import os
+import sys
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from central_config import (  # noqa: E402
+    SettingSpec,
+    SettingsRegistry,
+    apply_sheet_schema,
+    build_fallback_settings,
+    dataframe_to_sheet_values,
+    plan_upload_chunks,
+    plan_worksheet_diff,
+    values_fingerprint,
+)
+
+
+# ============================================================================
+# DATAFRAME → SHEETS SERIALIZER
+# ============================================================================
+
+class DataFrameToSheetValuesTest(unittest.TestCase):
+
+    def test_blank_values(self):
+        """NaN, None, NaT ve ±inf hücreler '' yazılır"""
+        cases = [
+            ('float NaN', pd.DataFrame({'x': [np.nan, 1.5]}), [[''], [1.5]]),
+            ('inf', pd.DataFrame({'x': [np.inf, -np.inf, 2.5]}), [[''], [''], [2.5]]),
+            ('None', pd.DataFrame({'x': ['a', None]}), [['a'], ['']]),
+            ('NaT', pd.DataFrame({'x': pd.to_datetime(['2024-01-02', None])}), [['2024-01-02'], ['']]),
+            ('Int64 NA', pd.DataFrame({'x': pd.array([1, None], dtype='Int64')}), [[1], ['']]),
+        ]
+        for name, df, expected in cases:
+            with self.subTest(name):
+                self.assertEqual(dataframe_to_sheet_values(df, include_header=False), expected)
+
+    def test_text_columns_get_apostrophe(self):
+        """Metin sütunları apostrofla başlar, boş hücrelere apostrof eklenmez"""
+        cases = [
+            ('kod metni', ['120.01', None, '00123'], ["'120.01", '', "'00123"]),
+            ('büyük tam sayı', [123456789012, 5], ["'123456789012", "'5"]),
+            ('NaN içeren float', [4.0, np.nan], ["'4.0", '']),
+        ]
+        for name, column, expected in cases:
+            with self.subTest(name):
+                df = pd.DataFrame({'Cari Kodu': column, 'Diğer': range(len(column))})
+                rows = dataframe_to_sheet_values(df, text_columns=('Cari Kodu',), include_header=False)
+                self.assertEqual([row[0] for row in rows], expected)
+                # Metin sütunu olmayan sütunlar apostrof almaz
+                self.assertEqual([row[1] for row in rows], list(range(len(column))))
+
+    def test_options(self):
+        df = pd.DataFrame({
+            'Adet': [1.0, 2.0, np.nan],
+            'Tarih': pd.to_datetime(['2024-01-02', None, '2024-03-04']),
+            'Ok': [True, False, True],
+        })
+        cases = [
+            ('varsayılan', {}, [[1.0, '2024-01-02', True], [2.0, '', False], ['', '2024-03-04', True]]),
+            ('downcast_ints + date_format', {'downcast_ints': True, 'date_format': '%d.%m.%Y'},
+             [[1, '02.01.2024', True], [2, '', False], ['', '04.03.2024', True]]),
+            ('as_text', {'as_text': True},
+             [['1.0', '2024-01-02', 'True'], ['2.0', '', 'False'], ['', '2024-03-04', 'True']]),
+        ]
+        for name, options, expected in cases:
+            with self.subTest(name):
+                self.assertEqual(dataframe_to_sheet_values(df, include_header=False, **options), expected)
+
+    def test_downcast_keeps_fractions(self):
+        df = pd.DataFrame({'x': [1.0, 2.5]})
+        self.assertEqual(dataframe_to_sheet_values(df, downcast_ints=True, include_header=False), [[1.0], [2.5]])
+
+    def test_header_and_python_types(self):
+        df = pd.DataFrame({'a': np.array([1, 2], dtype='int64'), 'b': ['x', 'y']})
+        values = dataframe_to_sheet_values(df)
+        self.assertEqual(values, [['a', 'b'], [1, 'x'], [2, 'y']])
+        # numpy skalerleri JSON'a yazılabilir Python tiplerine çevrilir
+        self.assertIs(type(values[1][0]), int)
+
+    def test_input_not_modified(self):
+        for dtype in (object, 'str'):
+            with self.subTest(dtype=dtype):
+                df = pd.DataFrame({'Cari Kodu': pd.Series(['120.01', None], dtype=dtype), 'n': [1.0, np.nan]})
+                before = df.copy()
+                dataframe_to_sheet_values(df, text_columns=('Cari Kodu',))
+                dataframe_to_sheet_values(df, as_text=True)
+                pd.testing.assert_frame_equal(df, before)
+
+    def test_empty_frame(self):
+        self.assertEqual(dataframe_to_sheet_values(pd.DataFrame()), [[]])
+        self.assertEqual(dataframe_to_sheet_values(pd.DataFrame({'a': []})), [['a']])
+
+
+# ============================================================================
+# WORKSHEET ŞEMASI
+# ============================================================================
+
+class ApplySheetSchemaTest(unittest.TestCase):
+
+    def test_column_types(self):
+        df = pd.DataFrame({
+            'i': ['3', 4.0, ''],
+            'd': ['1.5', 'x', 2],
+            't': [45292, '2024-01-05', ''],
+            'c': ['a', '', 'a'],
+            'k': [123.0, '00123', 7.5],
+        })
+        typed = apply_sheet_schema(df, {'i': 'int', 'd': 'decimal', 't': 'date', 'c': 'category', 'k': 'text'})
+
+        self.assertEqual(str(typed['i'].dtype), 'Int64')
+        self.assertEqual(typed['i'].tolist()[:2], [3, 4])
+        self.assertTrue(pd.isna(typed['i'].iloc[2]))
+
+        self.assertEqual(typed['d'].iloc[0], 1.5)
+        self.assertTrue(math.isnan(typed['d'].iloc[1]))
+
+        # Seri numarası (1899-12-30 başlangıçlı) ve tarih metni
+        self.assertEqual(typed['t'].iloc[0], pd.Timestamp('2024-01-01'))
+        self.assertEqual(typed['t'].iloc[1], pd.Timestamp('2024-01-05'))
+        self.assertTrue(pd.isna(typed['t'].iloc[2]))
+
+        self.assertEqual(str(typed['c'].dtype), 'category')
+        self.assertTrue(pd.isna(typed['c'].iloc[1]))
+
+        # Tam sayı değerli sayılarda '.0' oluşmaz, metin kodlar olduğu gibi kalır
+        self.assertEqual(typed['k'].tolist(), ['123', '00123', '7.5'])
+
+    def test_default_type_and_copy(self):
+        df = pd.DataFrame({'a': [1.0], 'b': ['2']})
+        typed = apply_sheet_schema(df, {'*': 'text'})
+        self.assertEqual(typed.to_dict('list'), {'a': ['1'], 'b': ['2']})
+        self.assertEqual(df['a'].iloc[0], 1.0)
+
+    def test_invalid_type(self):
+        with self.assertRaises(ValueError):
+            apply_sheet_schema(pd.DataFrame({'a': [1]}), {'a': 'money'})
+
+
+# ============================================================================
+# ARTIMLI WORKSHEET YAZIMI
+# ============================================================================
+
+class PlanWorksheetDiffTest(unittest.TestCase):
+
+    def test_full_write_required(self):
+        cases = [
+            ('boş sayfa', [], [['a'], ['1']]),
+            ('boş hedef', [['a']], []),
+            ('başlık değişti', [['a', 'b']], [['a', 'c']]),
+            ('fazla başlık', [['a', 'b']], [['a']]),
+        ]
+        for name, current, target in cases:
+            with self.subTest(name):
+                self.assertIsNone(plan_worksheet_diff(current, target))
+
+    def test_row_changes(self):
+        header = ['kod', 'ad']
+        cases = [
+            ('araya ekleme',
+             [['1', 'x'], ['2', 'y']], [['1', 'x'], ['3', 'z'], ['2', 'y']],
+             [('insert', 2, 3)], [(3, [['3', 'z']])], (1, 0, 0)),
+            ('silme',
+             [['1', 'x'], ['2', 'y'], ['3', 'z']], [['1', 'x'], ['3', 'z']],
+             [('delete', 2, 3)], [], (0, 0, 1)),
+            ('güncelleme',
+             [['1', 'x'], ['2', 'y']], [['1', 'x'], ['2', 'w']],
+             [], [(3, [['2', 'w']])], (0, 1, 0)),
+            ('sondaki boş satırlar veri değil',
+             [['1', 'x'], ['', '']], [['1', 'x']],
+             [], [], (0, 0, 0)),
+        ]
+        for name, current, target, row_ops, updates, counts in cases:
+            with self.subTest(name):
+                diff = plan_worksheet_diff([header] + current, [header] + target, key_column='kod')
+                self.assertEqual(diff.row_ops, row_ops)
+                self.assertEqual(diff.updates, updates)
+                self.assertEqual((diff.inserted, diff.updated, diff.deleted), counts)
+
+    def test_equivalent_cells_are_unchanged(self):
+        cases = [
+            ('float/metin', [['a'], [1.0]], [['a'], ['1']], False),
+            ('None/boş', [['a', 'b'], ['x', None]], [['a', 'b'], ['x', '']], False),
+            ('bool', [['a'], ['TRUE']], [['a'], [True]], False),
+            ('USER_ENTERED apostrofu', [['a'], ['00123']], [['a'], ["'00123"]], True),
+        ]
+        for name, current, target, user_entered in cases:
+            with self.subTest(name):
+                self.assertTrue(plan_worksheet_diff(current, target, user_entered=user_entered).is_empty)
+
+    def test_apostrophe_counts_in_raw(self):
+        diff = plan_worksheet_diff([['a'], ['00123']], [['a'], ["'00123"]])
+        self.assertEqual(diff.updated + diff.inserted, 1)
+
+    def test_requests(self):
+        diff = plan_worksheet_diff([['k'], ['1'], ['2']], [['k'], ['2']], key_column='k')
+        self.assertEqual(diff.requests(7), [{'deleteDimension': {'range': {
+            'sheetId': 7, 'dimension': 'ROWS', 'startIndex': 1, 'endIndex': 2,
+        }}}])
+
+    def test_unknown_key_column(self):
+        with self.assertRaises(ValueError):
+            plan_worksheet_diff([['a'], ['1']], [['a'], ['2']], key_column='yok')
+
+
+class ValuesFingerprintTest(unittest.TestCase):
+
+    def test_fingerprint(self):
+        base = values_fingerprint([['a'], [1]])
+        cases = [
+            ('aynı içerik', values_fingerprint([['a'], [1]]), True),
+            ('farklı değer', values_fingerprint([['a'], [2]]), False),
+            ('farklı tip', values_fingerprint([['a'], ['1']]), False),
+            ('farklı input option', values_fingerprint([['a'], [1]], 'USER_ENTERED'), False),
+        ]
+        for name, other, same in cases:
+            with self.subTest(name):
+                self.assertEqual(base == other, same)
+
+    def test_non_json_values(self):
+        # Tarih gibi JSON dışı değerler str ile özetlenir
+        self.assertEqual(len(values_fingerprint([[datetime(2024, 1, 2)]])), 64)
+
+
+class PlanUploadChunksTest(unittest.TestCase):
+
+    def test_chunks(self):
+        cases = [
+            ('hücre sınırı', [[1, 2]] * 5, 4, 10 ** 6, [(0, 2), (2, 4), (4, 5)]),
+            ('boyut sınırı', [['x' * 10]] * 3, 100, 20, [(0, 1), (1, 2), (2, 3)]),
+            ('tek parça', [[1]] * 3, 100, 10 ** 6, [(0, 3)]),
+            ('sınırdan büyük tek satır bölünmez', [[1, 2, 3, 4, 5]], 2, 100, [(0, 1)]),
+            ('boş veri', [], 5, 5, []),
+        ]
+        for name, values, max_cells, max_bytes, expected in cases:
+            with self.subTest(name):
+                chunks = plan_upload_chunks(values, max_cells, max_bytes)
+                self.assertEqual(chunks, expected)
+                # Parçalar çakışmaz ve tüm satırları kapsar
+                covered = [index for start, end in chunks for index in range(start, end)]
+                self.assertEqual(covered, list(range(len(values))))
+
+
+# ============================================================================
+# TİPLİ AYARLAR
+# ============================================================================
+
+class SettingsRegistryParseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = SettingsRegistry(manager=None)
+
+    def test_parse(self):
+        cases = [
+            ('float virgül', SettingSpec('KDV', 'float', 1.10), '1,20', 1.20),
+            ('float nokta', SettingSpec('KDV', 'float', 1.10), '1.05', 1.05),
+            ('float hatalı', SettingSpec('KDV', 'float', 1.10), 'abc', 1.10),
+            ('float boş', SettingSpec('KDV', 'float', 1.10), '', 1.10),
+            ('int', SettingSpec('N', 'int', None), '600', 600),
+            ('int ondalıklı', SettingSpec('N', 'int', None), '2,0', 2),
+            ('int boş', SettingSpec('N', 'int', None), '', None),
+            ('date', SettingSpec('D', 'date', None, '%d.%m.%Y'), '01.09.2023', datetime(2023, 9, 1)),
+            ('date hatalı', SettingSpec('D', 'date', None, '%Y-%m-%d'), '01.09.2023', None),
+            ('url', SettingSpec('U', 'url'), 'https://x', 'https://x'),
+            ('url olmayan değer döner', SettingSpec('U', 'url'), 'x.com', 'x.com'),
+            ('secret', SettingSpec('S', 'secret'), 'gizli', 'gizli'),
+            ('str boş', SettingSpec('S'), '', ''),
+        ]
+        for name, spec, raw, expected in cases:
+            with self.subTest(name):
+                self.assertEqual(self.registry._parse(spec, raw), expected)
+
+
+class BuildFallbackSettingsTest(unittest.TestCase):
+
+    def test_fallback(self):
+        header = ['App Name', 'Key', 'Value', 'Description']
+        cases = [
+            ('app satırları app_name olmadan bulunur',
+             [header, ['Global', 'SQL_SERVER', '1.2.3.4', ''], ['BekleyenAPI', 'base_url', 'https://x', '']],
+             {'SQL_SERVER': '1.2.3.4', 'base_url': 'https://x'}),
+            ('eski düzen A/B satırı',
+             [header, ['Global', 'SQL_SERVER', '1', ''], ['KDV', '1,10']],
+             {'SQL_SERVER': '1', 'KDV': '1,10'}),
+            ('App Name → Key çifti üretilmez',
+             [header, ['Global', 'BOS', '', ''], ['Stok', 'X', '1', ''], ['Stok', 'Y', '', '']],
+             {'X': '1'}),
+            ('başlıksız sayfa tamamen eski düzen',
+             [['KDV', '1.2'], ['sip_tarih', '2023-09-01']],
+             {'KDV': '1.2', 'sip_tarih': '2023-09-01'}),
+            ('boş sayfa', [], {}),
+        ]
+        for name, values, expected in cases:
+            with self.subTest(name):
+                self.assertEqual(build_fallback_settings(values), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
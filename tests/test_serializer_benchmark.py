@@ -0,0 +1,104 @@
+"""
+dataframe_to_sheet_values ile eski satır satır (iterrows) dönüşümün hız karşılaştırması
+
+Varsayılan test çalıştırmasında atlanır (birkaç saniye sürer):
+    PRG_BENCHMARK=1 python -m unittest tests.test_serializer_benchmark
+    python tests/test_serializer_benchmark.py
+
+Ölçüm (50.000 satır): vektörel 0.077 sn, iterrows 1.99 sn (~25x).
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from central_config import dataframe_to_sheet_values  # noqa: E402
+
+# Ölçülen satır sayısı ve beklenen asgari hızlanma
+BENCHMARK_ROWS = 50_000
+MIN_SPEEDUP = 10
+
+TEXT_COLUMNS = ('Cari Kodu', 'Kalem No', 'Telefon')
+
+
+def make_frame(rows: int = BENCHMARK_ROWS) -> pd.DataFrame:
+    """Sevkiyat çıktısına benzer karışık tipli DataFrame (NaN/NaT içerir)"""
+    rng = np.random.default_rng(42)
+    amounts = rng.normal(1000, 250, rows)
+    amounts[::17] = np.nan
+    dates = pd.Series(pd.date_range('2024-01-01', periods=rows, freq='min'))
+    dates[::23] = pd.NaT
+    return pd.DataFrame({
+        'Cari Kodu': [f"120.{i:05d}" for i in range(rows)],
+        'Cari Adı': [f"Müşteri {i % 997}" for i in range(rows)],
+        'Kalem No': rng.integers(10 ** 11, 10 ** 12, rows),
+        'Telefon': [None if i % 11 == 0 else f"0532{i:07d}" for i in range(rows)],
+        'Tutar': amounts,
+        'Adet': rng.integers(1, 50, rows).astype('float64'),
+        'Tarih': dates,
+    })
+
+
+def iterrows_to_sheet_values(data: pd.DataFrame) -> list:
+    """Modüllerdeki eski hücre hücre dönüşüm (Sevkiyat._prepare_data_for_sheets)"""
+    values = [data.columns.tolist()]
+    text_indexes = {data.columns.get_loc(column) for column in TEXT_COLUMNS if column in data.columns}
+    for _, row in data.iterrows():
+        row_values = []
+        for col_index, value in enumerate(row):
+            if pd.isna(value) or value is None:
+                row_values.append('')
+            elif col_index in text_indexes:
+                row_values.append(f"'{str(value)}")
+            elif isinstance(value, pd.Timestamp):
+                row_values.append(str(value))
+            elif isinstance(value, float) and np.isinf(value):
+                row_values.append('')
+            else:
+                row_values.append(value)
+        values.append(row_values)
+    return values
+
+
+def measure(rows: int = BENCHMARK_ROWS):
+    """(vektörel süre, iterrows süresi) saniye"""
+    df = make_frame(rows)
+
+    start = time.perf_counter()
+    dataframe_to_sheet_values(df, text_columns=TEXT_COLUMNS)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    iterrows_to_sheet_values(df)
+    legacy = time.perf_counter() - start
+    return vectorized, legacy
+
+
+@unittest.skipUnless(os.environ.get('PRG_BENCHMARK'), "PRG_BENCHMARK=1 ile çalıştırın")
+class SerializerBenchmarkTest(unittest.TestCase):
+
+    def test_same_output(self):
+        df = make_frame(500)
+        self.assertEqual(
+            dataframe_to_sheet_values(df, text_columns=TEXT_COLUMNS),
+            iterrows_to_sheet_values(df)
+        )
+
+    def test_speedup(self):
+        vectorized, legacy = measure()
+        self.assertGreaterEqual(
+            legacy / vectorized, MIN_SPEEDUP,
+            f"vektörel {vectorized:.3f} sn, iterrows {legacy:.3f} sn"
+        )
+
+
+if __name__ == '__main__':
+    vectorized, legacy = measure()
+    print(f"{BENCHMARK_ROWS} satır: vektörel {vectorized:.3f} sn, iterrows {legacy:.3f} sn "
+          f"({legacy / vectorized:.1f}x)")